@@ -1,5 +1,11 @@
 from fastapi import APIRouter
 from backend.app.apis.v1 import infer as infer_v1
+from backend.app.apis.v1 import health as health_v1
+from backend.app.apis.v1 import metrics as metrics_v1
+from backend.app.apis.v1 import jobs as jobs_v1
 
 api_router = APIRouter()
-api_router.include_router(infer_v1.router)
\ No newline at end of file
+api_router.include_router(infer_v1.router)
+api_router.include_router(health_v1.router)
+api_router.include_router(metrics_v1.router)
+api_router.include_router(jobs_v1.router)
\ No newline at end of file
@@ -0,0 +1,57 @@
+from fastapi import APIRouter
+
+from backend.app.clients import job_queue
+from backend.app.clients.embed_cache import embed_batch_stats, embed_cache_stats
+from backend.app.clients.result_cache import result_cache_stats
+from backend.app.clients.single_flight import single_flight
+from backend.app.db import db_pool_stats
+from backend.app.services.company_directory import company_directory
+from backend.app.services.company_facts import company_facts_cache_stats
+from backend.app.services.company_snapshot import company_snapshot
+
+router = APIRouter(prefix="/health", tags=["Health"])
+
+
+@router.get("/db-pool", summary="DB 커넥션 풀 상태")
+def db_pool():
+    return db_pool_stats()
+
+
+@router.get("/result-cache", summary="추론 결과 캐시 hit/miss 카운터")
+def result_cache():
+    return result_cache_stats()
+
+
+@router.get("/embed-cache", summary="워커 로컬 임베딩 LRU 상태")
+def embed_cache():
+    return embed_cache_stats()
+
+
+@router.get("/embed-batch", summary="임베딩 요청 배치 크기 분포")
+def embed_batch():
+    return embed_batch_stats()
+
+
+@router.get("/single-flight", summary="동시 호출 병합 통계")
+def single_flight_stats():
+    return single_flight.stats()
+
+
+@router.get("/company-directory", summary="회사명 해석 인덱스 상태")
+def company_directory_stats():
+    return company_directory.stats()
+
+
+@router.get("/company-facts", summary="재직 기간 회사 사실 로컬 캐시 상태")
+def company_facts_cache():
+    return company_facts_cache_stats()
+
+
+@router.get("/company-snapshot", summary="회사 요약 검색 스냅샷 버전·크기")
+def company_snapshot_stats():
+    return company_snapshot.stats()
+
+
+@router.get("/jobs", summary="작업 큐 길이")
+def jobs():
+    return job_queue.depths()
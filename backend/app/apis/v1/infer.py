@@ -1,14 +1,24 @@
 import json
+import time
+from typing import AsyncIterator
 
-from fastapi import APIRouter, Body
+from fastapi import APIRouter, Body, Header, Response
+from fastapi.responses import StreamingResponse
 from pathlib import Path
 
-from backend.app.db import get_db_connection
+from backend.app.clients import result_cache
+from backend.app.configs import settings
+from backend.app.db import get_db_connection, get_async_db_connection
 from backend.app.models.candidate import Candidate
-from backend.app.models.response import InferenceResult
-from backend.app.services.pipeline import preprocess, retrieve_context, build_prompt, call_llm, postprocess, extract_company_names_from_text
+from backend.app.models.response import InferenceResult, BatchInferenceResult
+from backend.app.services import async_pipeline
+from backend.app.services.tag_stream import TagStreamParser
+from backend.app.services.pipeline import (
+    RequestContext, retrieve_context, call_llm, postprocess, infer_batch, result_cache_key, load_company_facts,
+)
 from backend.app.exceptions import AppError
 from backend.app.error_codes import Err
+from backend.app.utils import metrics, tracing
 
 router = APIRouter(prefix="/infer", tags=["Inference"])
 
@@ -16,18 +26,158 @@ BASE_DIR = Path(__file__).resolve().parents[2]   # 0: v1, 1: apis, 2: app
 EXAMPLE_PATH = BASE_DIR / "examples" / "sample_candidate.json"
 sample_candidate = json.loads(EXAMPLE_PATH.read_text(encoding="utf-8"))
 
+CACHE_STATUS_HEADER = "X-Cache-Status"
+
+
+def _mark_cache_status(response: Response, status: str) -> None:
+    response.headers[CACHE_STATUS_HEADER] = status
+    tracing.set_attributes(**{"cache.result": status})
+
+
+def _use_result_cache(cache_control: str | None) -> bool:
+    return settings.result_cache_enabled and "no-cache" not in (cache_control or "")
+
+
 @router.post("", response_model=InferenceResult, summary="LLM 태깅 추론")
-def infer(candidate: Candidate = Body(example=sample_candidate)):
-    text = preprocess(candidate)
-    company_names = extract_company_names_from_text(candidate)
+def infer(
+    response: Response,
+    candidate: Candidate = Body(example=sample_candidate),
+    cache_control: str | None = Header(None),
+):
+    use_cache = _use_result_cache(cache_control)
+    req = RequestContext(candidate)
+    if use_cache and (cached := result_cache.get_cached_result(req.cache_key)):
+        _mark_cache_status(response, result_cache.HIT)
+        return cached
+
     with get_db_connection() as conn:
-        contexts = retrieve_context(text, company_names, conn) or ["(관련 맥락 없음)"]
-    if not contexts:
-        raise AppError(Err.NO_CONTEXT, "유효한 컨텍스트를 찾지 못했습니다.")
-    prompt = build_prompt(candidate, contexts)
+        load_company_facts([req], conn)
+        if req.needs_llm:
+            req.contexts = retrieve_context(req.text, req.company_names, conn) or ["(관련 맥락 없음)"]
+    if req.needs_llm:
+        if not req.contexts:
+            raise AppError(Err.NO_CONTEXT, "유효한 컨텍스트를 찾지 못했습니다.")
+        try:
+            raw = call_llm(req.build_prompt())
+        except Exception as e:
+            raise AppError(Err.LLM_ERROR, f"LLM 호출 실패: {e}")
+        result = req.merge(postprocess(raw))
+    else:
+        result = req.merge(None)
+    if use_cache:
+        result_cache.set_cached_result(req.cache_key, result)
+    _mark_cache_status(response, result_cache.MISS if use_cache else result_cache.BYPASS)
+    return result
+
+@router.post("/async", response_model=InferenceResult, summary="LLM 태깅 추론 (비동기 I/O)")
+async def infer_async(
+    response: Response,
+    candidate: Candidate = Body(example=sample_candidate),
+    cache_control: str | None = Header(None),
+):
+    """
+    /infer 와 동일한 결과를 반환하지만, 대기 중에 스레드풀 워커를 점유하지 않습니다.
+    (AsyncOpenAI + asyncpg + redis.asyncio)
+    """
+    use_cache = _use_result_cache(cache_control)
+    req = RequestContext(candidate)
+    if use_cache and (cached := await result_cache.get_cached_result_async(req.cache_key)):
+        _mark_cache_status(response, result_cache.HIT)
+        return cached
+
+    async with get_async_db_connection() as conn:
+        await async_pipeline.load_company_facts(req, conn)
+        if req.needs_llm:
+            req.contexts = await async_pipeline.retrieve_context(req.text, req.company_names, conn) or ["(관련 맥락 없음)"]
+    if req.needs_llm:
+        raw = await async_pipeline.call_llm(req.build_prompt())
+        result = req.merge(postprocess(raw))
+    else:
+        result = req.merge(None)
+    if use_cache:
+        await result_cache.set_cached_result_async(req.cache_key, result)
+    _mark_cache_status(response, result_cache.MISS if use_cache else result_cache.BYPASS)
+    return result
+
+
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+async def _replay_events(result: InferenceResult) -> AsyncIterator[str]:
+    for tag in result.tags:
+        yield _sse("tag", tag.model_dump())
+    yield _sse("result", result.model_dump())
+
+
+async def _stream_events(req: RequestContext, use_cache: bool) -> AsyncIterator[str]:
+    """규칙 태그를 먼저 보내고, 남은 태그가 있으면 LLM 응답을 이어서 흘려보냄"""
+    started = time.perf_counter()
+    first_tag = True
+    parser = TagStreamParser()
     try:
-        raw = call_llm(prompt)
+        for tag in req.rules.tags:
+            yield _sse("tag", tag.model_dump())
+        if req.needs_llm:
+            async for delta in async_pipeline.call_llm_stream(req.prompt):
+                for tag in parser.feed(delta):
+                    if not req.accepts(tag.tag):
+                        continue
+                    if first_tag:
+                        first_tag = False
+                        metrics.stage_duration.labels(stage="infer_stream.first_tag").observe(time.perf_counter() - started)
+                    yield _sse("tag", tag.model_dump())
+        result = req.merge(postprocess(parser.text) if req.needs_llm else None)
+    except AppError as e:
+        yield _sse("error", e.detail)
+        return
     except Exception as e:
-        raise AppError(Err.LLM_ERROR, f"LLM 호출 실패: {e}")
+        yield _sse("error", {"code": Err.LLM_ERROR.name, "message": f"LLM 응답 처리 실패: {e}"})
+        return
+
+    if use_cache:
+        await result_cache.set_cached_result_async(req.cache_key, result)
+    yield _sse("result", result.model_dump())
+
+
+@router.post("/stream", summary="LLM 태깅 추론 (SSE 스트리밍)")
+async def infer_stream(
+    candidate: Candidate = Body(example=sample_candidate),
+    cache_control: str | None = Header(None),
+):
+    """
+    /infer/async 와 같은 추론을 text/event-stream 으로 보냅니다.
+    - `event: tag` : ExperienceTag 하나 (규칙 태그는 바로, LLM 태그는 태그 객체를 닫는 즉시)
+    - `event: result` : 전체 InferenceResult (마지막)
+    - `event: error` : {code, message} - 스트리밍 도중 실패 시 (이전 단계 실패는 일반 에러 응답)
+    """
+    use_cache = _use_result_cache(cache_control)
+    req = RequestContext(candidate)
+    headers = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}   # nginx 버퍼링 끄기
+    if use_cache and (cached := await result_cache.get_cached_result_async(req.cache_key)):
+        headers[CACHE_STATUS_HEADER] = result_cache.HIT
+        return StreamingResponse(_replay_events(cached), media_type="text/event-stream", headers=headers)
+
+    async with get_async_db_connection() as conn:
+        await async_pipeline.load_company_facts(req, conn)
+        if req.needs_llm:
+            req.contexts = await async_pipeline.retrieve_context(req.text, req.company_names, conn) or ["(관련 맥락 없음)"]
+    if req.needs_llm:
+        req.build_prompt()
+
+    headers[CACHE_STATUS_HEADER] = result_cache.MISS if use_cache else result_cache.BYPASS
+    return StreamingResponse(_stream_events(req, use_cache), media_type="text/event-stream", headers=headers)
+
+
+@router.post("/batch", response_model=BatchInferenceResult, summary="LLM 태깅 배치 추론")
+def infer_batch_endpoint(candidates: list[Candidate] = Body(example=[sample_candidate])):
+    if len(candidates) > settings.batch_max_size:
+        raise AppError(Err.BATCH_TOO_LARGE, f"배치 크기는 최대 {settings.batch_max_size}명입니다.")
+    with get_db_connection() as conn:
+        results = infer_batch(candidates, conn)
+    return BatchInferenceResult(results=results)
+
 
-    return postprocess(raw)
\ No newline at end of file
+@router.post("/cache/invalidate", summary="지원자 추론 결과 캐시 무효화")
+def invalidate_cache(candidate: Candidate = Body(example=sample_candidate)):
+    return {"invalidated": result_cache.invalidate_result(result_cache_key(candidate))}
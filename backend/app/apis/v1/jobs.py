@@ -0,0 +1,65 @@
+from fastapi import APIRouter, Body, status
+
+from backend.app.apis.v1.infer import sample_candidate
+from backend.app.clients import job_queue
+from backend.app.configs import settings
+from backend.app.models.candidate import Candidate
+from backend.app.models.job import JobInfo, JobList, JobResult
+from backend.app.exceptions import AppError
+from backend.app.error_codes import Err
+
+router = APIRouter(prefix="/jobs", tags=["Jobs"])
+
+
+def _submit(candidates: list[Candidate]) -> list[JobInfo]:
+    try:
+        return job_queue.submit(candidates)
+    except Exception as e:
+        raise AppError(Err.QUEUE_ERROR, f"작업 큐 연결 실패: {e}")
+
+
+def _get(job_id: str):
+    try:
+        found = job_queue.get_job(job_id)
+    except Exception as e:
+        raise AppError(Err.QUEUE_ERROR, f"작업 큐 연결 실패: {e}")
+    if found is None:
+        raise AppError(Err.JOB_NOT_FOUND, f"작업이 없거나 보관 기간이 지났습니다: {job_id}")
+    return found
+
+
+@router.post("", response_model=JobInfo, status_code=status.HTTP_202_ACCEPTED, summary="태깅 작업 등록")
+def submit_job(candidate: Candidate = Body(example=sample_candidate)):
+    """워커(`python -m backend.app.worker`)가 처리합니다. 상태는 GET /jobs/{job_id} 로 확인하세요."""
+    return _submit([candidate])[0]
+
+
+@router.post("/batch", response_model=JobList, status_code=status.HTTP_202_ACCEPTED, summary="태깅 작업 일괄 등록")
+def submit_jobs(candidates: list[Candidate] = Body(example=[sample_candidate])):
+    if len(candidates) > settings.job_submit_max_size:
+        raise AppError(Err.BATCH_TOO_LARGE, f"한 번에 최대 {settings.job_submit_max_size}건까지 등록할 수 있습니다.")
+    return JobList(jobs=_submit(candidates))
+
+
+@router.post("/dead/retry", summary="dead-letter 작업 재등록")
+def retry_dead_jobs():
+    try:
+        return {"requeued": job_queue.retry_dead()}
+    except Exception as e:
+        raise AppError(Err.QUEUE_ERROR, f"작업 큐 연결 실패: {e}")
+
+
+@router.get("/{job_id}", response_model=JobInfo, summary="작업 상태")
+def get_job(job_id: str):
+    return _get(job_id)[0]
+
+
+@router.get("/{job_id}/result", response_model=JobResult, summary="작업 결과")
+def get_job_result(job_id: str):
+    info, result = _get(job_id)
+    if info.status == job_queue.FAILED:
+        message = info.error.message if info.error else None
+        raise AppError(Err.JOB_FAILED, f"작업 실패 ({info.attempts}회 시도): {message}")
+    if result is None:
+        raise AppError(Err.JOB_NOT_READY, f"작업이 아직 끝나지 않았습니다 (status={info.status})")
+    return JobResult(job=info, result=result)
@@ -0,0 +1,13 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from backend.app.utils.metrics import render
+
+router = APIRouter(prefix="/metrics", tags=["Health"])
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get("", summary="Prometheus 지표", response_class=PlainTextResponse)
+def metrics():
+    return PlainTextResponse(render(), media_type=CONTENT_TYPE)
@@ -0,0 +1,125 @@
+"""
+단건 임베딩 요청 micro-batching.
+
+동시에 들어온 단건 요청을 embed_micro_batch_wait_ms 동안(또는 max_items 가 찰 때까지) 모아
+다건 embeddings 호출 한 번으로 보내고, 각 요청에 자기 벡터를 돌려줍니다.
+- sync: 수집 스레드 1개가 큐를 비우고, 묶음 호출은 작은 스레드 풀에서 병렬로 나갑니다.
+- async: 이벤트 루프 안에서 call_later 타이머로 묶습니다.
+"""
+import asyncio
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from backend.app.clients.openai_client import embeddings, embeddings_async
+from backend.app.configs import settings
+from backend.app.utils.histogram import Histogram
+
+log = logging.getLogger(__name__)
+
+
+class EmbeddingMicroBatcher:
+    def __init__(self, model: str):
+        self.model = model
+        self._queue: queue.SimpleQueue[tuple[str, Future]] = queue.SimpleQueue()
+        self._collector: threading.Thread | None = None
+        self._sender: ThreadPoolExecutor | None = None
+        self._start_lock = threading.Lock()
+
+        self._async_loop: asyncio.AbstractEventLoop | None = None
+        self._async_pending: list[tuple[str, asyncio.Future]] = []
+        self._async_timer: asyncio.TimerHandle | None = None
+        # 이벤트 루프는 태스크를 약하게만 참조하므로 보내는 중인 묶음 태스크를 여기서 붙잡아 둠
+        self._async_tasks: set[asyncio.Task] = set()
+
+        # 묶음 하나에 모인 요청 수 (중복 텍스트 포함)
+        self.batch_sizes = Histogram(buckets=(1, 2, 4, 8, 16, 32, 64, 128))
+
+    # ---------- sync ----------
+    def embed(self, text: str) -> list[float]:
+        fut: Future = Future()
+        self._ensure_started()
+        self._queue.put((text, fut))
+        return fut.result()
+
+    def _ensure_started(self) -> None:
+        if self._collector is not None:
+            return
+        with self._start_lock:
+            if self._collector is None:
+                self._sender = ThreadPoolExecutor(
+                    max_workers=settings.embed_micro_batch_concurrency,
+                    thread_name_prefix="embed-batch",
+                )
+                self._collector = threading.Thread(target=self._collect, name="embed-batcher", daemon=True)
+                self._collector.start()
+
+    def _collect(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + settings.embed_micro_batch_wait_ms / 1000
+            while len(batch) < settings.embed_micro_batch_max_items:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self._sender.submit(self._send, batch)
+
+    def _send(self, batch: list[tuple[str, Future]]) -> None:
+        self.batch_sizes.observe(len(batch))
+        texts = list(dict.fromkeys(text for text, _ in batch))
+        try:
+            by_text = dict(zip(texts, embeddings(input=texts, model=self.model)))
+        except BaseException as e:
+            for _, fut in batch:
+                fut.set_exception(e)
+            return
+        for text, fut in batch:
+            fut.set_result(by_text[text])
+
+    # ---------- async ----------
+    async def embed_async(self, text: str) -> list[float]:
+        loop = asyncio.get_running_loop()
+        if self._async_loop is not loop:
+            # 다른 루프(테스트의 asyncio.run 등)에서 남은 대기열은 버림
+            self._async_loop, self._async_pending, self._async_timer = loop, [], None
+
+        fut = loop.create_future()
+        self._async_pending.append((text, fut))
+        if len(self._async_pending) >= settings.embed_micro_batch_max_items:
+            self._flush_async()
+        elif self._async_timer is None:
+            self._async_timer = loop.call_later(settings.embed_micro_batch_wait_ms / 1000, self._flush_async)
+        return await fut
+
+    def _flush_async(self) -> None:
+        if self._async_timer is not None:
+            self._async_timer.cancel()
+            self._async_timer = None
+        batch, self._async_pending = self._async_pending, []
+        if batch:
+            task = self._async_loop.create_task(self._send_async(batch))
+            self._async_tasks.add(task)
+            task.add_done_callback(self._async_tasks.discard)
+
+    async def _send_async(self, batch: list[tuple[str, asyncio.Future]]) -> None:
+        self.batch_sizes.observe(len(batch))
+        texts = list(dict.fromkeys(text for text, _ in batch))
+        try:
+            by_text = dict(zip(texts, await embeddings_async(input=texts, model=self.model)))
+        except Exception as e:
+            for _, fut in batch:
+                if not fut.done():
+                    fut.set_exception(e)
+            return
+        for text, fut in batch:
+            if not fut.done():
+                fut.set_result(by_text[text])
+
+    def stats(self) -> dict:
+        return {"enabled": settings.embed_micro_batch_enabled, "batch_sizes": self.batch_sizes.snapshot()}
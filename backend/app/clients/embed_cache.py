@@ -1,18 +1,185 @@
 import hashlib
-import pickle
+import logging
 
-from backend.app.clients.redis_client import rds
-from backend.app.clients.openai_client import embedding
+import numpy as np
+
+from backend.app.clients.redis_client import rds, ards
+from backend.app.clients.embed_batcher import EmbeddingMicroBatcher
+from backend.app.clients.openai_client import embeddings, embeddings_async, embed_batch_sizes
+from backend.app.clients.single_flight import single_flight
+from backend.app.configs import settings
+from backend.app.utils.lru_cache import LRUCache
+from backend.app.utils import tracing
+from backend.app.utils.metrics import cache_requests
+from backend.app.utils.vector_codec import encode_vector, decode_vector, is_legacy
+
+log = logging.getLogger(__name__)
 
 ONE_DAY = 60 * 60 * 24
+EMBED_MODEL = "text-embedding-3-small"
+
+# Redis 앞단의 워커 로컬 캐시 - Redis 와 같은 TTL 로 만료
+local_cache: LRUCache = LRUCache(
+    max_entries=settings.embed_local_cache_max_entries,
+    max_bytes=settings.embed_local_cache_max_bytes,
+    ttl=ONE_DAY,
+)
+
+micro_batcher = EmbeddingMicroBatcher(EMBED_MODEL)
+
+
+def embed_one(text: str) -> list[float]:
+    """캐시 미스 단건 임베딩 - 동시 요청은 micro-batcher 가 한 번의 다건 호출로 묶음"""
+    if settings.embed_micro_batch_enabled:
+        return micro_batcher.embed(text)
+    return embeddings(input=[text], model=EMBED_MODEL)[0]
+
+async def embed_one_async(text: str) -> list[float]:
+    if settings.embed_micro_batch_enabled:
+        return await micro_batcher.embed_async(text)
+    return (await embeddings_async(input=[text], model=EMBED_MODEL))[0]
+
+
+def _cache_key(text: str) -> str:
+    return "emb:" + hashlib.sha1(text.encode()).hexdigest()
+
+def _local_get(key: str) -> np.ndarray | None:
+    if not settings.embed_local_cache_enabled:
+        return None
+    value = local_cache.get(key)
+    cache_requests.labels(cache="embed_local", result="hit" if value is not None else "miss").inc()
+    return value
+
+def _count_redis(hit: bool, n: int = 1) -> None:
+    cache_requests.labels(cache="embed_redis", result="hit" if hit else "miss").inc(n)
+
+def _trace_status(status: str) -> None:
+    tracing.set_attributes(**{"cache.embed": status})
+
+def _local_put(key: str, vec: np.ndarray) -> np.ndarray:
+    if settings.embed_local_cache_enabled:
+        vec.flags.writeable = False         # 여러 요청이 공유하므로 읽기 전용으로
+        local_cache.put(key, vec, vec.nbytes)
+    return vec
+
+def _read(key: str, cached: bytes) -> np.ndarray | None:
+    """
+    저장된 바이트 → 벡터.
+    읽을 수 없는 항목(EMBED_CACHE_READ_LEGACY=false 인데 남은 pickle, 손상된 값)은 None - 미스로 보고
+    다시 계산해 새 포맷으로 덮어씁니다.
+    """
+    try:
+        return decode_vector(cached, allow_legacy=settings.embed_cache_read_legacy)
+    except Exception as e:
+        log.warning(f"embed cache 항목 {key} 를 읽지 못해 다시 계산합니다: {e}")
+        return None
+
+def _decode(key: str, cached: bytes) -> np.ndarray | None:
+    vec = _read(key, cached)
+    if vec is not None and is_legacy(cached):
+        # 이전 pickle 항목은 읽은 김에 새 포맷으로 덮어쓰기 (TTL 유지)
+        rds.set(key, encode_vector(vec), keepttl=True)
+    return vec
+
+async def _decode_async(key: str, cached: bytes) -> np.ndarray | None:
+    vec = _read(key, cached)
+    if vec is not None and is_legacy(cached):
+        await ards.set(key, encode_vector(vec), keepttl=True)
+    return vec
+
+def get_cached_embedding(text: str) -> np.ndarray:
+    key  = _cache_key(text)
+
+    if (local := _local_get(key)) is not None:
+        _trace_status("local")
+        return local
+
+    cached = rds.get(key)
+    vec = _decode(key, cached) if cached else None
+    _count_redis(vec is not None)
+    if vec is not None:
+        _trace_status("redis")
+        return _local_put(key, vec)
+    _trace_status("miss")
+
+    # 캐시가 없다면 OpenAI 호출 - 같은 텍스트의 동시 요청은 한 번만 호출
+    def _compute() -> np.ndarray:
+        emb = np.asarray(embed_one(text), dtype=np.float32)
+        rds.setex(key, ONE_DAY, encode_vector(emb))
+        return emb
+
+    def _peek() -> np.ndarray | None:
+        return _decode(key, cached) if (cached := rds.get(key)) else None
+
+    return _local_put(key, single_flight.do(key, _compute, _peek))
+
+async def get_cached_embedding_async(text: str) -> np.ndarray:
+    """get_cached_embedding 의 비동기 버전 (redis.asyncio + AsyncOpenAI)"""
+    key = _cache_key(text)
+
+    if (local := _local_get(key)) is not None:
+        _trace_status("local")
+        return local
+
+    cached = await ards.get(key)
+    vec = await _decode_async(key, cached) if cached else None
+    _count_redis(vec is not None)
+    _trace_status("redis" if vec is not None else "miss")
+    if vec is not None:
+        return _local_put(key, vec)
+
+    async def _compute() -> np.ndarray:
+        emb = np.asarray(await embed_one_async(text), dtype=np.float32)
+        await ards.setex(key, ONE_DAY, encode_vector(emb))
+        return emb
+
+    async def _peek() -> np.ndarray | None:
+        return await _decode_async(key, cached) if (cached := await ards.get(key)) else None
+
+    return _local_put(key, await single_flight.do_async(key, _compute, _peek))
+
+def get_cached_embeddings(texts: list[str]) -> list[np.ndarray]:
+    """
+    여러 텍스트의 임베딩을 한 번에 조회합니다.
+    Redis MGET 한 번으로 캐시를 확인하고, 누락된 텍스트만 모아
+    다건 입력 embeddings.create 한 번으로 요청합니다. (입력 순서 유지)
+    """
+    if not texts:
+        return []
+
+    keys = [_cache_key(t) for t in texts]
+    found: dict[str, np.ndarray] = {}
+    for key in dict.fromkeys(keys):
+        if (local := _local_get(key)) is not None:
+            found[key] = local
+
+    remote_keys = [k for k in dict.fromkeys(keys) if k not in found]
+    if remote_keys:
+        hits = 0
+        for key, cached in zip(remote_keys, rds.mget(remote_keys)):
+            if cached and (vec := _decode(key, cached)) is not None:
+                hits += 1
+                found[key] = _local_put(key, vec)
+        _count_redis(True, hits)
+        _count_redis(False, len(remote_keys) - hits)
+
+    # 동일 텍스트는 한 번만 요청
+    missing = list(dict.fromkeys(t for t, k in zip(texts, keys) if k not in found))
+    if missing:
+        vectors = embeddings(input=missing, model=EMBED_MODEL)
+        pipe = rds.pipeline(transaction=False)
+        for text, emb in zip(missing, vectors):
+            key = _cache_key(text)
+            found[key] = _local_put(key, np.asarray(emb, dtype=np.float32))
+            pipe.setex(key, ONE_DAY, encode_vector(found[key]))
+        pipe.execute()
+
+    return [found[k] for k in keys]
 
-def get_cached_embedding(text: str) -> list[float]:
-    key  = "emb:" + hashlib.sha1(text.encode()).hexdigest()
 
-    if (cached := rds.get(key)):
-        return pickle.loads(cached)
+def embed_cache_stats() -> dict:
+    return {"enabled": settings.embed_local_cache_enabled, **local_cache.stats()}
 
-    # 캐시가 없다면 OpenAI 호출
-    emb = embedding(input=[text], model="text-embedding-3-small")
-    rds.setex(key, ONE_DAY, pickle.dumps(emb))
-    return emb
\ No newline at end of file
+def embed_batch_stats() -> dict:
+    """API 요청당 입력 수 분포 + micro-batcher 묶음 크기 분포"""
+    return {"api_batch_sizes": embed_batch_sizes.snapshot(), "micro_batch": micro_batcher.stats()}
@@ -0,0 +1,141 @@
+"""
+오프라인 OpenAI 대역 (LLM_BACKEND=fake).
+
+openai 모듈/AsyncOpenAI 와 같은 모양(chat.completions.create, embeddings.create)의 객체를 제공해
+openai_client 의 재시도·파싱·지표 경로를 그대로 타면서 비용·rate limit 없이 부하 테스트를 돌릴 수 있게 합니다.
+
+- chat: 프롬프트의 "선택 가능한 태그" 목록과 [EXP]/[EDU] 줄로 InferenceResult 스키마에 맞는 JSON 생성
+- embeddings: 텍스트 해시로 시드한 단위 벡터 (같은 텍스트 → 같은 벡터)
+- 지연: 로그정규분포 (중앙값 *_latency_p50_ms, 퍼짐 *_latency_sigma), 오류: *_error_rate 확률로 APIError
+- stream=True (async 만): 지연의 _STREAM_TTFT_RATIO 만큼 기다린 뒤 첫 조각, 나머지 지연을 조각 사이에 나눠 보냄
+"""
+import asyncio
+import hashlib
+import json
+import random
+import re
+import time
+from types import SimpleNamespace
+
+import numpy as np
+import openai
+
+from backend.app.configs import settings
+
+_TAG_LINE_RE = re.compile(r"^\s*-\s+(\S.*?)\s*$")
+_EVIDENCE_LINE_RE = re.compile(r"^\s*\[(?:EXP|EDU)\]\s*(.+?)\s*$")
+_rng = random.Random()
+
+_STREAM_TTFT_RATIO = 0.2     # 전체 지연 중 첫 조각까지의 비율
+_STREAM_CHUNK_CHARS = 8
+
+
+def _latency(p50_ms: float, sigma: float) -> float:
+    """초 단위 지연 - 로그정규분포 (중앙값 p50_ms)"""
+    if p50_ms <= 0:
+        return 0.0
+    return _rng.lognormvariate(np.log(p50_ms), sigma) / 1000
+
+
+def _maybe_fail(rate: float, what: str) -> None:
+    if rate > 0 and _rng.random() < rate:
+        raise openai.APIError(f"fake {what} error", request=None, body=None)
+
+
+def _seed(text: str) -> int:
+    return int.from_bytes(hashlib.sha256(text.encode()).digest()[:8], "little")
+
+
+def _prompt_tags(prompt: str) -> list[str]:
+    lines = prompt.splitlines()
+    for i, line in enumerate(lines):
+        if "선택 가능한 태그" in line:
+            tags = []
+            for tag_line in lines[i + 1:]:
+                if not (m := _TAG_LINE_RE.match(tag_line)):
+                    break
+                tags.append(m.group(1))
+            return tags
+    return []
+
+
+def fake_inference_json(prompt: str) -> str:
+    """프롬프트에서 뽑은 태그·근거로 InferenceResult JSON 생성 (같은 프롬프트 → 같은 결과)"""
+    rng = random.Random(_seed(prompt))
+    tags = _prompt_tags(prompt) or ["리더쉽"]
+    evidences = [m.group(1)[:60] for line in prompt.splitlines() if (m := _EVIDENCE_LINE_RE.match(line))]
+    chosen = rng.sample(tags, k=min(len(tags), rng.randint(1, 3)))
+    return json.dumps(
+        {"tags": [{"tag": t, "evidence": rng.choice(evidences) if evidences else t} for t in chosen]},
+        ensure_ascii=False,
+    )
+
+
+def fake_embedding(text: str, dim: int | None = None) -> list[float]:
+    vec = np.random.default_rng(_seed(text)).standard_normal(dim or settings.fake_embed_dim)
+    return (vec / np.linalg.norm(vec)).astype(np.float32).tolist()
+
+
+def _chat_response(messages: list[dict]) -> SimpleNamespace:
+    content = fake_inference_json(messages[-1]["content"])
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+def _embedding_response(input: list[str]) -> SimpleNamespace:
+    return SimpleNamespace(data=[
+        SimpleNamespace(index=i, embedding=fake_embedding(text)) for i, text in enumerate(input)
+    ])
+
+
+class _Completions:
+    def create(self, messages: list[dict], **_kw):
+        time.sleep(_latency(settings.fake_llm_latency_p50_ms, settings.fake_llm_latency_sigma))
+        _maybe_fail(settings.fake_llm_error_rate, "chat")
+        return _chat_response(messages)
+
+
+class _Embeddings:
+    def create(self, input: list[str], **_kw):
+        time.sleep(_latency(settings.fake_embed_latency_p50_ms, settings.fake_embed_latency_sigma))
+        _maybe_fail(settings.fake_embed_error_rate, "embedding")
+        return _embedding_response(input)
+
+
+class _AsyncChatStream:
+    """openai.AsyncStream 처럼 async for 로 chunk(choices[0].delta.content)를 돌려줌"""
+
+    def __init__(self, content: str, latency: float):
+        self._pieces = [content[i:i + _STREAM_CHUNK_CHARS] for i in range(0, len(content), _STREAM_CHUNK_CHARS)]
+        self._gap = latency * (1 - _STREAM_TTFT_RATIO) / max(1, len(self._pieces))
+
+    async def __aiter__(self):
+        for i, piece in enumerate(self._pieces):
+            if i:
+                await asyncio.sleep(self._gap)
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=piece))], usage=None)
+
+    async def close(self) -> None:
+        pass
+
+
+class _AsyncCompletions:
+    async def create(self, messages: list[dict], stream: bool = False, **_kw):
+        latency = _latency(settings.fake_llm_latency_p50_ms, settings.fake_llm_latency_sigma)
+        if stream:
+            await asyncio.sleep(latency * _STREAM_TTFT_RATIO)
+            _maybe_fail(settings.fake_llm_error_rate, "chat")
+            return _AsyncChatStream(fake_inference_json(messages[-1]["content"]), latency)
+        await asyncio.sleep(latency)
+        _maybe_fail(settings.fake_llm_error_rate, "chat")
+        return _chat_response(messages)
+
+
+class _AsyncEmbeddings:
+    async def create(self, input: list[str], **_kw):
+        await asyncio.sleep(_latency(settings.fake_embed_latency_p50_ms, settings.fake_embed_latency_sigma))
+        _maybe_fail(settings.fake_embed_error_rate, "embedding")
+        return _embedding_response(input)
+
+
+client = SimpleNamespace(chat=SimpleNamespace(completions=_Completions()), embeddings=_Embeddings())
+async_client = SimpleNamespace(chat=SimpleNamespace(completions=_AsyncCompletions()), embeddings=_AsyncEmbeddings())
@@ -0,0 +1,219 @@
+"""
+Redis 기반 태깅 작업 큐.
+
+    job:{id}          HASH  status·attempts·시각·candidate·result·error (JOB_TTL 초 보관)
+    jobs:queue        LIST  대기 작업 id (LPUSH 로 넣고 워커가 오른쪽에서 꺼냄)
+    jobs:processing   LIST  실행 중 작업 id (BLMOVE 로 queue → processing 원자적 이동)
+    jobs:delayed      ZSET  재시도 대기 작업 id (score: 다시 큐에 넣을 시각)
+    jobs:dead         LIST  JOB_MAX_ATTEMPTS 번 실패한 작업 id (dead-letter)
+
+- 상태: queued → running → succeeded | (실패 시) queued(재시도) … → failed(dead-letter)
+- maintain(): 재시도 시각이 된 작업을 큐로 옮기고, JOB_TIMEOUT 초 넘게 running 인 작업(워커 장애)을 다시 큐에 넣음.
+  BLMOVE 직후 started_at 을 쓰기 전에 워커가 죽은 작업은 처음 발견한 시각(orphaned_at)부터 같은 시간을 기다려 회수합니다.
+  여러 워커가 동시에 돌리지 않도록 짧은 Redis 락 안에서 실행합니다.
+"""
+import logging
+import time
+import uuid
+
+from backend.app.clients.redis_client import rds
+from backend.app.configs import settings
+from backend.app.models.candidate import Candidate
+from backend.app.models.job import JobInfo
+from backend.app.models.response import ErrorDetail, InferenceResult
+from backend.app.utils import metrics
+
+log = logging.getLogger(__name__)
+
+JOB_PREFIX = "job:"
+QUEUE_KEY = "jobs:queue"
+PROCESSING_KEY = "jobs:processing"
+DELAYED_KEY = "jobs:delayed"
+DEAD_KEY = "jobs:dead"
+MAINTENANCE_LOCK_KEY = "jobs:maintenance"
+
+QUEUED, RUNNING, SUCCEEDED, FAILED = "queued", "running", "succeeded", "failed"
+RETRIED, DEAD = "retried", "dead"
+
+
+def _key(job_id: str) -> str:
+    return JOB_PREFIX + job_id
+
+
+def _decode(raw: dict) -> dict[str, str]:
+    return {k.decode(): v.decode() for k, v in raw.items()}
+
+
+def _info(job_id: str, fields: dict[str, str]) -> JobInfo:
+    return JobInfo(
+        job_id=job_id,
+        status=fields["status"],
+        attempts=int(fields.get("attempts", 0)),
+        created_at=float(fields["created_at"]),
+        started_at=float(fields["started_at"]) if fields.get("started_at") else None,
+        finished_at=float(fields["finished_at"]) if fields.get("finished_at") else None,
+        error=ErrorDetail.model_validate_json(fields["error"]) if fields.get("error") else None,
+    )
+
+
+# ---------- API 쪽 ----------
+def submit(candidates: list[Candidate]) -> list[JobInfo]:
+    """작업 생성 후 큐에 넣음 - 전체를 한 트랜잭션으로"""
+    now = time.time()
+    jobs = [uuid.uuid4().hex for _ in candidates]
+    pipe = rds.pipeline(transaction=True)
+    for job_id, candidate in zip(jobs, candidates):
+        pipe.hset(_key(job_id), mapping={
+            "status": QUEUED, "attempts": 0, "created_at": now,
+            "candidate": candidate.model_dump_json(),
+        })
+        pipe.expire(_key(job_id), settings.job_ttl)
+        pipe.lpush(QUEUE_KEY, job_id)
+    pipe.execute()
+    metrics.jobs_submitted.labels().inc(len(jobs))
+    return [JobInfo(job_id=job_id, status=QUEUED, created_at=now) for job_id in jobs]
+
+
+def get_job(job_id: str) -> tuple[JobInfo, InferenceResult | None] | None:
+    fields = _decode(rds.hgetall(_key(job_id)))
+    if not fields:
+        return None
+    result = InferenceResult.model_validate_json(fields["result"]) if fields.get("result") else None
+    return _info(job_id, fields), result
+
+
+def retry_dead(limit: int = 1000) -> int:
+    """dead-letter 작업을 시도 횟수를 초기화해 다시 큐에 넣음"""
+    moved = 0
+    for _ in range(limit):
+        raw = rds.rpop(DEAD_KEY)
+        if raw is None:
+            break
+        job_id = raw.decode()
+        pipe = rds.pipeline(transaction=True)
+        pipe.hset(_key(job_id), mapping={"status": QUEUED, "attempts": 0})
+        pipe.hdel(_key(job_id), "started_at", "finished_at")
+        pipe.expire(_key(job_id), settings.job_ttl)
+        pipe.lpush(QUEUE_KEY, job_id)
+        pipe.execute()
+        moved += 1
+    return moved
+
+
+def depths() -> dict[str, int]:
+    pipe = rds.pipeline(transaction=False)
+    pipe.llen(QUEUE_KEY)
+    pipe.zcard(DELAYED_KEY)
+    pipe.llen(PROCESSING_KEY)
+    pipe.llen(DEAD_KEY)
+    queued, delayed, running, dead = pipe.execute()
+    return {"queued": queued, "delayed": delayed, "running": running, "dead": dead}
+
+
+def _collect_depths() -> None:
+    """/metrics 렌더링 직전에 큐 길이 갱신 - Redis 장애 시 이전 값 유지"""
+    try:
+        for queue, depth in depths().items():
+            metrics.job_queue_depth.labels(queue=queue).set(depth)
+    except Exception as e:
+        log.debug(f"job queue depth 조회 실패: {e}")
+
+
+metrics.registry.add_collector(_collect_depths)
+
+
+# ---------- 워커 쪽 ----------
+def claim(timeout: float) -> tuple[str, Candidate] | None:
+    """대기 작업 하나를 processing 으로 옮기고 running 으로 표시, timeout 초 동안 없으면 None"""
+    raw = rds.blmove(QUEUE_KEY, PROCESSING_KEY, timeout, src="RIGHT", dest="LEFT")
+    if raw is None:
+        return None
+    job_id = raw.decode()
+    pipe = rds.pipeline(transaction=True)
+    pipe.hset(_key(job_id), mapping={"status": RUNNING, "started_at": time.time()})
+    pipe.hdel(_key(job_id), "orphaned_at")
+    pipe.hincrby(_key(job_id), "attempts", 1)
+    pipe.hget(_key(job_id), "candidate")
+    _, _, attempts, candidate = pipe.execute()
+    if candidate is None:
+        # TTL 이 지나 본문이 사라진 작업
+        rds.lrem(PROCESSING_KEY, 1, job_id)
+        rds.delete(_key(job_id))
+        return None
+    if attempts > settings.job_max_attempts:
+        # maintain() 으로 회수된 작업이 또 한도를 넘김 - 워커를 죽이는 작업으로 보고 격리
+        fail(job_id, ErrorDetail(code="JOB_TIMEOUT", message=f"{settings.job_timeout}초 안에 끝나지 않은 시도가 반복됨"))
+        return None
+    return job_id, Candidate.model_validate_json(candidate)
+
+
+def complete(job_id: str, result: InferenceResult) -> None:
+    pipe = rds.pipeline(transaction=True)
+    pipe.hset(_key(job_id), mapping={"status": SUCCEEDED, "finished_at": time.time(), "result": result.model_dump_json()})
+    pipe.hdel(_key(job_id), "error")
+    pipe.expire(_key(job_id), settings.job_ttl)
+    pipe.lrem(PROCESSING_KEY, 1, job_id)
+    pipe.execute()
+    metrics.jobs_finished.labels(result=SUCCEEDED).inc()
+
+
+def fail(job_id: str, error: ErrorDetail) -> str:
+    """실패 기록 - 시도가 남았으면 backoff 후 재시도(retried), 아니면 dead-letter(dead)"""
+    attempts = int(rds.hget(_key(job_id), "attempts") or 0)
+    pipe = rds.pipeline(transaction=True)
+    pipe.hset(_key(job_id), "error", error.model_dump_json())
+    pipe.lrem(PROCESSING_KEY, 1, job_id)
+    if attempts < settings.job_max_attempts:
+        outcome = RETRIED
+        delay = settings.job_retry_backoff * 2 ** (attempts - 1)
+        pipe.hset(_key(job_id), "status", QUEUED)
+        pipe.hdel(_key(job_id), "started_at")
+        pipe.zadd(DELAYED_KEY, {job_id: time.time() + delay})
+    else:
+        outcome = DEAD
+        pipe.hset(_key(job_id), mapping={"status": FAILED, "finished_at": time.time()})
+        pipe.lpush(DEAD_KEY, job_id)
+    pipe.expire(_key(job_id), settings.job_ttl)
+    pipe.execute()
+    metrics.jobs_finished.labels(result=outcome).inc()
+    return outcome
+
+
+def maintain(now: float | None = None) -> dict[str, int]:
+    """재시도 시각이 된 작업 승격 + 멈춘 running 작업 회수 (락을 못 잡으면 다른 워커에 맡김)"""
+    if not rds.set(MAINTENANCE_LOCK_KEY, b"1", nx=True, px=int(settings.job_maintenance_interval * 1000)):
+        return {"promoted": 0, "recovered": 0}
+    now = time.time() if now is None else now
+
+    promoted = 0
+    for raw in rds.zrangebyscore(DELAYED_KEY, "-inf", now, start=0, num=1000):
+        pipe = rds.pipeline(transaction=True)
+        pipe.zrem(DELAYED_KEY, raw)
+        pipe.lpush(QUEUE_KEY, raw)
+        pipe.execute()
+        promoted += 1
+
+    recovered = 0
+    for raw in rds.lrange(PROCESSING_KEY, 0, -1):
+        fields = _decode(rds.hgetall(_key(raw.decode())))
+        if not fields:
+            # TTL 이 지나 본문이 사라진 작업
+            rds.lrem(PROCESSING_KEY, 1, raw)
+            continue
+        since = fields.get("started_at") or fields.get("orphaned_at")
+        if since is None:
+            # BLMOVE 와 started_at 기록 사이에 워커가 죽었을 수 있음 - 발견 시각부터 JOB_TIMEOUT 대기
+            rds.hset(_key(raw.decode()), "orphaned_at", now)
+            continue
+        if now - float(since) < settings.job_timeout:
+            continue
+        pipe = rds.pipeline(transaction=True)
+        pipe.lrem(PROCESSING_KEY, 1, raw)
+        pipe.hset(_key(raw.decode()), "status", QUEUED)
+        pipe.hdel(_key(raw.decode()), "started_at", "orphaned_at")
+        pipe.rpush(QUEUE_KEY, raw)          # 오른쪽 = 다음에 꺼낼 자리
+        pipe.execute()
+        recovered += 1
+    if recovered:
+        log.warning(f"멈춘 작업 {recovered}건을 다시 큐에 넣음 (JOB_TIMEOUT={settings.job_timeout}s)")
+    return {"promoted": promoted, "recovered": recovered}
@@ -1,6 +1,12 @@
 import openai, logging
+from typing import AsyncIterator
 from tenacity import retry, wait_exponential, stop_after_attempt, retry_if_exception_type
+from backend.app.clients import fake_openai
 from backend.app.configs import settings
+from backend.app.utils.histogram import Histogram
+from backend.app.utils.metrics import openai_retries
+from backend.app.utils import tracing
+from backend.app.utils.profiler import timed
 
 log = logging.getLogger(__name__)
 openai.api_key = settings.openai_api_key
@@ -10,7 +16,25 @@ RETRIABLE = (openai.RateLimitError,
              openai.Timeout,
              TimeoutError)
 
-@retry(
+def _count_retry(retry_state) -> None:
+    """재시도 직전마다 호출 - 실패한 시도 번호·예외 종류를 지표로 남김"""
+    error = retry_state.outcome.exception() if retry_state.outcome else None
+    openai_retries.labels(
+        fn=retry_state.fn.__name__.lstrip("_"),
+        attempt=retry_state.attempt_number,
+        error=type(error).__name__ if error else "",
+    ).inc()
+    tracing.incr_attribute("openai.retries")
+
+def _trace_usage(response) -> None:
+    if (usage := getattr(response, "usage", None)) is not None:
+        tracing.set_attributes(**{
+            "llm.prompt_tokens": usage.prompt_tokens,
+            "llm.completion_tokens": getattr(usage, "completion_tokens", 0) or 0,
+        })
+
+# 동기/비동기 함수 모두에 적용 가능 (tenacity 가 코루틴이면 AsyncRetrying 사용)
+openai_retry = retry(
     wait=wait_exponential(
         min=settings.openai_backoff_min,
         max=settings.openai_backoff_max,
@@ -18,33 +42,136 @@ RETRIABLE = (openai.RateLimitError,
     ),
     stop=stop_after_attempt(settings.openai_max_retries),
     retry=retry_if_exception_type(RETRIABLE),
+    before_sleep=_count_retry,
     reraise=True,
 )
+
+async_client = openai.AsyncOpenAI(api_key=settings.openai_api_key)
+
+def _api():
+    """LLM_BACKEND 에 따라 실제 openai 모듈 또는 오프라인 대역"""
+    return fake_openai.client if settings.llm_backend == "fake" else openai
+
+def _async_api():
+    return fake_openai.async_client if settings.llm_backend == "fake" else async_client
+
+# 실제 embeddings.create 1회에 담긴 입력 수 분포
+embed_batch_sizes = Histogram(buckets=(1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024, 2048))
+
+@timed("openai.chat_completion")
+@openai_retry
 def chat_completion(messages: list[dict], **kw) -> str:
     """LLM 호출 - 재시도·타임아웃 일괄 적용"""
-    response = openai.chat.completions.create(
+    response = _api().chat.completions.create(
         messages=messages,
         timeout=settings.openai_timeout,
         **kw,
     )
+    _trace_usage(response)
     return response.choices[0].message.content
 
-@retry(
-    wait=wait_exponential(
-        min=settings.openai_backoff_min,
-        max=settings.openai_backoff_max,
-        exp_base=2
-    ),
-    stop=stop_after_attempt(settings.openai_max_retries),
-    retry=retry_if_exception_type(RETRIABLE),
-    reraise=True,
-)
+@openai_retry
 def embedding(input: list[str], model: str, **kw) -> str:
     """LLM 호출 - 재시도·타임아웃 일괄 적용"""
-    response = openai.embeddings.create(
+    response = _api().embeddings.create(
         input=input,
         model=model,
         timeout=settings.openai_timeout,
         **kw,
     )
     return response.data[0].embedding
+
+def _approx_tokens(text: str) -> int:
+    # UTF-8 바이트 수는 BPE 토큰 수의 상한 - 토크나이저 없이도 한도를 넘지 않도록 보수적으로 계산
+    return max(1, len(text.encode("utf-8")))
+
+def split_embedding_batches(texts: list[str], max_items: int, max_tokens: int) -> list[list[str]]:
+    """입력 수(max_items)·토큰 합(max_tokens) 한도를 넘지 않게 순서대로 나눕니다."""
+    batches: list[list[str]] = []
+    current: list[str] = []
+    tokens = 0
+    for text in texts:
+        n = _approx_tokens(text)
+        if current and (len(current) >= max_items or tokens + n > max_tokens):
+            batches.append(current)
+            current, tokens = [], 0
+        current.append(text)
+        tokens += n
+    if current:
+        batches.append(current)
+    return batches
+
+@openai_retry
+def _embeddings_request(input: list[str], model: str, **kw) -> list[list[float]]:
+    response = _api().embeddings.create(
+        input=input,
+        model=model,
+        timeout=settings.openai_timeout,
+        **kw,
+    )
+    embed_batch_sizes.observe(len(input))
+    return [d.embedding for d in sorted(response.data, key=lambda d: d.index)]
+
+@timed("openai.embeddings")
+def embeddings(input: list[str], model: str, **kw) -> list[list[float]]:
+    """다건 임베딩 - API 한도 단위로 나눠 요청하고, 입력 순서대로 벡터 목록을 반환"""
+    vectors: list[list[float]] = []
+    for batch in split_embedding_batches(input, settings.embed_batch_max_items, settings.embed_batch_max_tokens):
+        vectors.extend(_embeddings_request(batch, model, **kw))
+    return vectors
+
+@timed("openai.chat_completion_async")
+@openai_retry
+async def chat_completion_async(messages: list[dict], **kw) -> str:
+    """chat_completion 의 비동기 버전"""
+    response = await _async_api().chat.completions.create(
+        messages=messages,
+        timeout=settings.openai_timeout,
+        **kw,
+    )
+    _trace_usage(response)
+    return response.choices[0].message.content
+
+@openai_retry
+async def _open_chat_stream(messages: list[dict], **kw):
+    return await _async_api().chat.completions.create(
+        messages=messages,
+        timeout=settings.openai_timeout,
+        stream=True,
+        stream_options={"include_usage": True},
+        **kw,
+    )
+
+async def chat_completion_stream_async(messages: list[dict], **kw) -> AsyncIterator[str]:
+    """
+    스트리밍 chat - content 조각을 도착하는 대로 yield.
+    재시도는 스트림 연결까지만 적용 (조각을 내보낸 뒤의 실패는 그대로 전파)
+    """
+    stream = await _open_chat_stream(messages, **kw)
+    try:
+        async for chunk in stream:
+            if chunk.usage is not None:
+                _trace_usage(chunk)
+            if chunk.choices and (delta := chunk.choices[0].delta.content):
+                yield delta
+    finally:
+        await stream.close()
+
+@openai_retry
+async def _embeddings_request_async(input: list[str], model: str, **kw) -> list[list[float]]:
+    response = await _async_api().embeddings.create(
+        input=input,
+        model=model,
+        timeout=settings.openai_timeout,
+        **kw,
+    )
+    embed_batch_sizes.observe(len(input))
+    return [d.embedding for d in sorted(response.data, key=lambda d: d.index)]
+
+@timed("openai.embeddings_async")
+async def embeddings_async(input: list[str], model: str, **kw) -> list[list[float]]:
+    """embeddings 의 비동기 버전"""
+    vectors: list[list[float]] = []
+    for batch in split_embedding_batches(input, settings.embed_batch_max_items, settings.embed_batch_max_tokens):
+        vectors.extend(await _embeddings_request_async(batch, model, **kw))
+    return vectors
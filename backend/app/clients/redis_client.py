@@ -1,4 +1,5 @@
 from redis import Redis
+from redis.asyncio import Redis as AsyncRedis
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class RedisSettings(BaseSettings):
@@ -20,3 +21,4 @@ class RedisSettings(BaseSettings):
 
 redis_settings = RedisSettings()
 rds: Redis = Redis.from_url(redis_settings.url, decode_responses=False)
+ards: AsyncRedis = AsyncRedis.from_url(redis_settings.url, decode_responses=False)
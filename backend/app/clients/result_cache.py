@@ -0,0 +1,102 @@
+import logging
+import threading
+
+from backend.app.clients.redis_client import rds, ards
+from backend.app.configs import settings
+from backend.app.models.response import InferenceResult
+from backend.app.utils.metrics import cache_requests
+
+log = logging.getLogger(__name__)
+
+KEY_PREFIX = "infer:"
+
+HIT, MISS, BYPASS = "HIT", "MISS", "BYPASS"
+
+
+_METRIC_RESULTS = {"hits": "hit", "misses": "miss", "errors": "error"}
+
+
+class _Counters:
+    """워커 프로세스 단위 hit/miss 카운터"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._values = {"hits": 0, "misses": 0, "errors": 0, "invalidations": 0}
+
+    def incr(self, name: str, n: int = 1) -> None:
+        with self._lock:
+            self._values[name] += n
+        if name in _METRIC_RESULTS:
+            cache_requests.labels(cache="result", result=_METRIC_RESULTS[name]).inc(n)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            values = dict(self._values)
+        lookups = values["hits"] + values["misses"]
+        values["hit_ratio"] = round(values["hits"] / lookups, 4) if lookups else 0.0
+        return values
+
+
+counters = _Counters()
+
+
+def _decode(cached: bytes | None) -> InferenceResult | None:
+    if cached is None:
+        counters.incr("misses")
+        return None
+    counters.incr("hits")
+    return InferenceResult.model_validate_json(cached)
+
+
+def get_cached_result(key: str) -> InferenceResult | None:
+    """캐시 조회 - Redis 장애 시에는 miss 로 취급하고 파이프라인을 그대로 진행"""
+    try:
+        return _decode(rds.get(KEY_PREFIX + key))
+    except Exception as e:
+        counters.incr("errors")
+        log.warning(f"result cache get 실패: {e}")
+        return None
+
+def get_cached_results(keys: list[str]) -> list[InferenceResult | None]:
+    if not keys:
+        return []
+    try:
+        return [_decode(c) for c in rds.mget([KEY_PREFIX + k for k in keys])]
+    except Exception as e:
+        counters.incr("errors")
+        log.warning(f"result cache mget 실패: {e}")
+        return [None] * len(keys)
+
+def set_cached_result(key: str, result: InferenceResult) -> None:
+    try:
+        rds.setex(KEY_PREFIX + key, settings.result_cache_ttl, result.model_dump_json())
+    except Exception as e:
+        counters.incr("errors")
+        log.warning(f"result cache set 실패: {e}")
+
+def invalidate_result(key: str) -> bool:
+    """캐시 항목 삭제 - 실제로 지워졌으면 True"""
+    deleted = bool(rds.delete(KEY_PREFIX + key))
+    if deleted:
+        counters.incr("invalidations")
+    return deleted
+
+
+async def get_cached_result_async(key: str) -> InferenceResult | None:
+    try:
+        return _decode(await ards.get(KEY_PREFIX + key))
+    except Exception as e:
+        counters.incr("errors")
+        log.warning(f"result cache get 실패: {e}")
+        return None
+
+async def set_cached_result_async(key: str, result: InferenceResult) -> None:
+    try:
+        await ards.setex(KEY_PREFIX + key, settings.result_cache_ttl, result.model_dump_json())
+    except Exception as e:
+        counters.incr("errors")
+        log.warning(f"result cache set 실패: {e}")
+
+
+def result_cache_stats() -> dict:
+    return counters.snapshot()
@@ -0,0 +1,253 @@
+"""
+동일 입력에 대한 동시 호출 병합(single-flight).
+
+- 워커 내부: 같은 key 로 동시에 들어온 호출은 첫 호출(leader)의 결과를 함께 기다립니다.
+- 워커 간: leader 는 Redis `SET NX PX` 락을 잡고 계산하며, 락을 못 잡은 워커는
+  결과가 게시(peek)될 때까지 폴링합니다. 락이 사라졌는데 결과가 없거나 대기 시간을 넘기면 직접 계산합니다.
+- leader 가 취소되거나(클라이언트 연결 끊김 등) Redis 조회가 실패하면 기다리던 호출은 직접 계산합니다.
+"""
+import asyncio
+import logging
+import threading
+import time
+import uuid
+from typing import Awaitable, Callable, TypeVar
+
+from backend.app.clients.redis_client import rds, ards
+from backend.app.configs import settings
+
+log = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+LOCK_PREFIX = "sf:lock:"
+RESULT_PREFIX = "sf:res:"
+
+# 내가 잡은 락만 해제 (compare-and-delete)
+_RELEASE_LUA = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+def lock_ttl() -> float:
+    """락 만료 (초) - 계산 도중 풀리지 않도록 기본값은 재시도를 다 쓴 OpenAI 호출의 최악 시간"""
+    if settings.single_flight_lock_ttl:
+        return settings.single_flight_lock_ttl
+    attempts = settings.openai_max_retries
+    return settings.openai_timeout * attempts + settings.openai_backoff_max * (attempts - 1)
+
+
+def wait_timeout() -> float:
+    return settings.single_flight_wait_timeout or lock_ttl()
+
+
+class _LeaderCancelled(Exception):
+    """leader 가 취소됨 - follower 는 직접 계산 (follower 자신은 취소되지 않았으므로)"""
+
+
+class _Call:
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict[str, _Call] = {}
+        self._async_calls: dict[str, asyncio.Future] = {}
+        self._stats = {"leaders": 0, "local_followers": 0, "remote_followers": 0, "fallbacks": 0}
+
+    def _incr(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"enabled": settings.single_flight_enabled, "in_flight": len(self._calls) + len(self._async_calls), **self._stats}
+
+    # ---------- sync ----------
+    def do(self, key: str, compute: Callable[[], _T], peek: Callable[[], _T | None]) -> _T:
+        """
+        compute: 실제 호출 (결과를 peek 가 읽을 수 있는 곳에 저장해야 함)
+        peek:    다른 워커가 게시한 결과 조회, 없으면 None
+        """
+        if not settings.single_flight_enabled:
+            return compute()
+
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            self._incr("local_followers")
+            if call.event.wait(wait_timeout()):
+                if call.error is not None:
+                    raise call.error
+                return call.result
+            self._incr("fallbacks")
+            return compute()
+
+        try:
+            call.result = self._lead(key, compute, peek)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.event.set()
+
+    def _lead(self, key: str, compute: Callable[[], _T], peek: Callable[[], _T | None]) -> _T:
+        lock_key, token = LOCK_PREFIX + key, uuid.uuid4().hex
+        try:
+            acquired = rds.set(lock_key, token, nx=True, px=int(lock_ttl() * 1000))
+        except Exception as e:
+            log.warning(f"single-flight 락 획득 실패, 직접 호출합니다: {e}")
+            return compute()
+
+        if acquired:
+            self._incr("leaders")
+            try:
+                return compute()
+            finally:
+                try:
+                    rds.eval(_RELEASE_LUA, 1, lock_key, token)
+                except Exception as e:
+                    log.warning(f"single-flight 락 해제 실패: {e}")
+
+        # 다른 워커가 계산 중 → 결과 게시를 기다림
+        self._incr("remote_followers")
+        deadline = time.monotonic() + wait_timeout()
+        while time.monotonic() < deadline:
+            time.sleep(settings.single_flight_poll_interval)
+            try:
+                if (value := peek()) is not None:
+                    return value
+                if not rds.exists(lock_key):
+                    if (value := peek()) is not None:
+                        return value
+                    break
+            except Exception as e:
+                log.warning(f"single-flight 결과 조회 실패, 직접 호출합니다: {e}")
+                break
+        self._incr("fallbacks")
+        return compute()
+
+    # ---------- async ----------
+    async def do_async(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[_T]],
+        peek: Callable[[], Awaitable[_T | None]],
+    ) -> _T:
+        if not settings.single_flight_enabled:
+            return await compute()
+
+        if (fut := self._async_calls.get(key)) is not None:
+            self._incr("local_followers")
+            try:
+                return await asyncio.wait_for(asyncio.shield(fut), wait_timeout())
+            except (asyncio.TimeoutError, _LeaderCancelled):
+                self._incr("fallbacks")
+                return await compute()
+
+        fut = self._async_calls[key] = asyncio.get_running_loop().create_future()
+        try:
+            result = await self._lead_async(key, compute, peek)
+            fut.set_result(result)
+            return result
+        except BaseException as e:
+            # 취소는 leader 요청에만 해당 - follower 에는 취소 대신 직접 계산하라고 알림
+            fut.set_exception(_LeaderCancelled() if isinstance(e, asyncio.CancelledError) else e)
+            fut.exception()             # 기다리는 follower 가 없어도 경고가 남지 않도록
+            raise
+        finally:
+            self._async_calls.pop(key, None)
+
+    async def _lead_async(self, key, compute, peek):
+        lock_key, token = LOCK_PREFIX + key, uuid.uuid4().hex
+        try:
+            acquired = await ards.set(lock_key, token, nx=True, px=int(lock_ttl() * 1000))
+        except Exception as e:
+            log.warning(f"single-flight 락 획득 실패, 직접 호출합니다: {e}")
+            return await compute()
+
+        if acquired:
+            self._incr("leaders")
+            try:
+                return await compute()
+            finally:
+                try:
+                    await ards.eval(_RELEASE_LUA, 1, lock_key, token)
+                except Exception as e:
+                    log.warning(f"single-flight 락 해제 실패: {e}")
+
+        self._incr("remote_followers")
+        deadline = time.monotonic() + wait_timeout()
+        while time.monotonic() < deadline:
+            await asyncio.sleep(settings.single_flight_poll_interval)
+            try:
+                if (value := await peek()) is not None:
+                    return value
+                if not await ards.exists(lock_key):
+                    if (value := await peek()) is not None:
+                        return value
+                    break
+            except Exception as e:
+                log.warning(f"single-flight 결과 조회 실패, 직접 호출합니다: {e}")
+                break
+        self._incr("fallbacks")
+        return await compute()
+
+
+single_flight = SingleFlight()
+
+
+def coalesce_shared(key: str, compute: Callable[[], str]) -> str:
+    """
+    캐시가 따로 없는 호출(LLM 등)용 - leader 가 결과 문자열을
+    sf:res:<key> 에 짧게(single_flight_result_ttl) 게시해 다른 워커가 읽어가도록 합니다.
+    """
+    result_key = RESULT_PREFIX + key
+
+    def _compute() -> str:
+        value = compute()
+        try:
+            rds.setex(result_key, settings.single_flight_result_ttl, value)
+        except Exception as e:
+            log.warning(f"single-flight 결과 게시 실패: {e}")
+        return value
+
+    def _peek() -> str | None:
+        raw = rds.get(result_key)
+        return raw.decode() if isinstance(raw, bytes) else raw
+
+    return single_flight.do(key, _compute, _peek)
+
+
+async def coalesce_shared_async(key: str, compute: Callable[[], Awaitable[str]]) -> str:
+    result_key = RESULT_PREFIX + key
+
+    async def _compute() -> str:
+        value = await compute()
+        try:
+            await ards.setex(result_key, settings.single_flight_result_ttl, value)
+        except Exception as e:
+            log.warning(f"single-flight 결과 게시 실패: {e}")
+        return value
+
+    async def _peek() -> str | None:
+        raw = await ards.get(result_key)
+        return raw.decode() if isinstance(raw, bytes) else raw
+
+    return await single_flight.do_async(key, _compute, _peek)
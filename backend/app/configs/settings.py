@@ -1,13 +1,76 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field
 
 
 class Settings(BaseSettings):
+    log_level: str = "INFO"               # DEBUG 면 @timed 단계별 로그도 출력
+
+    trace_export_path: str | None = None  # 지정 시 요청 trace 를 OTLP/JSON 줄 단위로 기록
+    trace_sample_ratio: float = 1.0       # 0~1, 내보낼 요청 비율
+    trace_service_name: str = "llm-tagging-api"
+    server_timing_enabled: bool = True    # 요청 헤더 X-Server-Timing: 1 이면 Server-Timing 응답
     openai_api_key: str = Field(..., env='OPENAI_API_KEY')
     openai_timeout: float = 15.0          # 초
     openai_max_retries: int = 4
     openai_backoff_min: float = 0.5       # s
     openai_backoff_max: float = 4.0
+
+    # "openai" | "fake" - fake 는 오프라인 대역(clients/fake_openai.py), 부하 테스트용
+    llm_backend: str = "openai"
+    fake_llm_latency_p50_ms: float = 800.0    # 로그정규분포 중앙값
+    fake_llm_latency_sigma: float = 0.5       # 클수록 꼬리 지연이 김
+    fake_llm_error_rate: float = 0.0          # 0~1, APIError 확률 (재시도 경로 검증용)
+    fake_embed_latency_p50_ms: float = 40.0
+    fake_embed_latency_sigma: float = 0.3
+    fake_embed_error_rate: float = 0.0
+    fake_embed_dim: int = 1536
+
+    llm_max_tokens: int = 800             # 응답 토큰 상한 (400 이면 태그가 많을 때 JSON 이 잘림)
+    prompt_token_budget: int = 8000       # build_prompt 결과 토큰 상한, 넘으면 덜 중요한 부분부터 축약 (0 이면 제한 없음)
+    prompt_min_contexts: int = 3          # 예산 초과 시에도 남길 컨텍스트 수 (유사도 상위)
+    prompt_description_max_chars: int = 200   # 예산 초과 시 오래된 경력 설명을 이 길이로 축약
+
+    rule_tagger_enabled: bool = True      # 구조화된 사실로 답이 나오는 태그는 규칙으로 판정, 남은 태그만 LLM 에 질의
+    rule_large_company_min_employees: int = 1000  # '대규모 회사 경험' 직원 수 하한
+    rule_growth_min_rate: float = 0.3     # 재직 기간 직원 수 증가율이 이 이상이면 '성장기 스타트업 경험'
+    company_facts_cache_ttl: float = 3600.0         # 초, 재직 기간별 회사 사실 로컬 캐시 유지 기간
+    company_facts_cache_max_entries: int = 50_000
+
+    batch_max_size: int = 100             # /infer/batch 1회 최대 지원자 수
+    batch_llm_concurrency: int = 8        # 배치 내 동시 LLM 호출 수
+
+    job_worker_concurrency: int = 4       # 워커 프로세스당 동시 처리 작업 수 (DB_POOL_MAX_SIZE 이하)
+    job_max_attempts: int = 3             # 작업당 최대 시도 횟수, 넘으면 dead-letter
+    job_retry_backoff: float = 5.0        # 초, 첫 재시도 대기 (시도마다 2배)
+    job_timeout: float = 600.0            # 초, 이보다 오래 running 이면 워커 장애로 보고 다시 큐에
+    job_maintenance_interval: float = 1.0 # 초, 재시도 승격·멈춘 작업 회수 주기
+    job_ttl: int = 60 * 60 * 24 * 7       # 초, 작업 상태·결과 보관 기간
+    job_submit_max_size: int = 1000       # /jobs/batch 1회 최대 작업 수
+    job_worker_metrics_port: int = 9100   # 워커 /metrics 포트 (0 이면 끔)
+
+    embed_batch_max_items: int = 2048     # 임베딩 요청 1회당 입력 수 (API 한도)
+    embed_batch_max_tokens: int = 300_000 # 임베딩 요청 1회당 총 토큰 (API 한도)
+    embed_micro_batch_enabled: bool = True    # 동시 단건 임베딩 요청을 모아 한 번에 호출
+    embed_micro_batch_wait_ms: float = 5.0    # 첫 요청 이후 모으는 시간
+    embed_micro_batch_max_items: int = 64     # 이만큼 모이면 기다리지 않고 바로 호출
+    embed_micro_batch_concurrency: int = 4    # 동시에 나가는 묶음 요청 수
+
+    embed_cache_read_legacy: bool = True   # 이전 pickle 임베딩 캐시 읽기 (마이그레이션 종료 후 False)
+    embed_local_cache_enabled: bool = True          # 워커 로컬 LRU (테스트에서는 False 권장)
+    embed_local_cache_max_entries: int = 10_000
+    embed_local_cache_max_bytes: int = 64 * 1024 * 1024
+
+    single_flight_enabled: bool = True    # 동일 입력 동시 호출 병합 (임베딩·LLM)
+    # 초, 워커 간 Redis 락 만료 - None 이면 최악의 OpenAI 호출 시간(timeout × 시도 수 + 시도 사이 최대 backoff)
+    single_flight_lock_ttl: float | None = None
+    single_flight_wait_timeout: float | None = None   # 초, follower 대기 한도 - None 이면 락 만료와 같음
+    single_flight_poll_interval: float = 0.05
+    single_flight_result_ttl: int = 60    # 초, leader 결과 게시 유지 기간
+
+    result_cache_enabled: bool = True
+    result_cache_ttl: int = 60 * 60 * 24 * 7   # 초, 추론 결과 캐시 유지 기간
     
     database_url: str = Field(..., env='DATABASE_URL')
     db_host: str = Field(..., env='DB_HOST')
@@ -16,6 +79,34 @@ class Settings(BaseSettings):
     postgres_password: str = Field(..., env='POSTGRES_PASSWORD')
     postgres_db: str = Field(..., env='POSTGRES_DB')
 
+    db_pool_min_size: int = 1
+    db_pool_max_size: int = 10
+    db_pool_acquire_timeout: float = 5.0  # 초
+
+    # ANN 인덱스 조회 파라미터 (인덱스 생성은 example_datas/setup_vector_index.py)
+    hnsw_ef_search: int = 40              # 클수록 recall ↑, 지연 ↑ (LIMIT 이상이어야 함)
+    ivfflat_probes: int = 10
+    # 회사·날짜 필터로 후보가 LIMIT 보다 적게 남으면 인덱스를 이어서 탐색 - pgvector 0.8 이상에서만 지정 ("" 이면 설정하지 않음)
+    hnsw_iterative_scan: str = ""             # off | relaxed_order | strict_order
+    # company_news.embedding 저장 형식 - example_datas/setup_company_news_data.py 와 같은 값이어야 함
+    # halfvec·이진 양자화 재정렬은 pgvector 0.7 이상 (docker-compose 의 pgvector/pgvector:pg15)
+    news_embedding_type: Literal["vector", "halfvec"] = "vector"   # halfvec: 16비트 float, 크기 절반
+    news_binary_rerank_candidates: int = 0    # >0 이면 이진 양자화 해밍 거리로 이만큼 추린 뒤 정확한 거리로 재정렬 (0 이면 끔)
+
+    # 회사 요약 검색 스냅샷 (services/company_snapshot.py) - 지정하면 회사 요약은 DB 대신 메모리에서 검색
+    company_snapshot_dir: str | None = None
+    company_snapshot_check_interval: float = 30.0   # 초, 새 스냅샷 버전 확인 주기 (hot reload)
+
+    # company_news 월 파티션 관리 (워커가 주기적으로 실행, 함수는 example_datas/setup_company_news_data.py 가 생성)
+    news_partition_maintenance_interval: float = 3600.0   # 초, 0 이면 워커에서 관리하지 않음
+    news_partition_premake_months: int = 3    # 이번 달 이후 미리 만들어 둘 파티션 수
+    news_retention_months: int = 24           # 이보다 오래된 월 파티션은 떼어냄 (0 이면 무제한, 컨텍스트 조회 기간 180일보다 길어야 함)
+    news_retention_drop: bool = False         # True 면 떼어낸 파티션을 삭제 (False 면 별도 테이블로 남겨 보관·백업)
+
+    company_map_refresh_interval: float = 300.0     # 초, 회사명→id 캐시 주기적 재적재
+    company_map_miss_refresh_interval: float = 5.0  # 초, 모르는 회사명이 들어왔을 때 증분 적재 최소 간격
+    company_fuzzy_match_threshold: float = 0.6      # 회사명 bigram Jaccard 유사도 하한 (정확 일치가 없을 때)
+
     redis_host: str = Field(..., env='REDIS_HOST')
     redis_port: str = Field(..., env='REDIS_PORT')
     redis_db: str = Field(..., env='REDIS_DB')
@@ -1,11 +1,244 @@
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+
+import asyncpg
+import numpy as np
 import psycopg2
-from contextlib import contextmanager
+from pgvector import Vector
+from pgvector.asyncpg import register_vector
+from psycopg2.extensions import adapt, register_adapter
+
 from backend.app.configs import settings
+from backend.app.error_codes import Err
+from backend.app.exceptions import AppError
+
+
+def _adapt_ndarray(value: np.ndarray):
+    # 캐시에서 읽은 float32 임베딩을 그대로 '%s::vector' 파라미터로 넘길 수 있도록
+    return adapt(Vector(value).to_text())
+
+register_adapter(np.ndarray, _adapt_ndarray)
+
+log = logging.getLogger(__name__)
+
+
+class DBPool:
+    """
+    psycopg2 커넥션 풀.
+    psycopg2.pool 은 한도 초과 시 즉시 PoolError 를 던지고 minconn 을 넘는 커넥션은 반납 때 닫아버리므로,
+    세마포어로 대기/타임아웃을 걸고 최대 max_size 개까지 유휴 커넥션을 재사용하도록 직접 관리합니다.
+    커넥션은 생성 시 열지 않고 warm() 이나 첫 acquire() 때 엽니다 (DB 가 죽어 있어도 API 는 기동).
+    """
+
+    def __init__(self, dsn: str, min_size: int, max_size: int, acquire_timeout: float):
+        self._dsn = dsn
+        self._idle: deque = deque()
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._lock = threading.Lock()
+        self.min_size = min_size
+        self.max_size = max_size
+        self.acquire_timeout = acquire_timeout
+
+        self._in_use = 0
+        self._waiting = 0
+        self._acquired = 0
+        self._timeouts = 0
+        self._acquire_ms_total = 0.0
+        self._acquire_ms_max = 0.0
+
+    def warm(self) -> int:
+        """유휴 커넥션을 min_size 개까지 미리 열어 둠 - 실패하면 경고만 남기고 첫 요청 때 다시 연결"""
+        opened = 0
+        while len(self._idle) + self._in_use < self.min_size:
+            try:
+                conn = psycopg2.connect(dsn=self._dsn)
+            except psycopg2.Error as e:
+                log.warning(f"DB 커넥션 사전 생성 실패 ({opened}/{self.min_size}): {e}")
+                break
+            with self._lock:
+                self._idle.append(conn)
+            opened += 1
+        return opened
+
+    def acquire(self):
+        start = time.perf_counter()
+        with self._lock:
+            self._waiting += 1
+        ok = self._slots.acquire(timeout=self.acquire_timeout)
+        with self._lock:
+            self._waiting -= 1
+            if not ok:
+                self._timeouts += 1
+        if not ok:
+            raise AppError(Err.DB_POOL_TIMEOUT, f"{self.acquire_timeout}s 내에 DB 커넥션을 얻지 못했습니다.")
+
+        try:
+            conn = self._take_idle() or psycopg2.connect(dsn=self._dsn)
+        except psycopg2.Error as e:
+            self._slots.release()
+            raise AppError(Err.DB_CONN_ERROR, f"DB 연결 실패: {e}")
+
+        elapsed_ms = (time.perf_counter() - start) * 1_000
+        with self._lock:
+            self._in_use += 1
+            self._acquired += 1
+            self._acquire_ms_total += elapsed_ms
+            self._acquire_ms_max = max(self._acquire_ms_max, elapsed_ms)
+        return conn
+
+    def _take_idle(self):
+        with self._lock:
+            while self._idle:
+                conn = self._idle.pop()
+                if not conn.closed:
+                    return conn
+        return None
+
+    def release(self, conn) -> None:
+        broken = bool(conn.closed)
+        if not broken:
+            try:
+                conn.rollback()             # 다음 사용자를 위해 트랜잭션 상태 초기화
+            except psycopg2.Error:
+                broken = True
+        with self._lock:
+            self._in_use -= 1
+            if not broken:
+                self._idle.append(conn)
+        if broken:
+            conn.close()
+        self._slots.release()
+
+    @contextmanager
+    def connection(self):
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "min_size": self.min_size,
+                "max_size": self.max_size,
+                "in_use": self._in_use,
+                "idle": len(self._idle),
+                "waiting": self._waiting,
+                "acquired_total": self._acquired,
+                "timeouts_total": self._timeouts,
+                "acquire_ms_avg": round(self._acquire_ms_total / self._acquired, 3) if self._acquired else 0.0,
+                "acquire_ms_max": round(self._acquire_ms_max, 3),
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            while self._idle:
+                self._idle.pop().close()
+
+
+_pool: DBPool | None = None
+_pool_lock = threading.Lock()
+
+
+def init_db_pool() -> DBPool:
+    """풀 생성 - main.py lifespan 에서 호출 (미호출 시 첫 사용 때 지연 생성)"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = DBPool(
+                dsn=settings.database_url,
+                min_size=settings.db_pool_min_size,
+                max_size=settings.db_pool_max_size,
+                acquire_timeout=settings.db_pool_acquire_timeout,
+            )
+        return _pool
+
+
+def close_db_pool() -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
+
+
+def get_db_pool() -> DBPool:
+    return _pool or init_db_pool()
+
 
 @contextmanager
 def get_db_connection():
-    connection = psycopg2.connect(dsn=settings.database_url)
+    with get_db_pool().connection() as connection:
+        yield connection
+
+
+_async_pool: asyncpg.Pool | None = None
+_async_pool_lock = asyncio.Lock()
+
+
+def vector_search_settings() -> dict[str, str]:
+    """ANN 인덱스 조회 GUC (psycopg2 는 트랜잭션마다 SET LOCAL, asyncpg 는 세션 설정으로 적용)"""
+    gucs = {
+        "hnsw.ef_search": str(settings.hnsw_ef_search),
+        "ivfflat.probes": str(settings.ivfflat_probes),
+    }
+    if settings.hnsw_iterative_scan:
+        gucs["hnsw.iterative_scan"] = settings.hnsw_iterative_scan
+    return gucs
+
+
+async def init_async_db_pool() -> asyncpg.Pool:
+    """asyncpg 풀 생성 - 커넥션마다 pgvector 코덱을 등록합니다."""
+    global _async_pool
+    async with _async_pool_lock:
+        if _async_pool is None:
+            _async_pool = await asyncpg.create_pool(
+                dsn=settings.database_url,
+                min_size=settings.db_pool_min_size,
+                max_size=settings.db_pool_max_size,
+                init=register_vector,
+                # asyncpg 커넥션은 기본 autocommit 이라 SET LOCAL 대신 세션 설정으로 적용
+                server_settings=vector_search_settings(),
+            )
+        return _async_pool
+
+
+async def close_async_db_pool() -> None:
+    global _async_pool
+    async with _async_pool_lock:
+        if _async_pool is not None:
+            await _async_pool.close()
+            _async_pool = None
+
+
+@asynccontextmanager
+async def get_async_db_connection():
+    try:
+        pool = _async_pool or await init_async_db_pool()
+    except (OSError, asyncpg.PostgresError) as e:
+        raise AppError(Err.DB_CONN_ERROR, f"DB 연결 실패: {e}")
+    try:
+        connection = await pool.acquire(timeout=settings.db_pool_acquire_timeout)
+    except asyncio.TimeoutError:
+        raise AppError(Err.DB_POOL_TIMEOUT, f"{settings.db_pool_acquire_timeout}s 내에 DB 커넥션을 얻지 못했습니다.")
     try:
         yield connection
     finally:
-        connection.close()
+        await pool.release(connection)
+
+
+def db_pool_stats() -> dict:
+    stats = _pool.stats() if _pool is not None else {"initialized": False}
+    if _async_pool is not None:
+        stats["async_pool"] = {
+            "min_size": _async_pool.get_min_size(),
+            "max_size": _async_pool.get_max_size(),
+            "size": _async_pool.get_size(),
+            "idle": _async_pool.get_idle_size(),
+        }
+    return stats
@@ -1,7 +1,21 @@
 from enum import Enum
+from typing import NamedTuple
 from starlette import status
 
+
+class ErrSpec(NamedTuple):
+    http: int
+    default_msg: str
+
+
 class Err(Enum):
-    NO_CONTEXT = (status.HTTP_424_FAILED_DEPENDENCY, "유효한 컨텍스트 없음")
-    LLM_ERROR = (status.HTTP_502_BAD_GATEWAY, "LLM 호출 실패")
-    DB_CONN_ERROR = (status.HTTP_500_INTERNAL_SERVER_ERROR, "DB 연결 실패")
\ No newline at end of file
+    NO_CONTEXT = ErrSpec(status.HTTP_424_FAILED_DEPENDENCY, "유효한 컨텍스트 없음")
+    LLM_ERROR = ErrSpec(status.HTTP_502_BAD_GATEWAY, "LLM 호출 실패")
+    DB_CONN_ERROR = ErrSpec(status.HTTP_500_INTERNAL_SERVER_ERROR, "DB 연결 실패")
+    DB_POOL_TIMEOUT = ErrSpec(status.HTTP_503_SERVICE_UNAVAILABLE, "DB 커넥션 대기 시간 초과")
+    EMBEDDING_ERROR = ErrSpec(status.HTTP_502_BAD_GATEWAY, "임베딩 생성 실패")
+    BATCH_TOO_LARGE = ErrSpec(status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, "배치 크기 초과")
+    JOB_NOT_FOUND = ErrSpec(status.HTTP_404_NOT_FOUND, "작업 없음")
+    JOB_NOT_READY = ErrSpec(status.HTTP_409_CONFLICT, "작업이 아직 끝나지 않음")
+    JOB_FAILED = ErrSpec(status.HTTP_409_CONFLICT, "작업 실패")
+    QUEUE_ERROR = ErrSpec(status.HTTP_503_SERVICE_UNAVAILABLE, "작업 큐 연결 실패")
@@ -2,21 +2,51 @@ from fastapi import FastAPI
 from backend.app.apis import api_router
 from backend.app.exceptions import AppError, http_error_handler, validation_error_handler
 from contextlib import asynccontextmanager
-from backend.app.clients.redis_client import rds
+from backend.app.clients.redis_client import rds, ards
+import logging
+
+from backend.app.db import init_db_pool, close_db_pool, init_async_db_pool, close_async_db_pool, get_db_pool
 from backend.app.configs import settings, setup_logging
+from backend.app.services.company_directory import company_directory
+from backend.app.services.company_snapshot import company_snapshot
+from backend.app.utils.tracing import trace_requests
+
+setup_logging(level=settings.log_level)
+log = logging.getLogger(__name__)
+
 
-setup_logging(level=settings.log_level if hasattr(settings, "log_level") else "DEBUG")
+def warm_company_directory() -> None:
+    """회사명 해석 인덱스를 미리 적재 - 실패해도 첫 요청에서 다시 시도하므로 기동은 계속"""
+    try:
+        with get_db_pool().connection() as conn:
+            company_directory.refresh(conn)
+        log.info(f"company directory 적재 완료: {company_directory.stats()}")
+    except Exception as e:
+        log.warning(f"company directory 사전 적재 실패: {e}")
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # DB 가 없어도 /health·/metrics 는 떠야 하므로 풀 준비 실패는 경고만 남기고 요청 시점에 다시 연결
+    init_db_pool().warm()
+    try:
+        await init_async_db_pool()
+    except Exception as e:
+        log.warning(f"asyncpg 풀 생성 실패: {e}")
+    warm_company_directory()
+    company_snapshot.get()
     try:
         yield
     finally:
+        close_db_pool()
+        await close_async_db_pool()
         rds.close()
+        await ards.aclose()
 
 app = FastAPI(title="My LLM API", version="0.1.0", lifespan=lifespan)
 
 app.add_exception_handler(AppError, http_error_handler)
 app.add_exception_handler(Exception, validation_error_handler)
 
+app.middleware("http")(trace_requests)
+
 app.include_router(api_router, prefix="/api")
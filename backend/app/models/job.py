@@ -0,0 +1,23 @@
+from typing import Literal, Optional
+from pydantic import BaseModel, Field
+
+from backend.app.models.response import ErrorDetail, InferenceResult
+
+
+class JobInfo(BaseModel):
+    job_id: str = Field(..., example="3f2b9c0e8d1a4b6f9e7c5d4a3b2c1d0e", description="작업 id")
+    status: Literal["queued", "running", "succeeded", "failed"] = Field(..., description="작업 상태")
+    attempts: int = Field(0, description="지금까지 시도한 횟수")
+    created_at: float = Field(..., description="생성 시각 (unix time)")
+    started_at: Optional[float] = Field(None, description="현재/마지막 시도 시작 시각")
+    finished_at: Optional[float] = Field(None, description="완료(성공 또는 최종 실패) 시각")
+    error: Optional[ErrorDetail] = Field(None, description="마지막 실패 정보 (재시도 중이면 직전 시도)")
+
+
+class JobResult(BaseModel):
+    job: JobInfo
+    result: InferenceResult
+
+
+class JobList(BaseModel):
+    jobs: list[JobInfo]
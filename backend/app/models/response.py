@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 from pydantic import BaseModel, Field
 
 class ExperienceTag(BaseModel):
@@ -8,3 +8,18 @@ class ExperienceTag(BaseModel):
 
 class InferenceResult(BaseModel):
     tags: List[ExperienceTag]
+
+
+class ErrorDetail(BaseModel):
+    code: str = Field(..., example="LLM_ERROR", description="에러 코드")
+    message: str = Field(..., example="LLM 호출 실패", description="에러 메시지")
+
+
+class BatchItemResult(BaseModel):
+    index: int = Field(..., example=0, description="요청 배열 내 지원자 순번")
+    result: Optional[InferenceResult] = Field(None, description="성공 시 추론 결과")
+    error: Optional[ErrorDetail] = Field(None, description="실패 시 에러 정보")
+
+
+class BatchInferenceResult(BaseModel):
+    results: List[BatchItemResult]
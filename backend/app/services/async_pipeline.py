@@ -0,0 +1,69 @@
+"""
+pipeline.py 의 비동기 버전.
+I/O 단계(임베딩·pgvector 조회·LLM 호출)만 코루틴으로 구현하고,
+CPU 단계(preprocess / build_prompt / postprocess)는 pipeline.py 의 것을 그대로 사용합니다.
+"""
+from typing import AsyncIterator, List
+
+from backend.app.clients.embed_cache import get_cached_embedding_async
+from backend.app.clients.openai_client import chat_completion_async, chat_completion_stream_async
+from backend.app.clients.single_flight import coalesce_shared_async
+from backend.app.exceptions import AppError
+from backend.app.error_codes import Err
+from backend.app.configs import settings
+from backend.app.services.company_directory import company_directory
+from backend.app.services.company_facts import tenure_facts_async
+from backend.app.services import pipeline
+from backend.app.services.pipeline import LLM_PARAMS, RequestContext, llm_flight_key
+from backend.app.utils import tracing
+from backend.app.utils.profiler import timed
+
+
+# pipeline.CONTEXT_SQL / NEWS_CONTEXT_SQL 과 동일 (asyncpg 위치 파라미터: $1 = 쿼리 벡터, $2 = company id 목록)
+CONTEXT_SQL = pipeline.CONTEXT_SQL.replace("%(vec)s", "$1").replace("%(ids)s", "$2")
+NEWS_CONTEXT_SQL = pipeline.NEWS_CONTEXT_SQL.replace("%(vec)s", "$1").replace("%(ids)s", "$2")
+
+@timed("⏱ retrieve_context_async")
+async def retrieve_context(text: str, company_names: list[str], db_conn) -> List[str]:
+    company_ids = await company_directory.resolve_ids_async(company_names, db_conn)
+    if not company_ids:
+        return []
+
+    query_vector = await get_cached_embedding_async(text)
+    snapshot = pipeline.snapshot_for([company_ids])
+    summaries = snapshot.search([query_vector], [company_ids])[0] if snapshot else []
+    rows = await db_conn.fetch(NEWS_CONTEXT_SQL if snapshot else CONTEXT_SQL, query_vector, company_ids)
+    tracing.set_attributes(**{"company.ids": len(company_ids), "db.rows": len(rows)})
+    return summaries + [row[1] for row in rows]
+
+@timed("⏱ load_company_facts_async")
+async def load_company_facts(req: RequestContext, db_conn) -> None:
+    if settings.rule_tagger_enabled:
+        req.tenures = await tenure_facts_async(req.tenure_windows(), db_conn)
+
+@timed("⏱ call_llm_async")
+async def call_llm(prompt: str) -> str:
+    try:
+        return await coalesce_shared_async(
+            llm_flight_key(prompt),
+            lambda: chat_completion_async(
+                messages=[{"role": "user", "content": prompt}],
+                **LLM_PARAMS,
+            ),
+        )
+    except Exception as e:
+        raise AppError(Err.LLM_ERROR, f"OpenAI 호출 실패: {e}")
+
+async def call_llm_stream(prompt: str) -> AsyncIterator[str]:
+    """
+    call_llm 의 스트리밍 버전 - 응답 조각을 도착하는 대로 전달합니다.
+    조각 단위로 흘려보내야 하므로 single-flight 병합은 하지 않습니다.
+    """
+    try:
+        async for delta in chat_completion_stream_async(
+            messages=[{"role": "user", "content": prompt}],
+            **LLM_PARAMS,
+        ):
+            yield delta
+    except Exception as e:
+        raise AppError(Err.LLM_ERROR, f"OpenAI 호출 실패: {e}")
@@ -0,0 +1,240 @@
+"""
+회사명 → company.id 해석기 (워커 프로세스 단위 in-memory 인덱스).
+
+company 행마다 여러 별칭을 정규화해 등록합니다.
+  - company.name, base_company_info 의 corpNameKr / corpNameEn
+  - homeUrl 의 도메인 이름 (toss.im → toss), seedProduct 의 제품명 (토스, 요기요 등)
+정규화 결과가 정확히 일치하면 그대로, 아니면 문자 bigram 역색인으로 후보를 모아
+Jaccard 유사도가 company_fuzzy_match_threshold 이상인 최상위 별칭을 사용합니다.
+
+- 시작 시(lifespan) 전체 적재, company_map_refresh_interval 초마다 전체 재적재(삭제 반영)
+- 모르는 이름이 들어오면 company_map_miss_refresh_interval 초 간격으로 제한해
+  마지막으로 읽은 id 이후의 행만 추가 적재(증분)
+
+적재할 때 규칙 기반 태깅용 사실(company.emp_count, company_event)도 함께 읽어 두고,
+facts_for() 는 DB 없이 메모리 인덱스만 조회합니다. (사실은 example_datas/setup_company_data.py 가 적재)
+"""
+import json
+import re
+import threading
+import time
+import unicodedata
+from collections import Counter
+from datetime import date
+from typing import NamedTuple
+
+from backend.app.configs import settings
+
+_LOAD_SQL = """
+    SELECT id, name,
+           data #> '{base_company_info,data,seedCorp}'    AS seed_corp,
+           data #> '{base_company_info,data,seedProduct}' AS seed_product,
+           emp_count,
+           (SELECT json_agg(json_build_array(e.event_date, e.kind, e.level) ORDER BY e.event_date)
+            FROM company_event e WHERE e.company_id = company.id) AS events
+    FROM company
+    WHERE id > %s
+    ORDER BY id
+"""
+_LOAD_SQL_ASYNC = _LOAD_SQL.replace("%s", "$1")
+
+# 별칭 우선순위 - 같은 별칭이 여러 회사에 걸리면 낮은 값이 이김
+_PRIO_NAME, _PRIO_DOMAIN, _PRIO_PRODUCT = 0, 1, 2
+
+_PAREN_RE = re.compile(r"\([^)]*\)|\[[^\]]*\]")
+_LEGAL_RE = re.compile(r"주식회사|유한회사|\b(?:co|ltd|inc|corp|corporation|company|llc|limited)\b")
+_NON_WORD_RE = re.compile(r"[\W_]+")
+
+
+def normalize_company_name(name: str) -> str:
+    """'(주)네이버', 'NAVER Corp.', 'VIVA REPUBLICA CO.,LTD.' → '네이버', 'naver', 'vivarepublica'"""
+    s = unicodedata.normalize("NFKC", name).lower()      # ㈜ → (주), 전각 → 반각
+    s = _PAREN_RE.sub(" ", s)
+    s = _LEGAL_RE.sub(" ", s)
+    return _NON_WORD_RE.sub("", s)
+
+
+def _grams(norm: str) -> set[str]:
+    padded = f"^{norm}$"
+    return {padded[i:i + 2] for i in range(len(padded) - 1)}
+
+
+def _domain_label(url: str | None) -> str | None:
+    """'https://www.millie.co.kr' → 'millie'"""
+    if not url:
+        return None
+    host = re.sub(r"^[a-z]+://", "", url.strip().lower()).split("/")[0]
+    host = host.removeprefix("www.")
+    return host.split(".")[0] or None
+
+
+def _as_obj(value):
+    # asyncpg 는 jsonb 를 문자열로 돌려줌
+    return json.loads(value) if isinstance(value, str) else value
+
+
+class CompanyEvent(NamedTuple):
+    date: date
+    kind: str               # funding | ipo | ma | grant
+    level: str              # series A, IPO, M&A ...
+
+
+class CompanyFacts(NamedTuple):
+    company_id: int
+    employees: int | None   # 현재 전체 직원 수 (empWholeVal)
+    events: tuple[CompanyEvent, ...]
+
+
+def parse_events(value) -> tuple[CompanyEvent, ...]:
+    return tuple(
+        CompanyEvent(date.fromisoformat(when[:10]), kind, level)
+        for when, kind, level in _as_obj(value) or ()
+    )
+
+
+def company_aliases(name: str, seed_corp, seed_product) -> list[tuple[str, int]]:
+    """company 행 하나에서 (별칭, 우선순위) 목록 추출"""
+    corp = _as_obj(seed_corp) or {}
+    products = _as_obj(seed_product) or []
+    if isinstance(products, dict):
+        products = [products]
+
+    aliases = [(name, _PRIO_NAME), (corp.get("corpNameKr"), _PRIO_NAME), (corp.get("corpNameEn"), _PRIO_NAME)]
+    aliases.append((_domain_label(corp.get("homeUrl")), _PRIO_DOMAIN))
+    for p in products:
+        aliases += [(p.get("prodNameKr"), _PRIO_PRODUCT), (p.get("prodNameEn"), _PRIO_PRODUCT)]
+    return [(a, prio) for a, prio in aliases if a]
+
+
+class _AliasIndex:
+    def __init__(self):
+        self.ids: dict[str, int] = {}           # 정규화 별칭 → company id
+        self.prio: dict[str, int] = {}
+        self.grams: dict[str, set[str]] = {}    # bigram → 정규화 별칭
+        self.size: dict[str, int] = {}          # 정규화 별칭 → bigram 수
+        self.companies: set[int] = set()
+        self.facts: dict[int, CompanyFacts] = {}
+        self.max_id = 0
+
+    def add_row(self, company_id: int, name: str, seed_corp, seed_product, emp_count=None, events=None) -> None:
+        self.companies.add(company_id)
+        self.facts[company_id] = CompanyFacts(company_id, emp_count, parse_events(events))
+        self.max_id = max(self.max_id, company_id)
+        for alias, prio in company_aliases(name, seed_corp, seed_product):
+            norm = normalize_company_name(alias)
+            if not norm or self.prio.get(norm, prio + 1) <= prio:
+                continue
+            self.ids[norm], self.prio[norm] = company_id, prio
+            grams = _grams(norm)
+            self.size[norm] = len(grams)
+            for g in grams:
+                self.grams.setdefault(g, set()).add(norm)
+
+    def lookup(self, name: str) -> int | None:
+        norm = normalize_company_name(name)
+        if not norm:
+            return None
+        if (company_id := self.ids.get(norm)) is not None:
+            return company_id
+        if len(norm) < 2:
+            return None
+
+        q = _grams(norm)
+        shared = Counter(alias for g in q for alias in self.grams.get(g, ()))
+        best, best_score = None, settings.company_fuzzy_match_threshold
+        for alias, n in shared.items():
+            score = n / (len(q) + self.size[alias] - n)
+            if score > best_score or (score == best_score and best is not None and self.prio[alias] < self.prio[best]):
+                best, best_score = alias, score
+        return self.ids[best] if best is not None else None
+
+
+class CompanyDirectory:
+    def __init__(self):
+        self._index = _AliasIndex()
+        self._loaded_at = float("-inf")         # 마지막 전체 적재
+        self._checked_at = float("-inf")        # 마지막 증분 적재
+        self._lock = threading.Lock()
+        self._stats = {"full_loads": 0, "incremental_loads": 0, "fuzzy_hits": 0, "misses": 0}
+
+    def _refresh_mode(self, names: list[str]) -> str | None:
+        now = time.monotonic()
+        if now - self._loaded_at >= settings.company_map_refresh_interval:
+            return "full"
+        if now - self._checked_at < settings.company_map_miss_refresh_interval:
+            return None
+        index = self._index
+        return "incremental" if any(normalize_company_name(n) not in index.ids for n in names) else None
+
+    def _apply(self, rows, full: bool) -> None:
+        with self._lock:
+            if full:
+                index = _AliasIndex()
+                for row in rows:
+                    index.add_row(*row)
+                self._index = index
+                self._loaded_at = time.monotonic()
+                self._stats["full_loads"] += 1
+            else:
+                for row in rows:
+                    self._index.add_row(*row)
+                self._stats["incremental_loads"] += 1
+            self._checked_at = time.monotonic()
+
+    def _lookup(self, names: list[str]) -> list[int]:
+        ids = []
+        with self._lock:
+            index = self._index
+            for name in names:
+                company_id = index.lookup(name)
+                if company_id is None:
+                    self._stats["misses"] += 1
+                    continue
+                if normalize_company_name(name) not in index.ids:
+                    self._stats["fuzzy_hits"] += 1
+                ids.append(company_id)
+        return list(dict.fromkeys(ids))
+
+    def facts_for(self, names: list[str]) -> list[CompanyFacts | None]:
+        """이름마다 회사 사실 (해석 못 한 이름은 None) - DB 를 읽지 않으므로 적재 전이면 전부 None"""
+        with self._lock:
+            index = self._index
+            return [
+                index.facts.get(company_id) if (company_id := index.lookup(name)) is not None else None
+                for name in names
+            ]
+
+    def _since(self, mode: str) -> int:
+        return 0 if mode == "full" else self._index.max_id
+
+    def refresh(self, db_conn, full: bool = True) -> None:
+        mode = "full" if full else "incremental"
+        with db_conn.cursor() as cursor:
+            cursor.execute(_LOAD_SQL, (self._since(mode),))
+            self._apply(cursor.fetchall(), full)
+
+    def resolve_ids(self, names: list[str], db_conn) -> list[int]:
+        """이름 목록 → 중복 제거된 company id 목록 (입력 순서 유지, 해석 못 한 이름은 제외)"""
+        if mode := self._refresh_mode(names):
+            self.refresh(db_conn, full=mode == "full")
+        return self._lookup(names)
+
+    async def resolve_ids_async(self, names: list[str], db_conn) -> list[int]:
+        if mode := self._refresh_mode(names):
+            rows = await db_conn.fetch(_LOAD_SQL_ASYNC, self._since(mode))
+            self._apply([tuple(r) for r in rows], mode == "full")
+        return self._lookup(names)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._loaded_at = float("-inf")
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"companies": len(self._index.companies), "aliases": len(self._index.ids), **self._stats}
+
+    def __len__(self) -> int:
+        return len(self._index.companies)
+
+
+company_directory = CompanyDirectory()
@@ -0,0 +1,166 @@
+"""
+재직 기간에 맞춘 회사 사실 조회.
+
+    company_month  (company_id, month) PK - 월별 직원 수·MAU(제품 합)·해당 연도 매출
+    company_event  (company_id, event_date) 인덱스 - 투자·IPO·M&A
+
+둘 다 example_datas/setup_company_data.py 가 company.data JSONB 에서 미리 뽑아 둔 표라
+요청 경로는 JSONB 를 읽지 않습니다.
+tenure_facts() 는 경력 여러 개의 (company_id, 기간)을 unnest 해 쿼리 한 번으로 조회하고,
+결과는 (company_id, 시작, 종료) 키로 프로세스 LRU 에 COMPANY_FACTS_CACHE_TTL 초 보관합니다.
+"""
+import calendar
+import json
+from datetime import date
+from typing import NamedTuple
+
+from backend.app.configs import settings
+from backend.app.models.candidate import Position
+from backend.app.services.company_directory import CompanyEvent, parse_events
+from backend.app.utils.lru_cache import LRUCache
+from backend.app.utils.metrics import cache_requests
+
+TENURE_SQL = """
+    SELECT w.idx,
+           (SELECT json_agg(json_build_array(m.month, m.headcount, m.mau, m.revenue) ORDER BY m.month)
+            FROM company_month m
+            WHERE m.company_id = w.company_id AND m.month BETWEEN w.start_date AND w.end_date) AS months,
+           (SELECT json_agg(json_build_array(e.event_date, e.kind, e.level) ORDER BY e.event_date)
+            FROM company_event e
+            WHERE e.company_id = w.company_id AND e.event_date BETWEEN w.start_date AND w.end_date) AS events
+    FROM unnest(%(idxs)s::int[], %(cids)s::int[], %(starts)s::date[], %(ends)s::date[])
+         AS w(idx, company_id, start_date, end_date)
+"""
+TENURE_SQL_ASYNC = (
+    TENURE_SQL.replace("%(idxs)s", "$1").replace("%(cids)s", "$2")
+    .replace("%(starts)s", "$3").replace("%(ends)s", "$4")
+)
+
+Window = tuple[int, date, date]     # (company_id, 시작 월 첫날, 종료 월 말일)
+
+
+class MonthFacts(NamedTuple):
+    month: date                     # 월 첫날
+    headcount: int | None
+    mau: int | None
+    revenue: int | None             # 해당 연도 매출 (연간)
+
+
+class TenureFacts(NamedTuple):
+    company_id: int
+    start: date
+    end: date
+    months: tuple[MonthFacts, ...]
+    events: tuple[CompanyEvent, ...]
+
+    @property
+    def headcounts(self) -> list[int]:
+        return [m.headcount for m in self.months if m.headcount is not None]
+
+    @property
+    def peak_headcount(self) -> int | None:
+        return max(self.headcounts, default=None)
+
+    @property
+    def headcount_growth(self) -> float | None:
+        """기간 첫 달 대비 마지막 달 직원 수 증가율 (데이터가 2개월 미만이면 None)"""
+        counts = self.headcounts
+        if len(counts) < 2 or counts[0] <= 0:
+            return None
+        return counts[-1] / counts[0] - 1
+
+
+local_cache: LRUCache = LRUCache(
+    max_entries=settings.company_facts_cache_max_entries,
+    max_bytes=settings.company_facts_cache_max_entries * 2048,
+    ttl=settings.company_facts_cache_ttl,
+)
+
+
+def tenure_window(p: Position, today: date | None = None) -> tuple[date, date] | None:
+    """startEndDate → (시작 월 첫날, 종료 월 말일) - 종료가 없으면 재직 중(오늘까지), 시작이 없으면 None"""
+    start = p.startEndDate.get("start") or {}
+    if "year" not in start:
+        return None
+    end = p.startEndDate.get("end") or {}
+    if "year" in end:
+        end_year, end_month = end["year"], end.get("month") or 12
+    else:
+        today = today or date.today()
+        end_year, end_month = today.year, today.month
+    return (
+        date(start["year"], start.get("month") or 1, 1),
+        date(end_year, end_month, calendar.monthrange(end_year, end_month)[1]),
+    )
+
+
+def _as_obj(value):
+    # asyncpg 는 json 을 문자열로 돌려줌
+    return json.loads(value) if isinstance(value, str) else value
+
+
+def _parse_row(window: Window, months, events) -> TenureFacts:
+    return TenureFacts(
+        window[0], window[1], window[2],
+        tuple(MonthFacts(date.fromisoformat(m[:10]), h, mau, rev) for m, h, mau, rev in _as_obj(months) or ()),
+        parse_events(events),
+    )
+
+
+def _from_cache(windows: list[Window | None]) -> tuple[list[TenureFacts | None], list[int]]:
+    """캐시 결과와 조회가 필요한 위치"""
+    found: list[TenureFacts | None] = [None] * len(windows)
+    missing = []
+    for i, window in enumerate(windows):
+        if window is None:
+            continue
+        if (cached := local_cache.get(window)) is not None:
+            found[i] = cached
+        else:
+            missing.append(i)
+    hits = sum(1 for w in windows if w is not None) - len(missing)
+    if hits:
+        cache_requests.labels(cache="company_facts", result="hit").inc(hits)
+    if missing:
+        cache_requests.labels(cache="company_facts", result="miss").inc(len(missing))
+    return found, missing
+
+
+def _store(found: list[TenureFacts | None], windows: list[Window | None], rows) -> list[TenureFacts | None]:
+    for idx, months, events in rows:
+        facts = _parse_row(windows[idx], months, events)
+        local_cache.put(windows[idx], facts, 64 * (1 + len(facts.months) + len(facts.events)))
+        found[idx] = facts
+    return found
+
+
+def _params(windows: list[Window | None], missing: list[int]) -> tuple[list, list, list, list]:
+    return (
+        missing,
+        [windows[i][0] for i in missing],
+        [windows[i][1] for i in missing],
+        [windows[i][2] for i in missing],
+    )
+
+
+def tenure_facts(windows: list[Window | None], db_conn) -> list[TenureFacts | None]:
+    """기간별 회사 사실 (입력 순서 유지, None 인 기간은 None) - 캐시에 없는 기간만 쿼리 1회로 조회"""
+    found, missing = _from_cache(windows)
+    if not missing:
+        return found
+    idxs, cids, starts, ends = _params(windows, missing)
+    with db_conn.cursor() as cursor:
+        cursor.execute(TENURE_SQL, {"idxs": idxs, "cids": cids, "starts": starts, "ends": ends})
+        return _store(found, windows, cursor.fetchall())
+
+
+async def tenure_facts_async(windows: list[Window | None], db_conn) -> list[TenureFacts | None]:
+    found, missing = _from_cache(windows)
+    if not missing:
+        return found
+    rows = await db_conn.fetch(TENURE_SQL_ASYNC, *_params(windows, missing))
+    return _store(found, windows, [tuple(r) for r in rows])
+
+
+def company_facts_cache_stats() -> dict:
+    return local_cache.stats()
@@ -0,0 +1,227 @@
+"""
+회사 요약 검색용 메모리 매핑 스냅샷.
+
+company 테이블은 작고 거의 읽기 전용이라, retrieve_context 의 회사 요약 부분(part=0)을
+Postgres 왕복 없이 프로세스 메모리에서 계산합니다. (뉴스 부분은 그대로 SQL)
+
+    python -m backend.app.services.company_snapshot [--dir /data/company_snapshot]    # 내보내기
+
+COMPANY_SNAPSHOT_DIR 구성
+    manifest.json           현재 버전 - id·이름·요약·차원·행렬 파일명 (임시 파일에 쓴 뒤 os.replace)
+    vectors-<version>.npy   (N, dim) float32, 행마다 L2 정규화된 임베딩
+
+API·워커 프로세스는 행렬을 np.load(mmap_mode="r") 로 열어 같은 파일의 페이지 캐시를 공유하고,
+COMPANY_SNAPSHOT_CHECK_INTERVAL 초마다 manifest 가 바뀌었는지 확인해 새 버전으로 교체합니다.
+검색은 정규화된 쿼리 행렬과의 내적 한 번 (코사인 거리 = 1 - 내적, pgvector <=> 와 같은 순서).
+스냅샷을 만든 뒤 추가된 회사가 섞인 요청은 SQL 경로를 그대로 씁니다.
+"""
+import argparse
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+
+from backend.app.configs import settings, setup_logging
+from backend.app.db import close_db_pool, get_db_connection, init_db_pool
+
+log = logging.getLogger(__name__)
+
+MANIFEST = "manifest.json"
+TOP_K = 5                   # 지원자당 회사 요약 수 (pipeline.CONTEXT_SQL 의 LIMIT 도 이 값)
+KEEP_VERSIONS = 2           # 이전 manifest 를 읽은 프로세스가 열 수 있도록 직전 행렬 하나는 남김
+
+_EXPORT_SQL = """
+    SELECT id, name, summary_text, embedding::real[]
+    FROM company
+    ORDER BY id
+"""
+
+
+class CompanySnapshot:
+    """한 버전의 스냅샷 (읽기 전용)"""
+
+    def __init__(self, version: str, ids: list[int], names: list[str], summaries: list[str],
+                 matrix: np.ndarray, no_embedding: list[int]):
+        self.version = version
+        self.names = names
+        self.summaries = summaries
+        self.matrix = matrix
+        self.rows = {company_id: row for row, company_id in enumerate(ids)}
+        self.known = self.rows.keys() | set(no_embedding)
+
+    @property
+    def dim(self) -> int:
+        return self.matrix.shape[1]
+
+    def covers(self, company_ids: list[int]) -> bool:
+        """모든 회사가 스냅샷에 있으면 True (임베딩 없는 회사 포함)"""
+        return all(cid in self.known for cid in company_ids)
+
+    def search(self, query_vectors: list[np.ndarray], ids_list: list[list[int]], k: int = TOP_K) -> list[list[str]]:
+        """
+        쿼리마다 해당 회사들 중 코사인 거리가 가까운 순 요약 k 개.
+        필요한 행만 모아 (쿼리 수 × 회사 수) 내적을 한 번에 계산합니다.
+        """
+        rows = sorted({self.rows[cid] for ids in ids_list for cid in ids if cid in self.rows})
+        if not rows:
+            return [[] for _ in ids_list]
+        queries = np.array(query_vectors, dtype=np.float32, ndmin=2)
+        queries /= np.maximum(np.linalg.norm(queries, axis=1, keepdims=True), 1e-12)
+        scores = queries @ self.matrix[rows].T
+        col = {row: i for i, row in enumerate(rows)}
+
+        results = []
+        for q, ids in enumerate(ids_list):
+            mine = [self.rows[cid] for cid in dict.fromkeys(ids) if cid in self.rows]
+            s = scores[q, [col[r] for r in mine]]
+            top = np.argsort(-s, kind="stable")[:k]
+            results.append([self.summaries[mine[i]] for i in top])
+        return results
+
+
+def load_snapshot(directory: str | Path) -> CompanySnapshot:
+    """스냅샷 디렉터리의 현재 버전 적재 (행렬은 메모리 매핑)"""
+    directory = Path(directory)
+    manifest = json.loads((directory / MANIFEST).read_text(encoding="utf-8"))
+    matrix = np.load(directory / manifest["matrix"], mmap_mode="r")
+    if matrix.shape != (len(manifest["ids"]), manifest["dim"]):
+        raise ValueError(f"스냅샷 행렬 크기 불일치: {matrix.shape}")
+    return CompanySnapshot(
+        manifest["version"], manifest["ids"], manifest["names"], manifest["summaries"],
+        matrix, manifest.get("no_embedding", []),
+    )
+
+
+class SnapshotStore:
+    """현재 스냅샷 보관 - get() 이 주기적으로 manifest 변경을 확인해 교체 (hot reload)"""
+
+    def __init__(self):
+        self._snapshot: CompanySnapshot | None = None
+        self._signature = None                  # manifest (inode, mtime_ns, size) - os.replace 마다 inode 가 바뀜
+        self._checked_at = float("-inf")
+        self._lock = threading.Lock()
+        self._stats = {"loads": 0, "load_errors": 0}
+
+    def _manifest_signature(self, directory: Path):
+        try:
+            st = (directory / MANIFEST).stat()
+        except FileNotFoundError:
+            return None
+        return st.st_ino, st.st_mtime_ns, st.st_size
+
+    def get(self) -> CompanySnapshot | None:
+        """현재 스냅샷 (COMPANY_SNAPSHOT_DIR 미설정·스냅샷 없음이면 None)"""
+        if not settings.company_snapshot_dir:
+            return None
+        now = time.monotonic()
+        if now - self._checked_at < settings.company_snapshot_check_interval:
+            return self._snapshot
+        with self._lock:
+            if now - self._checked_at >= settings.company_snapshot_check_interval:
+                self._reload_if_changed(Path(settings.company_snapshot_dir))
+                self._checked_at = now
+        return self._snapshot
+
+    def _reload_if_changed(self, directory: Path) -> None:
+        signature = self._manifest_signature(directory)
+        if signature is None or signature == self._signature:
+            return
+        try:
+            snapshot = load_snapshot(directory)
+        except Exception as e:              # 쓰는 중이거나 깨진 스냅샷 - 이전 버전 유지
+            self._stats["load_errors"] += 1
+            log.warning(f"company snapshot 적재 실패: {e}")
+            return
+        self._snapshot, self._signature = snapshot, signature
+        self._stats["loads"] += 1
+        log.info(f"company snapshot {snapshot.version} 적재: {len(snapshot.rows)}개 회사")
+
+    def stats(self) -> dict:
+        snapshot = self._snapshot
+        return {
+            "version": snapshot.version if snapshot else None,
+            "companies": len(snapshot.known) if snapshot else 0,
+            "vectors": len(snapshot.rows) if snapshot else 0,
+            **self._stats,
+        }
+
+
+company_snapshot = SnapshotStore()
+
+
+def write_snapshot(directory: str | Path, ids: list[int], names: list[str], summaries: list[str],
+                   vectors: list | None, no_embedding: list[int] = ()) -> str:
+    """
+    스냅샷 쓰기 → 버전. 내용이 같으면 다시 쓰지 않습니다.
+    행렬 파일을 먼저 쓰고 manifest 를 원자적으로 교체하므로 읽는 쪽은 항상 완전한 버전만 봅니다.
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    if ids:
+        matrix = np.array(vectors, dtype=np.float32)
+        matrix /= np.maximum(np.linalg.norm(matrix, axis=1, keepdims=True), 1e-12)
+    else:
+        matrix = np.zeros((0, 0), dtype=np.float32)
+
+    digest = hashlib.sha256(matrix.tobytes())
+    digest.update(json.dumps([ids, names, summaries, list(no_embedding)], ensure_ascii=False).encode())
+    version = digest.hexdigest()[:16]
+    current = directory / MANIFEST
+    if current.exists() and json.loads(current.read_text(encoding="utf-8")).get("version") == version:
+        return version
+
+    matrix_name = f"vectors-{version}.npy"
+    np.save(directory / f".tmp-{matrix_name}", matrix)
+    os.replace(directory / f".tmp-{matrix_name}", directory / matrix_name)
+    manifest = {
+        "version": version, "created_at": time.time(), "dim": int(matrix.shape[1]),
+        "matrix": matrix_name, "ids": ids, "names": names, "summaries": summaries,
+        "no_embedding": list(no_embedding),
+    }
+    tmp = directory / f"{MANIFEST}.tmp"
+    tmp.write_text(json.dumps(manifest, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp, current)
+
+    old = sorted(directory.glob("vectors-*.npy"), key=lambda p: p.stat().st_mtime, reverse=True)
+    for path in old[KEEP_VERSIONS:]:
+        path.unlink(missing_ok=True)
+    return version
+
+
+def export_snapshot(db_conn, directory: str | Path) -> str:
+    """company 테이블 → 스냅샷"""
+    with db_conn.cursor() as cursor:
+        cursor.execute(_EXPORT_SQL)
+        rows = cursor.fetchall()
+    embedded = [r for r in rows if r[3] is not None]
+    return write_snapshot(
+        directory,
+        ids=[r[0] for r in embedded],
+        names=[r[1] for r in embedded],
+        summaries=[r[2] or "" for r in embedded],
+        vectors=[r[3] for r in embedded],
+        no_embedding=[r[0] for r in rows if r[3] is None],
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="회사 요약 검색 스냅샷 내보내기")
+    parser.add_argument("--dir", default=settings.company_snapshot_dir, required=not settings.company_snapshot_dir)
+    args = parser.parse_args()
+    setup_logging(level=settings.log_level)
+    init_db_pool()
+    try:
+        with get_db_connection() as conn:
+            version = export_snapshot(conn, args.dir)
+        log.info(f"company snapshot {version} → {args.dir}")
+    finally:
+        close_db_pool()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""
+company_news 월 파티션 관리.
+
+company_news 는 news_date 로 월 단위 RANGE 파티션된 테이블이고 (company_news_pYYYYMM),
+파티션 생성·보존 정책은 DB 함수 company_news_maintain() 에 있습니다. (example_datas/setup_company_news_data.py)
+워커가 NEWS_PARTITION_MAINTENANCE_INTERVAL 마다 호출해
+- 이번 달부터 NEWS_PARTITION_PREMAKE_MONTHS 개월 뒤까지 파티션을 미리 만들고
+- NEWS_RETENTION_MONTHS 개월보다 오래된 파티션을 떼어냄 (NEWS_RETENTION_DROP 이면 삭제)
+여러 워커가 동시에 호출해도 함수 안의 advisory lock 으로 한 번씩만 적용됩니다.
+"""
+import logging
+
+from backend.app.configs import settings
+
+log = logging.getLogger(__name__)
+
+# 보존 기준은 이번 달 첫날 - N 개월이라, 6 개월이면 컨텍스트 조회 기간(최근 180일)이 항상 남음
+MIN_RETENTION_MONTHS = 6
+
+MAINTAIN_SQL = "SELECT action, partition_name FROM company_news_maintain(%s, %s, %s)"
+
+
+def maintain_news_partitions(db_conn) -> list[tuple[str, str]]:
+    """파티션 생성·보존 정책 적용 → [(created|detached|dropped, 파티션 이름)]"""
+    if 0 < settings.news_retention_months < MIN_RETENTION_MONTHS:
+        log.warning(f"NEWS_RETENTION_MONTHS 가 {MIN_RETENTION_MONTHS} 보다 작아 최근 180일 뉴스 일부가 빠질 수 있습니다.")
+    with db_conn.cursor() as cursor:
+        cursor.execute(MAINTAIN_SQL, (
+            settings.news_partition_premake_months,
+            settings.news_retention_months,
+            settings.news_retention_drop,
+        ))
+        actions = [(action, name) for action, name in cursor.fetchall()]
+    # 풀 반환 시 rollback 되므로 직접 commit
+    db_conn.commit()
+    for action, name in actions:
+        log.info(f"company_news 파티션 {name}: {action}")
+    return actions
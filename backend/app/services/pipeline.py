@@ -1,12 +1,53 @@
+import contextvars
+import hashlib
+import json
+import logging
+import re
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from functools import cached_property, lru_cache
 from typing import List
 
+from backend.app.configs import settings
 from backend.app.models.candidate import Candidate
+from backend.app.models.response import BatchItemResult, ErrorDetail, InferenceResult
 from backend.app.clients.openai_client import chat_completion
+from backend.app.db import vector_search_settings
 from backend.app.exceptions import AppError
 from backend.app.error_codes import Err
-from backend.app.clients.embed_cache import get_cached_embedding
+from backend.app.clients.embed_cache import get_cached_embedding, get_cached_embeddings
+from backend.app.clients.result_cache import get_cached_results, set_cached_result
+from backend.app.clients.single_flight import coalesce_shared
+from backend.app.services.company_directory import CompanyFacts, company_directory
+from backend.app.services.company_snapshot import TOP_K as COMPANY_TOP_K, CompanySnapshot, company_snapshot
+from backend.app.services.company_facts import TenureFacts, Window, tenure_facts, tenure_window
+from backend.app.services.rule_tagger import NO_RULES, RULES_VERSION, RuleOutcome, apply_rules
+from backend.app.utils import metrics, tracing
 from backend.app.utils.profiler import timed
+from backend.app.utils.tokens import count_tokens, tokenizer_name
 
+log = logging.getLogger(__name__)
+
+
+def format_education(edu) -> str:
+    return f"[EDU] {edu.schoolName} ({edu.degreeName} · {edu.fieldOfStudy})"
+
+def format_position(p, description: str | None = None) -> str:
+    """[EXP] 블록 하나 - description 을 넘기면 원문 대신 사용 (프롬프트 예산 축약용)"""
+    sd = p.startEndDate.get('start', {})
+    start = f"{sd['year']}.{sd['month']:02d}"
+    ed = p.startEndDate.get('end', {})
+    end = f"{ed['year']}.{ed['month']:02d}" if ed else "현재"
+
+    return (
+        "[EXP]\n"
+        f"  회사(companyName): {p.companyName}\n"
+        f"  직책(title): {p.title}\n"
+        f"  기간(period): {start}–{end}\n"
+        f"  지역(location): {p.companyLocation}\n"
+        f"  설명(description): {p.description if description is None else description}"
+    )
 
 @timed("⏱ preprocess")
 def preprocess(candidate: Candidate) -> str:
@@ -14,25 +55,11 @@ def preprocess(candidate: Candidate) -> str:
 
     # 학력
     for edu in candidate.educations:
-        lines.append(
-            f"[EDU] {edu.schoolName} ({edu.degreeName} · {edu.fieldOfStudy})"
-        )
+        lines.append(format_education(edu))
 
     # 경력
     for p in candidate.positions:
-        sd = p.startEndDate.get('start', {})
-        start = f"{sd['year']}.{sd['month']:02d}"
-        ed = p.startEndDate.get('end', {})
-        end = f"{ed['year']}.{ed['month']:02d}" if ed else "현재"
-
-        lines.append(
-            "[EXP]\n"
-            f"  회사(companyName): {p.companyName}\n"
-            f"  직책(title): {p.title}\n"
-            f"  기간(period): {start}–{end}\n"
-            f"  지역(location): {p.companyLocation}\n"
-            f"  설명(description): {p.description}"
-        )
+        lines.append(format_position(p))
 
     # 스킬 / 요약
     if candidate.skills:
@@ -46,38 +73,181 @@ def preprocess(candidate: Candidate) -> str:
 def extract_company_names_from_text(candidate: Candidate) -> list[str]:
     return [p.companyName for p in candidate.positions]
 
+def set_vector_search_params(cursor) -> None:
+    """ANN 인덱스 조회 파라미터를 현재 트랜잭션에만 적용 (SET LOCAL)"""
+    gucs = vector_search_settings()
+    cursor.execute(
+        "SELECT " + ", ".join(["set_config(%s, %s, true)"] * len(gucs)),
+        tuple(x for item in gucs.items() for x in item),
+    )
+
+# 회사 요약(part=0)과 최근 뉴스(part=1)를 한 번의 왕복으로 조회.
+# 회사 필터는 이름 대신 미리 해석한 company id 로 걸어 (company_id, news_date) 인덱스를 사용합니다.
+# company_news.embedding 은 vector 또는 halfvec (NEWS_EMBEDDING_TYPE) - 쿼리 벡터를 같은 형식으로 캐스트
+NEWS_EMBEDDING_DIM = 1536
+_NEWS_VEC_CAST = "::halfvec" if settings.news_embedding_type == "halfvec" else ""
+
+
+def _news_ranked_sql(cols: str, vec: str, where: str) -> str:
+    """
+    최근 뉴스 거리순 10건.
+    NEWS_BINARY_RERANK_CANDIDATES 가 있으면 이진 양자화 벡터의 해밍 거리(<~>)로 후보를 먼저 추리고
+    그 후보만 정확한 코사인 거리로 재정렬합니다.
+    """
+    candidates = settings.news_binary_rerank_candidates
+    if not candidates:
+        return f"""
+        SELECT {cols}title AS text, embedding <=> {vec} AS dist
+        FROM company_news n
+        WHERE {where}
+        ORDER BY dist
+        LIMIT 10"""
+    return f"""
+        SELECT {cols}c.text, c.embedding <=> {vec} AS dist
+        FROM (
+            SELECT title AS text, embedding
+            FROM company_news n
+            WHERE {where}
+            ORDER BY binary_quantize(embedding)::bit({NEWS_EMBEDDING_DIM}) <~> binary_quantize({vec})
+            LIMIT {max(candidates, 10)}
+        ) c
+        ORDER BY dist
+        LIMIT 10"""
+
+
+_NEWS_CONTEXT_SQL = _news_ranked_sql(
+    "1 AS part, ",
+    f"%(vec)s::vector{_NEWS_VEC_CAST}",
+    """n.company_id = ANY(%(ids)s::int[])
+            AND n.news_date >= CURRENT_DATE - INTERVAL '180 days'
+            AND n.embedding IS NOT NULL""",
+) + "\n    "
+CONTEXT_SQL = f"""
+    (
+        SELECT 0 AS part, summary_text AS text, embedding <=> %(vec)s::vector AS dist
+        FROM company
+        WHERE id = ANY(%(ids)s::int[])
+            AND embedding IS NOT NULL
+        ORDER BY dist
+        LIMIT {COMPANY_TOP_K}
+    )
+    UNION ALL
+    ({_NEWS_CONTEXT_SQL})
+    ORDER BY part, dist;
+"""
+# 회사 요약을 메모리 스냅샷(services/company_snapshot.py)에서 계산할 때는 뉴스만 조회
+NEWS_CONTEXT_SQL = _NEWS_CONTEXT_SQL
+
+
+def snapshot_for(ids_list: list[list[int]]) -> CompanySnapshot | None:
+    """모든 회사를 담은 스냅샷이 있으면 반환 - 없으면 회사 요약도 SQL 로"""
+    snapshot = company_snapshot.get()
+    if snapshot is None:
+        return None
+    hit = all(snapshot.covers(ids) for ids in ids_list)
+    metrics.cache_requests.labels(cache="company_snapshot", result="hit" if hit else "miss").inc()
+    return snapshot if hit else None
+
 @timed("⏱ retrieve_context")
 def retrieve_context(text: str,  company_names: list[str], db_conn) -> List[str]:
+    company_ids = company_directory.resolve_ids(company_names, db_conn)
+    if not company_ids:
+        return []
+
     query_vector = get_cached_embedding(text)
+    snapshot = snapshot_for([company_ids])
+    summaries = snapshot.search([query_vector], [company_ids])[0] if snapshot else []
 
     with db_conn.cursor() as cursor:
-        cursor.execute(
-            """
-            SELECT summary_text
-            FROM company
-            WHERE embedding IS NOT NULL
-                AND name = ANY(%s)
-            ORDER BY embedding <=> %s::vector
-            LIMIT 5;
-            """, (company_names, query_vector,)
-        )
-        summaries = [row[0] for row in cursor.fetchall()]
-
-        cursor.execute(
-            """
-            SELECT title
-            FROM company_news
-            WHERE company_id IN (
-                SELECT id FROM company WHERE name = ANY(%s::text[])
-            )
-                AND news_date >= CURRENT_DATE - INTERVAL '180 days'
-            ORDER BY embedding <=> %s::vector
-            LIMIT 10
-            """,
-            (company_names, query_vector),
-        )
-        news_titles = [row[0] for row in cursor.fetchall()]
-        return summaries + news_titles
+        set_vector_search_params(cursor)
+        cursor.execute(NEWS_CONTEXT_SQL if snapshot else CONTEXT_SQL, {"ids": company_ids, "vec": query_vector})
+        rows = cursor.fetchall()
+    tracing.set_attributes(**{"company.ids": len(company_ids), "db.rows": len(rows)})
+    return summaries + [row[1] for row in rows]
+
+
+def _vector_literal(vec: list[float]) -> str:
+    """pgvector 텍스트 표현('[0.1,0.2,...]')으로 변환 - text[] 로 묶어 전달하기 위함"""
+    return "[" + ",".join(map(str, vec)) + "]"
+
+# CONTEXT_SQL 의 다건 버전 - 지원자별 (idx, 쿼리 벡터)와 (idx, company id)를 unnest 해 LATERAL 조인
+_CONTEXTS_CTE = """
+    WITH q AS (
+        SELECT idx, vec::vector AS vec
+        FROM unnest(%(idxs)s::int[], %(vecs)s::text[]) AS u(idx, vec)
+    ), qc AS (
+        SELECT idx, company_id
+        FROM unnest(%(cidxs)s::int[], %(cids)s::int[]) AS u(idx, company_id)
+    )
+"""
+_NEWS_CONTEXTS_SQL = f"""
+    SELECT q.idx, 1 AS part, s.text, s.dist
+    FROM q
+    CROSS JOIN LATERAL ({_news_ranked_sql(
+        "",
+        f"q.vec{_NEWS_VEC_CAST}",
+        """n.company_id IN (SELECT qc.company_id FROM qc WHERE qc.idx = q.idx)
+            AND n.news_date >= CURRENT_DATE - INTERVAL '180 days'
+            AND n.embedding IS NOT NULL""",
+    )}
+    ) s
+"""
+CONTEXTS_SQL = f"""{_CONTEXTS_CTE}
+    SELECT q.idx, 0 AS part, s.text, s.dist
+    FROM q
+    CROSS JOIN LATERAL (
+        SELECT c.summary_text AS text, c.embedding <=> q.vec AS dist
+        FROM company c
+        WHERE c.id IN (SELECT qc.company_id FROM qc WHERE qc.idx = q.idx)
+            AND c.embedding IS NOT NULL
+        ORDER BY dist
+        LIMIT {COMPANY_TOP_K}
+    ) s
+    UNION ALL{_NEWS_CONTEXTS_SQL}
+    ORDER BY idx, part, dist;
+"""
+NEWS_CONTEXTS_SQL = f"{_CONTEXTS_CTE}{_NEWS_CONTEXTS_SQL}    ORDER BY idx, part, dist;\n"
+
+@timed("⏱ retrieve_contexts")
+def retrieve_contexts(texts: list[str], company_names_list: list[list[str]], db_conn) -> List[List[str]]:
+    """
+    retrieve_context 의 다건 버전.
+    임베딩은 한 번의 다건 호출로, 회사/뉴스 검색은 지원자 전체를 unnest 한
+    LATERAL 조인 쿼리 1개로 처리합니다. 결과는 입력 순서와 동일합니다.
+    회사 스냅샷이 있으면 회사 요약은 지원자 전체를 내적 한 번으로 계산하고 쿼리는 뉴스만 조회합니다.
+    """
+    ids_list = [company_directory.resolve_ids(names, db_conn) for names in company_names_list]
+    contexts: list[list[str]] = [[] for _ in texts]
+    targets = [i for i, ids in enumerate(ids_list) if ids]
+    if not targets:
+        return contexts
+
+    try:
+        query_vectors = get_cached_embeddings([texts[i] for i in targets])
+    except Exception as e:
+        raise AppError(Err.EMBEDDING_ERROR, f"임베딩 생성 실패: {e}")
+
+    params = {
+        "idxs": targets,
+        "vecs": [_vector_literal(v) for v in query_vectors],
+        "cidxs": [i for i in targets for _ in ids_list[i]],
+        "cids": [cid for i in targets for cid in ids_list[i]],
+    }
+
+    snapshot = snapshot_for([ids_list[i] for i in targets])
+    if snapshot:
+        for i, summaries in zip(targets, snapshot.search(query_vectors, [ids_list[i] for i in targets])):
+            contexts[i].extend(summaries)
+
+    with db_conn.cursor() as cursor:
+        set_vector_search_params(cursor)
+        cursor.execute(NEWS_CONTEXTS_SQL if snapshot else CONTEXTS_SQL, params)
+        rows = cursor.fetchall()
+    for idx, _part, text, _dist in rows:
+        contexts[idx].append(text)
+    tracing.set_attributes(**{"company.ids": len(params["cids"]), "db.rows": len(rows)})
+
+    return contexts
 
 
 _TAG_LIST = [
@@ -85,26 +255,23 @@ _TAG_LIST = [
     "대용량 데이터 처리 경험", "IPO", "M&A 경험", "신규 투자 유치 경험",
 ]
 
-@timed("⏱ build_prompt")
-def build_prompt(candidate: Candidate, contexts: list[str]) -> str:
-    ctx_block = "\n".join(f"- {c}" for c in contexts) or "(관련 회사 정보 없음)"
+# build_prompt 템플릿을 바꾸면 올려주세요 - 결과 캐시 키에 포함됩니다.
+PROMPT_VERSION = "v1"
 
-    tag_list_block = "\n".join(f"- {t}" for t in _TAG_LIST)
-
-    return f"""
+_PROMPT_TEMPLATE = """
         당신은 HR 분석 전문가입니다. 아래 **지원자 전처리 텍스트**와
         보조 **컨텍스트**(회사·뉴스)를 참고하여 ‘경험 tag–evidence’를 추출하십시오.
 
         ### 지원자 전처리 텍스트
-        {preprocess(candidate)}
+        {text}
         ### 컨텍스트 (회사/뉴스, 최근 180 일)
-        {ctx_block}
+        {contexts}
         ### tag-evidence 규칙
         1. 리더쉽 tag에 대한 evidence는 [EXP] 내 직책(title)을 기반으로 추론하여 활용
 
         **규칙**
         1. 선택 가능한 태그 ↓  
-        {tag_list_block}
+        {tags}
 
         2. **증거(evidence) 문장은 지원자 전처리 텍스트에 존재하는 내용을
         그대로 인용**(필요시 동일 문장 일부만 잘라 사용).  
@@ -128,22 +295,325 @@ def build_prompt(candidate: Candidate, contexts: list[str]) -> str:
         }}
         """
 
+
+def _compile_prompt(template: str, tags: tuple[str, ...]) -> tuple[str, str, str]:
+    """{text}/{contexts} 자리로 나눈 정적 조각 3개 - 태그 목록은 여기서 한 번만 렌더링"""
+    head, rest = template.split("{text}")
+    mid, tail = rest.split("{contexts}")
+    return head, mid, tail.format(tags="\n".join(f"- {t}" for t in tags))
+
+
+@lru_cache(maxsize=2 ** len(_TAG_LIST))
+def _prompt_parts(tags: tuple[str, ...]) -> tuple[str, str, str]:
+    """규칙으로 판정하고 남은 태그 조합별 조각 (조합 수는 최대 2^태그 수)"""
+    return _compile_prompt(_PROMPT_TEMPLATE, tags)
+
+
+@timed("⏱ build_prompt")
+def build_prompt(
+    candidate: Candidate, contexts: list[str], text: str | None = None, tags: list[str] | None = None,
+) -> str:
+    """
+    text 에 preprocess 결과를 넘기면 다시 전처리하지 않음 (RequestContext.text).
+    tags 를 넘기면 그 태그만 선택지로 제시 (기본: 전체 _TAG_LIST)
+    """
+    if text is None:
+        text = preprocess(candidate)
+    head, mid, tail = _prompt_parts(tuple(_TAG_LIST if tags is None else tags))
+    ctx_block = "\n".join(f"- {c}" for c in contexts) or "(관련 회사 정보 없음)"
+    return "".join((head, text, mid, ctx_block, tail))
+
+LLM_MODEL = "gpt-4o-mini"
+LLM_PARAMS = dict(
+    model=LLM_MODEL,
+    response_format={"type": "json_object"},
+    temperature=0.2,
+    max_tokens=settings.llm_max_tokens,
+    presence_penalty=0.2,
+    frequency_penalty=0.4,
+)
+
+def _position_start(p) -> tuple[int, int]:
+    sd = p.startEndDate.get('start', {})
+    return sd.get('year', 0), sd.get('month', 0)
+
+def _shorten(text: str, max_chars: int) -> str:
+    return text if len(text) <= max_chars else text[:max_chars].rstrip() + "…"
+
+@timed("⏱ fit_prompt_budget")
+def fit_prompt_budget(candidate: Candidate, contexts: list[str], prompt: str, tags: list[str] | None = None) -> str:
+    """
+    prompt 가 prompt_token_budget 을 넘으면 덜 중요한 부분부터 줄여 다시 만듭니다.
+      1. 유사도가 낮은 컨텍스트 - retrieve_context 결과는 (회사 요약, 뉴스) 각각 거리순이므로 뒤에서부터,
+         prompt_min_contexts 개까지
+      2. 오래된 경력부터 긴 설명을 prompt_description_max_chars 자로 축약
+      3. 오래된 경력부터 통째로 제거 (가장 최근 경력 1개는 유지)
+    항목별 토큰 수로 줄일 양을 추정하고, 다시 만든 프롬프트의 토큰 수를 after 로 기록합니다.
+    (예산 0 이면 토큰 계산도 하지 않음)
+    """
+    budget = settings.prompt_token_budget
+    if budget <= 0:
+        return prompt
+    before = count_tokens(prompt, LLM_MODEL)
+    metrics.prompt_tokens.labels(stage="before").observe(before)
+    if before <= budget:
+        metrics.prompt_tokens.labels(stage="after").observe(before)
+        tracing.set_attributes(**{"prompt.tokens_before": before, "prompt.tokens_after": before})
+        return prompt
+
+    over = before - budget
+    contexts = list(contexts)
+    while over > 0 and len(contexts) > settings.prompt_min_contexts:
+        over -= count_tokens(f"- {contexts.pop()}\n", LLM_MODEL)
+        metrics.prompt_trims.labels(section="context").inc()
+
+    positions = candidate.positions
+    oldest_first = sorted(range(len(positions)), key=lambda i: _position_start(positions[i]))
+    descriptions: dict[int, str] = {}
+    for i in oldest_first:
+        if over <= 0:
+            break
+        desc = positions[i].description
+        short = _shorten(desc, settings.prompt_description_max_chars)
+        if short != desc:
+            over -= count_tokens(desc, LLM_MODEL) - count_tokens(short, LLM_MODEL)
+            descriptions[i] = short
+            metrics.prompt_trims.labels(section="description").inc()
+
+    dropped: set[int] = set()
+    for i in oldest_first[:-1]:
+        if over <= 0:
+            break
+        over -= count_tokens(format_position(positions[i], descriptions.get(i)) + "\n", LLM_MODEL)
+        dropped.add(i)
+        metrics.prompt_trims.labels(section="position").inc()
+
+    trimmed = candidate.model_copy(update={"positions": [
+        p.model_copy(update={"description": descriptions[i]}) if i in descriptions else p
+        for i, p in enumerate(positions) if i not in dropped
+    ]})
+    prompt = build_prompt(trimmed, contexts, tags=tags)
+    after = count_tokens(prompt, LLM_MODEL)
+    metrics.prompt_tokens.labels(stage="after").observe(after)
+    tracing.set_attributes(**{
+        "prompt.tokens_before": before, "prompt.tokens_after": after,
+        "prompt.tokenizer": tokenizer_name(LLM_MODEL),
+    })
+    if after > budget:
+        log.warning(f"프롬프트 예산 초과: {after} > {budget} tokens (축약 후)")
+    return prompt
+
+def llm_flight_key(prompt: str) -> str:
+    return "llm:" + hashlib.sha256(f"{LLM_MODEL}\n{prompt}".encode()).hexdigest()
+
 @timed("⏱ call_llm")
 def call_llm(prompt: str) -> str:
     try:
-        return chat_completion(
-            model="gpt-4o-mini",
-            messages=[{"role": "user", "content": prompt}],
-            response_format={"type": "json_object"},
-            temperature=0.2,
-            max_tokens=400,
-            presence_penalty=0.2,
-            frequency_penalty=0.4
+        # 동일 프롬프트의 동시 요청은 하나의 호출 결과를 공유
+        return coalesce_shared(
+            llm_flight_key(prompt),
+            lambda: chat_completion(
+                messages=[{"role": "user", "content": prompt}],
+                **LLM_PARAMS,
+            ),
         )
     except Exception as e:
         raise AppError(Err.LLM_ERROR, f"OpenAI 호출 실패: {e}")
 
 @timed("⏱ postprocess")
-def postprocess(raw: str):
-    from ..models.response import InferenceResult
+def postprocess(raw: str) -> InferenceResult:
     return InferenceResult.model_validate_json(raw)
+
+_WS_RE = re.compile(r"\s+")
+
+def _normalize(value):
+    if isinstance(value, str):
+        return _WS_RE.sub(" ", unicodedata.normalize("NFC", value)).strip()
+    if isinstance(value, dict):
+        return {k: _normalize(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_normalize(v) for v in value]
+    return value
+
+def result_cache_key(candidate: Candidate) -> str:
+    """
+    결과 캐시 키.
+    프롬프트에 들어가는 필드만(이름·헤드라인·웹사이트 제외) 정규화해 canonical JSON 으로 만들고,
+    태그 목록·프롬프트 버전·규칙 버전·모델명과 함께 해시합니다.
+    """
+    content = candidate.model_dump(include={
+        "educations": {"__all__": {"schoolName", "degreeName", "fieldOfStudy"}},
+        "positions": {"__all__": {"title", "companyName", "description", "startEndDate", "companyLocation"}},
+        "skills": True,
+        "summary": True,
+    })
+    payload = {
+        "candidate": _normalize(content),
+        "tags": _TAG_LIST,
+        "prompt_version": PROMPT_VERSION,
+        "prompt_budget": settings.prompt_token_budget,
+        "rules": [RULES_VERSION, settings.rule_large_company_min_employees, settings.rule_growth_min_rate]
+        if settings.rule_tagger_enabled else None,
+        "model": LLM_MODEL,
+    }
+    canonical = json.dumps(payload, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+@timed("⏱ apply_rules")
+def tag_by_rules(
+    candidate: Candidate, facts: list[CompanyFacts | None], tenures: list[TenureFacts | None] | None = None,
+) -> RuleOutcome:
+    """규칙으로 판정할 수 있는 태그 - tenures 가 없으면 company directory 의 현재 사실로 판정"""
+    if not settings.rule_tagger_enabled:
+        return NO_RULES
+    outcome = apply_rules(
+        candidate, facts, settings.rule_large_company_min_employees,
+        tenures=tenures, growth_min_rate=settings.rule_growth_min_rate,
+    )
+    present = {t.tag for t in outcome.tags}
+    for tag in outcome.resolved:
+        metrics.rule_tags.labels(tag=tag, result="present" if tag in present else "absent").inc()
+    open_tags = len(_TAG_LIST) - len(outcome.resolved)
+    llm = "skipped" if open_tags == 0 else "full" if open_tags == len(_TAG_LIST) else "partial"
+    metrics.rule_llm_calls.labels(llm=llm).inc()
+    tracing.set_attributes(**{"rules.resolved": len(outcome.resolved), "rules.llm": llm})
+    return outcome
+
+class RequestContext:
+    """
+    요청 하나의 파이프라인 상태.
+    캐시 키·전처리 텍스트·회사명·규칙 판정은 처음 필요할 때 한 번만 계산하고 이후 단계는 이 값을 재사용합니다.
+    (결과 캐시 hit 이면 전처리는 아예 하지 않음)
+    규칙으로 모든 태그가 판정되면(needs_llm False) 컨텍스트 조회·LLM 호출 없이 merge(None) 으로 끝냅니다.
+    재직 기간 회사 사실(tenures)은 rules 를 처음 읽기 전에 load_company_facts 로 채웁니다.
+    """
+
+    def __init__(self, candidate: Candidate):
+        self.candidate = candidate
+        self.contexts: list[str] = []
+        self.prompt: str | None = None
+        self.tenures: list[TenureFacts | None] | None = None
+
+    @cached_property
+    def cache_key(self) -> str:
+        return result_cache_key(self.candidate)
+
+    @cached_property
+    def text(self) -> str:
+        return preprocess(self.candidate)
+
+    @cached_property
+    def company_names(self) -> list[str]:
+        return extract_company_names_from_text(self.candidate)
+
+    @cached_property
+    def company_facts(self) -> list[CompanyFacts | None]:
+        """경력 순서의 회사 사실 (메모리 인덱스만 조회)"""
+        return company_directory.facts_for(self.company_names)
+
+    def tenure_windows(self, today: date | None = None) -> list[Window | None]:
+        """경력별 (company_id, 시작, 종료) - 모르는 회사·기간 없는 경력은 None"""
+        windows: list[Window | None] = []
+        for p, facts in zip(self.candidate.positions, self.company_facts):
+            window = tenure_window(p, today) if facts is not None else None
+            windows.append((facts.company_id, *window) if window else None)
+        return windows
+
+    @cached_property
+    def rules(self) -> RuleOutcome:
+        return tag_by_rules(self.candidate, self.company_facts, self.tenures)
+
+    @property
+    def open_tags(self) -> list[str]:
+        """LLM 이 판단할 태그"""
+        return [t for t in _TAG_LIST if t not in self.rules.resolved]
+
+    @property
+    def needs_llm(self) -> bool:
+        return bool(self.open_tags)
+
+    def build_prompt(self) -> str:
+        tags = self.open_tags
+        prompt = build_prompt(self.candidate, self.contexts, text=self.text, tags=tags)
+        self.prompt = fit_prompt_budget(self.candidate, self.contexts, prompt, tags=tags)
+        return self.prompt
+
+    def accepts(self, tag: str) -> bool:
+        """LLM 이 낸 태그 중 규칙으로 이미 판정한 것은 버림"""
+        return tag not in self.rules.resolved
+
+    def merge(self, llm_result: InferenceResult | None) -> InferenceResult:
+        """규칙 태그 + (규칙이 판정하지 않은) LLM 태그"""
+        tags = list(self.rules.tags)
+        if llm_result is not None:
+            tags += [t for t in llm_result.tags if self.accepts(t.tag)]
+        return InferenceResult(tags=tags)
+
+@timed("⏱ load_company_facts")
+def load_company_facts(reqs: list[RequestContext], db_conn) -> None:
+    """요청들의 경력별 재직 기간 회사 사실을 쿼리 한 번으로 채움 (규칙이 꺼져 있으면 아무것도 안 함)"""
+    if not settings.rule_tagger_enabled or not reqs:
+        return
+    windows = [req.tenure_windows() for req in reqs]
+    facts = iter(tenure_facts([w for ws in windows for w in ws], db_conn))
+    for req, ws in zip(reqs, windows):
+        req.tenures = [next(facts) for _ in ws]
+
+@timed("⏱ infer_batch")
+def infer_batch(candidates: list[Candidate], db_conn) -> list[BatchItemResult]:
+    """
+    지원자 N명을 한 번에 태깅합니다.
+    결과 캐시 조회(MGET) → 재직 기간 회사 사실(쿼리 1개) → 규칙 판정 → 전처리 → 다건 임베딩/컨텍스트 조회(커넥션 1개) → 동시성 제한 LLM 호출 순으로 처리하며,
+    지원자별 성공/실패 결과를 입력 순서대로 반환합니다.
+    """
+    if not candidates:
+        return []
+
+    results: list[BatchItemResult | None] = [None] * len(candidates)
+    reqs = [RequestContext(c) for c in candidates]
+    if settings.result_cache_enabled:
+        for idx, cached in enumerate(get_cached_results([r.cache_key for r in reqs])):
+            if cached is not None:
+                results[idx] = BatchItemResult(index=idx, result=cached)
+
+    load_company_facts([req for idx, req in enumerate(reqs) if results[idx] is None], db_conn)
+    for idx, req in enumerate(reqs):
+        if results[idx] is None and not req.needs_llm:
+            result = req.merge(None)
+            if settings.result_cache_enabled:
+                set_cached_result(req.cache_key, result)
+            results[idx] = BatchItemResult(index=idx, result=result)
+
+    pending = [idx for idx, r in enumerate(results) if r is None]
+    if not pending:
+        return results
+
+    contexts_list = retrieve_contexts(
+        [reqs[i].text for i in pending], [reqs[i].company_names for i in pending], db_conn,
+    )
+    for idx, contexts in zip(pending, contexts_list):
+        reqs[idx].contexts = contexts or ["(관련 맥락 없음)"]
+
+    def _run(idx: int) -> BatchItemResult:
+        req = reqs[idx]
+        try:
+            raw = call_llm(req.build_prompt())
+            result = req.merge(postprocess(raw))
+            if settings.result_cache_enabled:
+                set_cached_result(req.cache_key, result)
+            return BatchItemResult(index=idx, result=result)
+        except AppError as e:
+            return BatchItemResult(index=idx, error=ErrorDetail(**e.detail))
+        except Exception as e:
+            return BatchItemResult(
+                index=idx,
+                error=ErrorDetail(code=Err.LLM_ERROR.name, message=f"LLM 응답 처리 실패: {e}"),
+            )
+
+    workers = min(settings.batch_llm_concurrency, len(pending))
+    # 요청 trace 가 워커 스레드에도 이어지도록 컨텍스트를 복사해 실행
+    contexts = [contextvars.copy_context() for _ in pending]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for item in pool.map(lambda ctx, idx: ctx.run(_run, idx), contexts, pending):
+            results[item.index] = item
+    return results
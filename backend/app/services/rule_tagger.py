@@ -0,0 +1,197 @@
+"""
+규칙 기반 태거 - 구조화된 사실만으로 답이 나오는 태그를 LLM 없이 판정합니다.
+
+    상위권대학교        학교명 → 상위권 학교 표 (TOP_SCHOOLS)
+    대규모 회사 경험    재직 기간 중 최대 직원 수 ≥ rule_large_company_min_employees
+                        (기간 안의 월별 직원 수가 없는 경력은 근거로 쓰지 않고, '없음' 확정에서도 모르는 회사로 봄)
+    신규 투자 유치 경험 재직 기간 중 회사의 투자 유치 (company_event kind=funding)
+    IPO / M&A 경험      재직 기간 중 회사의 상장 / 인수합병 (kind=ipo / ma)
+    성장기 스타트업 경험 재직 기간 중 seed~series C 투자 유치,
+                        또는 직원 수가 rule_growth_min_rate 이상 증가     (있음만 판정)
+
+리더쉽·대용량 데이터 처리 경험은 직책·설명의 문맥을 읽어야 해서 ('대표이사 비서', 'Lead Generation' 등)
+규칙으로 판정하지 않고 항상 LLM 에 맡깁니다.
+
+재직 기간 사실(services/company_facts.py)을 넘기면 그 기간의 월별 직원 수·이벤트를 쓰고,
+없으면 company directory 의 현재 직원 수·전체 이벤트를 기간으로 걸러 씁니다.
+회사 사실로 판정하는 태그는 모든 경력의 회사를 알 때만 '없음'을 확정하고,
+모르는 회사가 섞여 있으면 (근거를 찾지 못한 경우) LLM 에 맡깁니다.
+resolved 에 든 태그는 프롬프트 태그 목록에서 빠지고 LLM 응답에서도 무시됩니다.
+"""
+import re
+import unicodedata
+from datetime import date
+from typing import Callable, NamedTuple
+
+from backend.app.models.candidate import Candidate, Position
+from backend.app.models.response import ExperienceTag
+from backend.app.services.company_directory import CompanyEvent, CompanyFacts
+from backend.app.services.company_facts import TenureFacts, tenure_window
+
+# 규칙·학교 표를 바꾸면 올려주세요 - 결과 캐시 키에 포함됩니다.
+RULES_VERSION = "r4"
+
+TOP_SCHOOL = "상위권대학교"
+LARGE_COMPANY = "대규모 회사 경험"
+GROWTH_STARTUP = "성장기 스타트업 경험"
+IPO = "IPO"
+MNA = "M&A 경험"
+FUNDING = "신규 투자 유치 경험"
+
+EVIDENCE_MAX_CHARS = 60
+
+# 학교별 별칭 - normalize_school_name 결과와 정확히 일치해야 함
+TOP_SCHOOLS: tuple[tuple[str, ...], ...] = (
+    ("서울대학교", "서울대", "seoulnationaluniversity", "snu"),
+    ("연세대학교", "연세대", "yonseiuniversity"),
+    ("고려대학교", "고려대", "koreauniversity"),
+    ("한국과학기술원", "kaist", "koreaadvancedinstituteofscienceandtechnology"),
+    ("포항공과대학교", "포스텍", "postech", "pohanguniversityofscienceandtechnology"),
+    ("성균관대학교", "성균관대", "sungkyunkwanuniversity"),
+    ("한양대학교", "한양대", "hanyanguniversity"),
+    ("서강대학교", "서강대", "soganguniversity"),
+    ("massachusettsinstituteoftechnology", "mit"),
+    ("stanforduniversity", "stanford"),
+    ("harvarduniversity", "harvard"),
+    ("universityofcaliforniaberkeley", "ucberkeley"),
+    ("carnegiemellonuniversity", "cmu"),
+    ("californiainstituteoftechnology", "caltech"),
+    ("princetonuniversity",),
+    ("yaleuniversity",),
+    ("columbiauniversity",),
+    ("universityofpennsylvania", "upenn"),
+    ("cornelluniversity",),
+    ("universityofoxford", "oxforduniversity"),
+    ("universityofcambridge", "cambridgeuniversity"),
+    ("ethzurich",),
+    ("universityoftokyo", "도쿄대학교"),
+    ("nationaluniversityofsingapore", "nus"),
+    ("tsinghuauniversity", "칭화대학교"),
+)
+_TOP_SCHOOL_ALIASES = frozenset(alias for school in TOP_SCHOOLS for alias in school)
+
+_PAREN_RE = re.compile(r"\([^)]*\)|\[[^\]]*\]")
+_SCHOOL_SUFFIX_RE = re.compile(r"(?:대학원|graduateschool)$")
+_NON_WORD_RE = re.compile(r"[\W_]+")
+
+_GROWTH_LEVEL_RE = re.compile(r"seed|시드|pre[-\s]?a|series\s*[abc]\b|시리즈\s*[abc]\b", re.IGNORECASE)
+
+
+class RuleOutcome(NamedTuple):
+    tags: list[ExperienceTag]       # 규칙으로 찾은 태그
+    resolved: frozenset[str]        # 있음/없음을 확정한 태그 - LLM 에 묻지 않음
+
+
+NO_RULES = RuleOutcome([], frozenset())
+
+
+def normalize_school_name(name: str) -> str:
+    """'서울대학교 (Seoul National University)', 'Emory University - Goizueta Business School' → '서울대학교', 'emoryuniversity'"""
+    s = unicodedata.normalize("NFKC", name).lower()
+    s = re.split(r"\s[-–,]\s|,", s)[0]          # 단과대·캠퍼스 표기 제거
+    s = _NON_WORD_RE.sub("", _PAREN_RE.sub(" ", s))
+    return _SCHOOL_SUFFIX_RE.sub("", s)
+
+
+def is_top_school(name: str) -> bool:
+    return normalize_school_name(name) in _TOP_SCHOOL_ALIASES
+
+
+def _join_evidence(parts: list[str]) -> str:
+    """가장 앞선 1~2개를 '; ' 로 연결 (프롬프트 규칙과 같은 형식)"""
+    text = "; ".join(list(dict.fromkeys(parts))[:2])
+    return text if len(text) <= EVIDENCE_MAX_CHARS else text[:EVIDENCE_MAX_CHARS - 1].rstrip() + "…"
+
+
+class _Known(NamedTuple):
+    position: Position
+    facts: CompanyFacts
+    tenure: TenureFacts | None
+
+
+def _events_in_tenure(k: _Known, kind: str, today: date) -> list[CompanyEvent]:
+    if k.tenure is not None:
+        return [e for e in k.tenure.events if e.kind == kind]
+    window = tenure_window(k.position, today)
+    if window is None:
+        return []
+    start, end = window
+    return [e for e in k.facts.events if e.kind == kind and start <= e.date <= end]
+
+
+def _school_rule(candidate: Candidate) -> list[str]:
+    return [
+        f"{e.schoolName} ({' · '.join(x for x in (e.degreeName, e.fieldOfStudy) if x)})".replace(" ()", "")
+        for e in candidate.educations if is_top_school(e.schoolName)
+    ]
+
+
+def apply_rules(
+    candidate: Candidate,
+    facts: list[CompanyFacts | None],
+    large_company_min_employees: int,
+    today: date | None = None,
+    tenures: list[TenureFacts | None] | None = None,
+    growth_min_rate: float = 0.3,
+) -> RuleOutcome:
+    """
+    facts 는 candidate.positions 순서의 회사 사실 (company_directory.facts_for),
+    tenures 는 같은 순서의 재직 기간 사실 (company_facts.tenure_facts)
+    """
+    today = today or date.today()
+    tenures = tenures or [None] * len(facts)
+    positions = candidate.positions
+    tags: list[ExperienceTag] = []
+    resolved: set[str] = set()
+
+    def found(tag: str, evidence: list[str], decided_if_absent: bool) -> None:
+        if evidence:
+            tags.append(ExperienceTag(tag=tag, evidence=_join_evidence(evidence)))
+            resolved.add(tag)
+        elif decided_if_absent:
+            resolved.add(tag)
+
+    found(TOP_SCHOOL, _school_rule(candidate), decided_if_absent=True)
+
+    all_known = all(f is not None for f in facts)
+    known = [_Known(p, f, t) for p, f, t in zip(positions, facts, tenures) if f is not None]
+
+    def by_company(tag: str, hit: Callable[[_Known], str | None],
+                   decidable: Callable[[_Known], bool] = lambda _k: True) -> None:
+        found(tag, [e for k in known if (e := hit(k))], decided_if_absent=all_known and all(map(decidable, known)))
+
+    def peak_headcount(k: _Known) -> int | None:
+        # 현재 직원 수(empWholeVal)는 과거 재직 당시 규모가 아니라 쓰지 않음
+        return k.tenure.peak_headcount if k.tenure is not None else None
+
+    def large(k: _Known) -> str | None:
+        peak = peak_headcount(k)
+        if peak is not None and peak >= large_company_min_employees:
+            return f"{k.position.companyName} 재직 (당시 직원 {peak:,}명)"
+        return None
+
+    def event(kind: str, label: Callable[[str], str]):
+        def hit(k: _Known) -> str | None:
+            events = _events_in_tenure(k, kind, today)
+            return f"{k.position.companyName} 재직 중 {label(events[0].level)} ({events[0].date:%Y.%m})" if events else None
+        return hit
+
+    by_company(LARGE_COMPANY, large, decidable=lambda k: peak_headcount(k) is not None)
+    by_company(FUNDING, event("funding", lambda level: f"{level} 투자 유치"))
+    by_company(IPO, event("ipo", lambda _level: "상장"))
+    by_company(MNA, event("ma", lambda _level: "M&A"))
+
+    # 아래는 근거를 찾으면 '있음', 못 찾으면 LLM 판단에 맡김
+    growth = []
+    for k in known:
+        name = k.position.companyName
+        stages = [e for e in _events_in_tenure(k, "funding", today) if _GROWTH_LEVEL_RE.search(e.level)]
+        if stages:
+            growth.append(f"{name} {stages[0].level} 단계 재직 ({stages[0].date:%Y.%m})")
+        elif k.tenure is not None and (rate := k.tenure.headcount_growth) is not None and rate >= growth_min_rate:
+            counts = k.tenure.headcounts
+            if counts[0] < large_company_min_employees:
+                growth.append(f"{name} 재직 중 직원 {counts[0]:,}→{counts[-1]:,}명")
+    found(GROWTH_STARTUP, growth, decided_if_absent=False)
+
+    return RuleOutcome(tags, frozenset(resolved))
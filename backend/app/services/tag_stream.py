@@ -0,0 +1,74 @@
+"""
+스트리밍 LLM 응답에서 태그를 점진적으로 꺼내는 파서.
+
+{"tags": [{"tag": ..., "evidence": ...}, ...]} 형태의 JSON 을 조각 단위로 받아
+tags 배열의 원소 객체가 닫히는 즉시 ExperienceTag 로 검증해 돌려줍니다.
+문자열 안의 괄호·이스케이프는 무시하고, 검증에 실패한 원소는 건너뜁니다.
+(최종 결과는 전체 응답을 postprocess 로 다시 검증)
+"""
+import json
+
+from pydantic import ValidationError
+
+from backend.app.models.response import ExperienceTag
+
+
+class TagStreamParser:
+    def __init__(self):
+        self._text = ""
+        self._pos = 0               # 다음에 볼 문자 위치
+        self._depth = 0
+        self._in_str = False
+        self._escape = False
+        self._str_start = 0
+        self._last_key: str | None = None   # 최상위 객체에서 마지막으로 닫힌 문자열
+        self._in_tags = False
+        self._obj_start: int | None = None
+
+    def feed(self, chunk: str) -> list[ExperienceTag]:
+        self._text += chunk
+        tags: list[ExperienceTag] = []
+        text = self._text
+        for i in range(self._pos, len(text)):
+            c = text[i]
+            if self._in_str:
+                if self._escape:
+                    self._escape = False
+                elif c == "\\":
+                    self._escape = True
+                elif c == '"':
+                    self._in_str = False
+                    if self._depth == 1:
+                        self._last_key = json.loads(text[self._str_start:i + 1])
+                continue
+
+            if c == '"':
+                self._in_str, self._str_start = True, i
+            elif c in "{[":
+                if c == "[" and self._depth == 1 and self._last_key == "tags":
+                    self._in_tags = True
+                elif c == "{" and self._depth == 2 and self._in_tags:
+                    self._obj_start = i
+                self._depth += 1
+            elif c in "}]":
+                self._depth -= 1
+                if c == "}" and self._depth == 2 and self._obj_start is not None:
+                    if (tag := self._validate(text[self._obj_start:i + 1])) is not None:
+                        tags.append(tag)
+                    self._obj_start = None
+                elif c == "]" and self._depth == 1:
+                    self._in_tags = False
+        self._pos = len(text)
+        return tags
+
+    @staticmethod
+    def _validate(raw: str) -> ExperienceTag | None:
+        try:
+            return ExperienceTag.model_validate_json(raw)
+        except ValidationError:
+            return None
+
+    @property
+    def text(self) -> str:
+        """지금까지 받은 전체 응답"""
+        return self._text
@@ -0,0 +1,39 @@
+import bisect
+import threading
+
+
+class Histogram:
+    """
+    고정 버킷 히스토그램 (스레드 안전).
+    snapshot() 의 buckets 는 Prometheus 와 같이 "le(이하) 누적" 개수입니다.
+    """
+
+    def __init__(self, buckets: tuple[float, ...]):
+        self.bounds = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.bounds) + 1)     # 마지막 칸은 +Inf
+        self._sum = 0.0
+        self._max = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        i = bisect.bisect_left(self.bounds, value)
+        with self._lock:
+            self._counts[i] += 1
+            self._sum += value
+            self._max = max(self._max, value)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            counts, total, peak = list(self._counts), self._sum, self._max
+        cumulative, acc = {}, 0
+        for bound, n in zip((*self.bounds, float("inf")), counts):
+            acc += n
+            cumulative["+Inf" if bound == float("inf") else str(bound)] = acc
+        count = cumulative["+Inf"]
+        return {
+            "count": count,
+            "sum": total,
+            "avg": round(total / count, 3) if count else 0.0,
+            "max": peak,
+            "buckets": cumulative,
+        }
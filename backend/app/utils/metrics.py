@@ -0,0 +1,193 @@
+"""
+Prometheus 텍스트 포맷 지표 (외부 의존성 없음, 워커 프로세스 단위).
+
+    from backend.app.utils.metrics import cache_requests
+    cache_requests.labels(cache="result", result="hit").inc()
+
+render() 결과를 /api/metrics 로 노출합니다. uvicorn 워커가 여러 개면 워커별 값이므로
+Prometheus 쪽에서 인스턴스/워커 단위로 합산하세요.
+"""
+import threading
+
+from backend.app.utils.histogram import Histogram
+
+# 초 단위 - 캐시 조회(ms 미만)부터 LLM 호출(수 초)까지
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+TOKEN_BUCKETS = (500, 1000, 2000, 4000, 8000, 16000, 32000, 64000, 128000)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _label_str(names: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _Family:
+    type = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: dict[tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def labels(self, **labels: str):
+        key = tuple(str(labels[n]) for n in self.labelnames)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def _header(self) -> list[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type}"]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._children.clear()
+
+
+class _CounterChild:
+    __slots__ = ("_value", "_lock")
+
+    def __init__(self):
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+
+class Counter(_Family):
+    type = "counter"
+
+    def _new_child(self):
+        return _CounterChild()
+
+    def render(self) -> list[str]:
+        lines = self._header()
+        for key, child in sorted(self._children.items()):
+            lines.append(f"{self.name}{_label_str(self.labelnames, key)} {child.value}")
+        return lines
+
+
+class _GaugeChild:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        self.value = float(value)
+
+
+class Gauge(_Family):
+    type = "gauge"
+
+    def _new_child(self):
+        return _GaugeChild()
+
+    def render(self) -> list[str]:
+        lines = self._header()
+        for key, child in sorted(self._children.items()):
+            lines.append(f"{self.name}{_label_str(self.labelnames, key)} {child.value}")
+        return lines
+
+
+class LabeledHistogram(_Family):
+    type = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = (),
+                 buckets: tuple[float, ...] = LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = buckets
+
+    def _new_child(self):
+        return Histogram(self.buckets)
+
+    def render(self) -> list[str]:
+        lines = self._header()
+        for key, child in sorted(self._children.items()):
+            snap = child.snapshot()
+            for le, count in snap["buckets"].items():
+                le_label = f'le="{le}"'
+                lines.append(f"{self.name}_bucket{_label_str(self.labelnames, key, le_label)} {count}")
+            lines.append(f"{self.name}_sum{_label_str(self.labelnames, key)} {snap['sum']}")
+            lines.append(f"{self.name}_count{_label_str(self.labelnames, key)} {snap['count']}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self._families: list[_Family] = []
+        self._collectors: list = []
+
+    def register(self, family: _Family) -> _Family:
+        self._families.append(family)
+        return family
+
+    def add_collector(self, fn) -> None:
+        """render 직전에 호출 - 외부 상태(큐 길이 등)를 Gauge 에 반영할 때"""
+        self._collectors.append(fn)
+
+    def render(self) -> str:
+        for collect in self._collectors:
+            collect()
+        lines: list[str] = []
+        for family in self._families:
+            lines.extend(family.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+stage_duration = registry.register(LabeledHistogram(
+    "app_stage_duration_seconds", "@timed 단계별 소요 시간", ("stage",),
+))
+stage_calls = registry.register(Counter("app_stage_calls_total", "@timed 단계별 호출 수", ("stage",)))
+stage_errors = registry.register(Counter("app_stage_errors_total", "@timed 단계별 예외 수", ("stage",)))
+cache_requests = registry.register(Counter(
+    "app_cache_requests_total", "캐시 조회 결과 (result: hit|miss|error)", ("cache", "result"),
+))
+openai_retries = registry.register(Counter(
+    "app_openai_retries_total", "OpenAI 호출 재시도 (attempt: 실패한 시도 번호)", ("fn", "attempt", "error"),
+))
+
+prompt_tokens = registry.register(LabeledHistogram(
+    "app_prompt_tokens", "프롬프트 토큰 수 (stage: before|after 예산 적용)", ("stage",), buckets=TOKEN_BUCKETS,
+))
+prompt_trims = registry.register(Counter(
+    "app_prompt_trims_total", "예산 초과로 줄인 프롬프트 항목 수 (section: context|description|position)", ("section",),
+))
+rule_tags = registry.register(Counter(
+    "app_rule_tags_total", "규칙으로 판정한 태그 (result: present|absent)", ("tag", "result"),
+))
+rule_llm_calls = registry.register(Counter(
+    "app_rule_llm_calls_total", "규칙 판정 후 LLM 호출 여부 (llm: skipped|partial|full)", ("llm",),
+))
+
+jobs_submitted = registry.register(Counter("app_jobs_submitted_total", "큐에 넣은 태깅 작업 수"))
+jobs_finished = registry.register(Counter(
+    "app_jobs_finished_total", "워커가 끝낸 작업 시도 (result: succeeded|retried|dead)", ("result",),
+))
+job_queue_depth = registry.register(Gauge(
+    "app_job_queue_depth", "작업 큐 길이 (queue: queued|delayed|running|dead)", ("queue",),
+))
+
+
+def render() -> str:
+    return registry.render()
@@ -1,12 +1,36 @@
+import inspect
 import logging
 import time
 from functools import wraps
 from typing import Callable, TypeVar
 
+from backend.app.utils import metrics, tracing
+
 _T = TypeVar("_T")
 
 _log = logging.getLogger("prof")      # 전용 로거
 
+# (label, elapsed_ms, ok) 를 받는 관찰자 - 부하 테스트 등에서 단계별 지연을 수집할 때 등록
+_observers: list[Callable[[str, float, bool], None]] = []
+
+def add_observer(fn: Callable[[str, float, bool], None]) -> None:
+    _observers.append(fn)
+
+def remove_observer(fn: Callable[[str, float, bool], None]) -> None:
+    if fn in _observers:
+        _observers.remove(fn)
+
+def _record(label: str, elapsed_ms: float, ok: bool) -> None:
+    stage = label.removeprefix("⏱ ")
+    metrics.stage_duration.labels(stage=stage).observe(elapsed_ms / 1_000)
+    metrics.stage_calls.labels(stage=stage).inc()
+    if not ok:
+        metrics.stage_errors.labels(stage=stage).inc()
+    if _log.isEnabledFor(logging.DEBUG):            # 비활성 레벨이면 포맷 비용도 없음
+        _log.debug("%s: %.3f ms", label, elapsed_ms)
+    for observer in _observers:
+        observer(label, elapsed_ms, ok)
+
 def timed(label: str | None = None) -> Callable[[Callable[..., _T]], Callable[..., _T]]:
     """
     사용 예:
@@ -15,17 +39,48 @@ def timed(label: str | None = None) -> Callable[[Callable[..., _T]], Callable[..
         @timed("retrive_context")
         def retrieve_context(...):
             ...
+
+    async def 에 붙이면 await 가 끝날 때까지의 시간을 측정합니다.
+    측정값은 app_stage_* 지표(/api/metrics)로 집계되고, DEBUG 레벨에서는 로그로도 남습니다.
+    요청 Trace 가 활성이면 같은 이름의 span 도 기록합니다. (utils/tracing.py)
     """
     def deco(fn: Callable[..., _T]) -> Callable[..., _T]:
         _lbl = label or fn.__name__
+        _span_name = _lbl.removeprefix("⏱ ")
 
-        @wraps(fn)
-        def wrapper(*args, **kwargs) -> _T:          # type: ignore[override]
-            start = time.perf_counter()
+        if inspect.iscoroutinefunction(fn):
+            async def measure_async(args, kwargs):
+                start, ok = time.perf_counter(), False
+                try:
+                    result = await fn(*args, **kwargs)
+                    ok = True
+                    return result
+                finally:
+                    _record(_lbl, (time.perf_counter() - start) * 1_000, ok)
+
+            @wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                if tracing.current_trace() is None:
+                    return await measure_async(args, kwargs)
+                with tracing.span(_span_name):
+                    return await measure_async(args, kwargs)
+            return async_wrapper
+
+        def measure(args, kwargs):
+            start, ok = time.perf_counter(), False
             try:
-                return fn(*args, **kwargs)
+                result = fn(*args, **kwargs)
+                ok = True
+                return result
             finally:
-                elapsed_ms = (time.perf_counter() - start) * 1_000
-                _log.debug(f"{_lbl}: {elapsed_ms:.3f} ms")
+                _record(_lbl, (time.perf_counter() - start) * 1_000, ok)
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs) -> _T:          # type: ignore[override]
+            # 요청 Trace 가 활성일 때만 span 생성 (트레이싱 미사용 시 오버헤드 최소화)
+            if tracing.current_trace() is None:
+                return measure(args, kwargs)
+            with tracing.span(_span_name):
+                return measure(args, kwargs)
         return wrapper
     return deco
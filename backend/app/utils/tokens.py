@@ -0,0 +1,44 @@
+"""
+프롬프트 토큰 수 계산.
+
+tiktoken 이 있으면 모델 인코딩(gpt-4o 계열은 o200k_base)으로 정확히 셉니다.
+tiktoken 이 없거나 인코딩 파일을 받을 수 없으면(오프라인 - TIKTOKEN_CACHE_DIR 로 미리 받아둘 수 있음)
+UTF-8 바이트 수로 셉니다. BPE 토큰 수의 상한이라 예산을 넘지는 않지만 한글은 2~3배 크게 잡힙니다.
+"""
+import logging
+from functools import lru_cache
+
+try:
+    import tiktoken
+except ImportError:         # 선택 의존성
+    tiktoken = None
+
+log = logging.getLogger(__name__)
+
+FALLBACK_TOKENIZER = "utf8-bytes"
+
+
+@lru_cache(maxsize=None)
+def _encoding(model: str):
+    if tiktoken is None:
+        return None
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding("o200k_base")
+    except Exception as e:
+        log.warning(f"tiktoken 인코딩 로드 실패({model}), 바이트 수로 대체: {e}")
+        return None
+
+
+def tokenizer_name(model: str) -> str:
+    enc = _encoding(model)
+    return f"tiktoken:{enc.name}" if enc is not None else FALLBACK_TOKENIZER
+
+
+def count_tokens(text: str, model: str) -> int:
+    enc = _encoding(model)
+    if enc is None:
+        return len(text.encode("utf-8"))
+    return len(enc.encode(text, disallowed_special=()))
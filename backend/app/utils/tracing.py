@@ -0,0 +1,262 @@
+"""
+요청 단위 트레이싱 (외부 의존성 없음).
+
+- 미들웨어가 요청마다 Trace 와 루트 span 을 만들고 request id(X-Request-ID)를 전파합니다.
+- @timed 단계는 활성 Trace 가 있으면 자동으로 하위 span 이 됩니다. (없으면 contextvar 조회 비용뿐)
+- set_attributes / incr_attribute 로 현재 span 에 행 수·토큰 수·재시도 수·캐시 상태 등을 붙입니다.
+- 끝난 Trace 는 TRACE_EXPORT_PATH 에 OTLP/JSON(resourceSpans) 한 줄씩 기록합니다.
+  (OpenTelemetry Collector 의 otlpjsonfile receiver 로 그대로 읽을 수 있는 형식)
+  Trace 는 응답 본문을 다 보낸 뒤 끝나므로 스트리밍(/infer/stream) 중에 생긴 span 도 포함되고,
+  파일 쓰기는 스레드에서 해 이벤트 루프를 막지 않습니다.
+- 요청 헤더 X-Server-Timing: 1 이면 단계별 소요 시간을 Server-Timing 응답 헤더로 돌려줍니다.
+  (헤더는 본문보다 먼저 나가므로 스트리밍 응답에서는 헤더를 보낸 시점까지의 단계만 담김)
+
+스레드 풀로 넘기는 작업은 contextvars.copy_context().run 으로 감싸야 같은 Trace 에 붙습니다.
+"""
+import contextvars
+import json
+import logging
+import os
+import random
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Any, AsyncIterator, Iterator
+
+import anyio
+
+from backend.app.configs import settings
+
+log = logging.getLogger(__name__)
+
+REQUEST_ID_HEADER = "X-Request-ID"
+SERVER_TIMING_REQUEST_HEADER = "X-Server-Timing"
+
+_SPAN_KIND_INTERNAL, _SPAN_KIND_SERVER = 1, 2
+_STATUS_OK, _STATUS_ERROR = 1, 2
+
+
+class Span:
+    __slots__ = ("trace", "span_id", "parent_id", "name", "kind", "start_ns", "end_ns",
+                 "_perf_start", "attributes", "status", "status_message")
+
+    def __init__(self, trace: "Trace", name: str, parent_id: str | None, kind: int = _SPAN_KIND_INTERNAL):
+        self.trace = trace
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent_id
+        self.name = name
+        self.kind = kind
+        self.start_ns = time.time_ns()
+        self._perf_start = time.perf_counter_ns()
+        self.end_ns: int | None = None
+        self.attributes: dict[str, Any] = {}
+        self.status = _STATUS_OK
+        self.status_message = ""
+
+    def end(self, error: BaseException | None = None) -> None:
+        self.end_ns = self.start_ns + (time.perf_counter_ns() - self._perf_start)
+        if error is not None:
+            self.status, self.status_message = _STATUS_ERROR, f"{type(error).__name__}: {error}"
+
+    @property
+    def duration_ms(self) -> float:
+        return ((self.end_ns or self.start_ns) - self.start_ns) / 1e6
+
+
+class Trace:
+    def __init__(self, request_id: str):
+        self.trace_id = os.urandom(16).hex()
+        self.request_id = request_id
+        self.spans: list[Span] = []
+        self._lock = threading.Lock()
+
+    def add(self, span: Span) -> None:
+        with self._lock:
+            self.spans.append(span)
+
+    def server_timing(self) -> str:
+        """같은 이름 span 은 합산 - 'preprocess;dur=0.1, call_llm;dur=812.3'"""
+        totals: dict[str, float] = {}
+        for s in self.spans:
+            if s.kind == _SPAN_KIND_INTERNAL and s.end_ns is not None:
+                metric = "".join(c if c.isalnum() or c in "-_." else "_" for c in s.name)
+                totals[metric] = totals.get(metric, 0.0) + s.duration_ms
+        return ", ".join(f"{name};dur={ms:.1f}" for name, ms in totals.items())
+
+
+_current_trace: contextvars.ContextVar[Trace | None] = contextvars.ContextVar("trace", default=None)
+_current_span: contextvars.ContextVar[Span | None] = contextvars.ContextVar("span", default=None)
+
+
+def current_trace() -> Trace | None:
+    return _current_trace.get()
+
+
+def current_request_id() -> str | None:
+    trace = _current_trace.get()
+    return trace.request_id if trace else None
+
+
+@contextmanager
+def span(name: str, kind: int = _SPAN_KIND_INTERNAL, **attributes) -> Iterator[Span | None]:
+    """활성 Trace 아래 하위 span - Trace 가 없으면 아무것도 하지 않음"""
+    trace = _current_trace.get()
+    if trace is None:
+        yield None
+        return
+    parent = _current_span.get()
+    s = Span(trace, name, parent.span_id if parent else None, kind)
+    s.attributes.update(attributes)
+    token = _current_span.set(s)
+    try:
+        yield s
+    except BaseException as e:
+        s.end(e)
+        raise
+    else:
+        s.end()
+    finally:
+        _current_span.reset(token)
+        trace.add(s)
+
+
+def set_attributes(**attributes) -> None:
+    """현재 span 에 속성 추가 (점이 들어간 키는 dict 로 넘기세요: set_attributes(**{"db.rows": 3}))"""
+    if (s := _current_span.get()) is not None:
+        s.attributes.update(attributes)
+
+
+def incr_attribute(key: str, amount: int = 1) -> None:
+    if (s := _current_span.get()) is not None:
+        s.attributes[key] = s.attributes.get(key, 0) + amount
+
+
+# ---------- OTLP/JSON 파일 내보내기 ----------
+def _otlp_value(value) -> dict:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attrs(attributes: dict) -> list[dict]:
+    return [{"key": k, "value": _otlp_value(v)} for k, v in attributes.items()]
+
+
+def to_otlp(trace: Trace) -> dict:
+    spans = []
+    for s in trace.spans:
+        item = {
+            "traceId": trace.trace_id,
+            "spanId": s.span_id,
+            "name": s.name,
+            "kind": s.kind,
+            "startTimeUnixNano": str(s.start_ns),
+            "endTimeUnixNano": str(s.end_ns or s.start_ns),
+            "attributes": _otlp_attrs({"request.id": trace.request_id, **s.attributes}),
+            "status": {"code": s.status, **({"message": s.status_message} if s.status_message else {})},
+        }
+        if s.parent_id:
+            item["parentSpanId"] = s.parent_id
+        spans.append(item)
+    return {"resourceSpans": [{
+        "resource": {"attributes": _otlp_attrs({"service.name": settings.trace_service_name})},
+        "scopeSpans": [{"scope": {"name": "backend.app"}, "spans": spans}],
+    }]}
+
+
+class FileSpanExporter:
+    """Trace 하나를 OTLP/JSON 한 줄로 append"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def export(self, trace: Trace) -> None:
+        line = json.dumps(to_otlp(trace), ensure_ascii=False, separators=(",", ":"))
+        try:
+            with self._lock, open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+        except OSError as e:
+            log.warning(f"trace export 실패: {e}")
+
+
+_exporter: FileSpanExporter | None = None
+
+
+def get_exporter() -> FileSpanExporter | None:
+    global _exporter
+    if not settings.trace_export_path:
+        return None
+    if _exporter is None or _exporter.path != settings.trace_export_path:
+        _exporter = FileSpanExporter(settings.trace_export_path)
+    return _exporter
+
+
+# ---------- 미들웨어 ----------
+async def _end_trace(trace: Trace, root: Span, exporter: FileSpanExporter | None,
+                     error: BaseException | None = None) -> None:
+    """루트 span 을 닫고 (샘플링된 경우) 스레드에서 파일로 내보냄 - 취소 중에도 내보내기는 마침"""
+    root.end(error)
+    trace.add(root)
+    if exporter is not None:
+        with anyio.CancelScope(shield=True):
+            await anyio.to_thread.run_sync(exporter.export, trace)
+
+
+async def _end_after_body(body: AsyncIterator, trace: Trace, root: Span,
+                          exporter: FileSpanExporter | None) -> AsyncIterator:
+    """응답 본문을 그대로 흘려보내고, 다 보낸 뒤(또는 끊긴 뒤) Trace 를 끝냄"""
+    error = None
+    try:
+        async for chunk in body:
+            yield chunk
+    except BaseException as e:
+        error = e
+        raise
+    finally:
+        await _end_trace(trace, root, exporter, error)
+
+
+async def trace_requests(request, call_next):
+    """
+    요청마다 request id 를 정하고(헤더 우선), 내보내기 대상이거나 Server-Timing 을 요청받은 경우 Trace 를 기록합니다.
+    """
+    request_id = request.headers.get(REQUEST_ID_HEADER) or uuid.uuid4().hex
+    want_timing = settings.server_timing_enabled and request.headers.get(SERVER_TIMING_REQUEST_HEADER) == "1"
+    exporter = get_exporter()
+    sampled = exporter is not None and random.random() < settings.trace_sample_ratio
+
+    if not (want_timing or sampled):
+        response = await call_next(request)
+        response.headers[REQUEST_ID_HEADER] = request_id
+        return response
+
+    exporter = exporter if sampled else None
+    trace = Trace(request_id)
+    root = Span(trace, f"{request.method} {request.url.path}", None, _SPAN_KIND_SERVER)
+    root.attributes.update({"http.method": request.method, "http.target": request.url.path})
+    # call_next 가 띄우는 앱 태스크가 이 컨텍스트를 복사하므로 본문 스트리밍 중의 span 도 같은 Trace 에 붙음
+    trace_token, span_token = _current_trace.set(trace), _current_span.set(root)
+    try:
+        response = await call_next(request)
+    except BaseException as e:
+        await _end_trace(trace, root, exporter, e)
+        raise
+    finally:
+        _current_span.reset(span_token)
+        _current_trace.reset(trace_token)
+
+    root.attributes["http.status_code"] = response.status_code
+    if response.status_code >= 500:
+        root.status = _STATUS_ERROR
+    response.headers[REQUEST_ID_HEADER] = request_id
+    if want_timing:
+        elapsed_ms = (time.perf_counter_ns() - root._perf_start) / 1e6
+        response.headers["Server-Timing"] = f"total;dur={elapsed_ms:.1f}, " + trace.server_timing()
+    response.body_iterator = _end_after_body(response.body_iterator, trace, root, exporter)
+    return response
@@ -0,0 +1,37 @@
+import io
+import pickle
+
+import numpy as np
+
+# 4바이트 헤더(매직 "F32" + 포맷 버전) 뒤에 little-endian float32 가 이어집니다.
+# 헤더를 4바이트로 맞춰 np.frombuffer 결과가 float32 경계에 정렬되도록 합니다.
+HEADER_V1 = b"F32\x01"
+_DTYPE = np.dtype("<f4")
+_PICKLE_PROTO = 0x80
+
+
+class _PlainDataUnpickler(pickle.Unpickler):
+    """list/float 만 허용 - 이전 포맷(pickle 된 list[float]) 읽기 전용"""
+
+    def find_class(self, module, name):
+        raise pickle.UnpicklingError(f"허용되지 않은 객체: {module}.{name}")
+
+
+def encode_vector(vec) -> bytes:
+    return HEADER_V1 + np.asarray(vec, dtype=_DTYPE).tobytes()
+
+
+def is_legacy(raw: bytes) -> bool:
+    return len(raw) > 0 and raw[0] == _PICKLE_PROTO
+
+
+def decode_vector(raw: bytes, allow_legacy: bool = True) -> np.ndarray:
+    """
+    바이트 → float32 ndarray (읽기 전용, 원소별 파이썬 객체 생성 없음).
+    allow_legacy=True 면 이전 pickle 항목도 안전한 Unpickler 로 읽습니다.
+    """
+    if raw[:4] == HEADER_V1:
+        return np.frombuffer(raw, dtype=_DTYPE, offset=len(HEADER_V1))
+    if allow_legacy and is_legacy(raw):
+        return np.asarray(_PlainDataUnpickler(io.BytesIO(raw)).load(), dtype=_DTYPE)
+    raise ValueError(f"알 수 없는 벡터 포맷: {raw[:4]!r}")
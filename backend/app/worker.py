@@ -0,0 +1,184 @@
+"""
+태깅 작업 워커.
+
+    python -m backend.app.worker [--concurrency 4] [--metrics-port 9100]
+
+Redis 작업 큐(clients/job_queue.py)에서 작업을 꺼내 services/pipeline.py 단계
+(결과 캐시 → 재직 기간 회사 사실 → 규칙 판정 → 컨텍스트 조회 → 프롬프트 → LLM → 검증)를 실행합니다.
+API 서버와 별도 프로세스라 처리량은 워커 수·JOB_WORKER_CONCURRENCY 로 따로 조절합니다.
+- 실패하면 JOB_RETRY_BACKOFF·2^(n-1) 초 뒤 재시도, JOB_MAX_ATTEMPTS 번 실패하면 dead-letter(jobs:dead)
+- SIGTERM/SIGINT 를 받으면 새 작업을 받지 않고 진행 중인 작업을 마친 뒤 종료
+- NEWS_PARTITION_MAINTENANCE_INTERVAL 마다 company_news 월 파티션을 미리 만들고 보존 기간이 지난 파티션을 정리
+- --metrics-port 로 이 프로세스의 Prometheus 지표(단계별 지연·작업 결과·큐 길이)를 노출
+"""
+import argparse
+import logging
+import signal
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from backend.app.clients import job_queue
+from backend.app.clients.result_cache import get_cached_result, set_cached_result
+from backend.app.configs import settings, setup_logging
+from backend.app.db import close_db_pool, get_db_connection, init_db_pool
+from backend.app.error_codes import Err
+from backend.app.exceptions import AppError
+from backend.app.models.candidate import Candidate
+from backend.app.models.response import ErrorDetail, InferenceResult
+from backend.app.services.company_directory import company_directory
+from backend.app.services.company_snapshot import company_snapshot
+from backend.app.services.news_partitions import maintain_news_partitions
+from backend.app.services.pipeline import RequestContext, call_llm, load_company_facts, postprocess, retrieve_context
+from backend.app.utils import metrics
+from backend.app.utils.profiler import timed
+
+log = logging.getLogger("worker")
+
+CLAIM_TIMEOUT = 1.0     # 초, 큐가 비었을 때 종료 신호를 확인하는 주기
+
+
+@timed("⏱ job")
+def run_job(candidate: Candidate) -> InferenceResult:
+    """/infer 와 같은 단계 - 결과 캐시도 공유"""
+    req = RequestContext(candidate)
+    if settings.result_cache_enabled and (cached := get_cached_result(req.cache_key)):
+        return cached
+    with get_db_connection() as conn:
+        load_company_facts([req], conn)
+        if req.needs_llm:
+            req.contexts = retrieve_context(req.text, req.company_names, conn) or ["(관련 맥락 없음)"]
+    if req.needs_llm:
+        result = req.merge(postprocess(call_llm(req.build_prompt())))
+    else:
+        result = req.merge(None)
+    if settings.result_cache_enabled:
+        set_cached_result(req.cache_key, result)
+    return result
+
+
+def _error_detail(e: Exception) -> ErrorDetail:
+    if isinstance(e, AppError):
+        return ErrorDetail(**e.detail)
+    return ErrorDetail(code=Err.JOB_FAILED.name, message=f"{type(e).__name__}: {e}")
+
+
+def process_one(timeout: float = CLAIM_TIMEOUT) -> str | None:
+    """작업 하나 처리 - 결과(succeeded|retried|dead), 큐가 비었으면 None"""
+    claimed = job_queue.claim(timeout)
+    if claimed is None:
+        return None
+    job_id, candidate = claimed
+    try:
+        result = run_job(candidate)
+    except Exception as e:
+        outcome = job_queue.fail(job_id, _error_detail(e))
+        log.warning(f"작업 실패 {job_id} → {outcome}: {e}")
+        return outcome
+    job_queue.complete(job_id, result)
+    return job_queue.SUCCEEDED
+
+
+class Worker:
+    def __init__(self, concurrency: int):
+        self.concurrency = concurrency
+        self.stop = threading.Event()
+        self.partitions_maintained_at: float | None = None
+
+    def _consume(self) -> None:
+        while not self.stop.is_set():
+            try:
+                process_one()
+            except Exception as e:          # Redis 장애 등 - 잠시 쉬고 계속
+                log.error(f"작업 처리 루프 오류: {e}")
+                self.stop.wait(CLAIM_TIMEOUT)
+
+    def maintain_partitions(self, now: float | None = None) -> None:
+        """NEWS_PARTITION_MAINTENANCE_INTERVAL 이 지났으면 뉴스 파티션 관리 (실패하면 다음 주기에 재시도)"""
+        interval = settings.news_partition_maintenance_interval
+        now = time.monotonic() if now is None else now
+        if not interval or (self.partitions_maintained_at is not None
+                            and now - self.partitions_maintained_at < interval):
+            return
+        self.partitions_maintained_at = now
+        try:
+            with get_db_connection() as conn:
+                maintain_news_partitions(conn)
+        except Exception as e:
+            log.error(f"뉴스 파티션 관리 실패: {e}")
+
+    def run(self) -> None:
+        threads = [
+            threading.Thread(target=self._consume, name=f"job-worker-{i}")
+            for i in range(self.concurrency)
+        ]
+        for t in threads:
+            t.start()
+        log.info(f"워커 시작: concurrency={self.concurrency}")
+        self.maintain_partitions()
+        while not self.stop.wait(settings.job_maintenance_interval):
+            self.maintain_partitions()
+            try:
+                job_queue.maintain()
+            except Exception as e:
+                log.error(f"작업 큐 정리 실패: {e}")
+        log.info("종료 신호 - 진행 중인 작업을 마치는 중")
+        for t in threads:
+            t.join()
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = metrics.render().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args):
+        pass
+
+
+def serve_metrics(port: int) -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer(("0.0.0.0", port), _MetricsHandler)
+    threading.Thread(target=server.serve_forever, name="worker-metrics", daemon=True).start()
+    return server
+
+
+def warm_company_directory() -> None:
+    """규칙 판정용 회사 사실을 미리 적재 - 실패하면 첫 컨텍스트 조회 때 적재되고, 그 전까지는 LLM 이 판단"""
+    try:
+        with get_db_connection() as conn:
+            company_directory.refresh(conn)
+    except Exception as e:
+        log.warning(f"company directory 사전 적재 실패: {e}")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="태깅 작업 워커")
+    parser.add_argument("--concurrency", type=int, default=settings.job_worker_concurrency)
+    parser.add_argument("--metrics-port", type=int, default=settings.job_worker_metrics_port)
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    setup_logging(level=settings.log_level)
+    init_db_pool()
+    warm_company_directory()
+    company_snapshot.get()
+    worker = Worker(args.concurrency)
+    signal.signal(signal.SIGTERM, lambda *_: worker.stop.set())
+    signal.signal(signal.SIGINT, lambda *_: worker.stop.set())
+    server = serve_metrics(args.metrics_port) if args.metrics_port else None
+    try:
+        worker.run()
+    finally:
+        if server is not None:
+            server.shutdown()
+        close_db_pool()
+
+
+if __name__ == "__main__":
+    main()
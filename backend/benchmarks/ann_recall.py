@@ -0,0 +1,170 @@
+"""
+ANN 인덱스 recall / 지연 벤치마크 (합성 코퍼스, exact scan 대비)
+
+임시 테이블에 무작위 벡터를 COPY 로 적재한 뒤, exact 결과를 정답으로 두고
+ef_search(HNSW) 또는 probes(IVFFlat)를 바꿔가며 recall@k 와 p50/p95 지연을 측정합니다.
+
+--filtered 는 실제 뉴스 검색처럼 쿼리마다 company_id 몇 개 + 최근 180일 필터를 겁니다.
+필터가 좁으면 ef_search 개 후보 중 조건을 통과한 것만 남아 LIMIT 보다 적게 돌아오므로 평균 반환 건수(rows)도
+함께 출력하고, HNSW 는 --iterative-scan 을 주면 hnsw.iterative_scan 값별로도 측정합니다. (pgvector 0.8 이상)
+
+    python -m backend.benchmarks.ann_recall --dsn $DATABASE_URL --method hnsw --rows 100000
+    python -m backend.benchmarks.ann_recall --method ivfflat --lists 300 --sweep 1,5,10,20,40
+    python -m backend.benchmarks.ann_recall --method hnsw --filtered --companies 2000 --iterative-scan off,relaxed_order
+"""
+import argparse
+import io
+import os
+import time
+from datetime import date, timedelta
+
+import numpy as np
+import psycopg2
+
+TABLE = "ann_bench_vectors"
+DAYS = 730                  # news_date 분포 범위 (오늘부터 과거로)
+RECENT_DAYS = 180           # pipeline 뉴스 검색의 최근 기간 필터
+COMPANIES_PER_QUERY = 5     # 지원자 한 명의 경력 회사 수 정도
+
+
+def _vec_text(v: np.ndarray) -> str:
+    return "[" + ",".join(f"{x:.6f}" for x in v) + "]"
+
+
+def _load_corpus(conn, rows: int, dim: int, companies: int, rng: np.random.Generator) -> None:
+    today = date.today()
+    with conn.cursor() as cur:
+        cur.execute(f"DROP TABLE IF EXISTS {TABLE}")
+        cur.execute(
+            f"CREATE UNLOGGED TABLE {TABLE} "
+            f"(id INT PRIMARY KEY, company_id INT NOT NULL, news_date DATE NOT NULL, embedding VECTOR({dim}))"
+        )
+        chunk = 10_000
+        for start in range(0, rows, chunk):
+            n = min(chunk, rows - start)
+            data = rng.standard_normal((n, dim)).astype(np.float32)
+            company_ids = rng.integers(companies, size=n)
+            ages = rng.integers(DAYS, size=n)
+            buf = io.StringIO()
+            for i, (v, cid, age) in enumerate(zip(data, company_ids, ages), start=start):
+                buf.write(f"{i}\t{cid}\t{today - timedelta(days=int(age))}\t{_vec_text(v)}\n")
+            buf.seek(0)
+            cur.copy_expert(f"COPY {TABLE} (id, company_id, news_date, embedding) FROM STDIN", buf)
+    conn.commit()
+
+
+def _build_index(conn, method: str, m: int, ef_construction: int, lists: int) -> float:
+    params = f"m = {m}, ef_construction = {ef_construction}" if method == "hnsw" else f"lists = {lists}"
+    start = time.perf_counter()
+    with conn.cursor() as cur:
+        cur.execute(
+            f"CREATE INDEX ON {TABLE} USING {method} (embedding vector_cosine_ops) WITH ({params})"
+        )
+        cur.execute(f"CREATE INDEX ON {TABLE} (company_id, news_date)")   # company_news 와 같은 필터 인덱스
+        cur.execute(f"ANALYZE {TABLE}")
+    conn.commit()
+    return time.perf_counter() - start
+
+
+def _search(conn, queries: list[tuple[str, list[int] | None]], k: int,
+            settings_sql: list[str]) -> tuple[list[set[int]], np.ndarray]:
+    """queries = (벡터, company_id 목록 또는 None=필터 없음)"""
+    results, latencies = [], []
+    with conn.cursor() as cur:
+        for stmt in settings_sql:
+            cur.execute(stmt)
+        for q, company_ids in queries:
+            start = time.perf_counter()
+            if company_ids is None:
+                cur.execute(
+                    f"SELECT id FROM {TABLE} ORDER BY embedding <=> %s::vector LIMIT %s", (q, k)
+                )
+            else:
+                cur.execute(
+                    f"""
+                    SELECT id FROM {TABLE}
+                    WHERE company_id = ANY(%s::int[]) AND news_date >= CURRENT_DATE - %s
+                    ORDER BY embedding <=> %s::vector LIMIT %s
+                    """,
+                    (company_ids, RECENT_DAYS, q, k),
+                )
+            results.append({row[0] for row in cur.fetchall()})
+            latencies.append((time.perf_counter() - start) * 1_000)
+    conn.rollback()
+    return results, np.array(latencies)
+
+
+def _recall(approx: list[set[int]], exact: list[set[int]]) -> float:
+    """필터 뒤 정답이 k 개보다 적을 수 있어 정답 수로 나눔 (정답이 없으면 1)"""
+    return float(np.mean([len(a & e) / len(e) if e else 1.0 for a, e in zip(approx, exact)]))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--dsn", default=os.getenv("DATABASE_URL"))
+    parser.add_argument("--method", choices=("hnsw", "ivfflat"), default="hnsw")
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--dim", type=int, default=1536)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--m", type=int, default=16)
+    parser.add_argument("--ef-construction", type=int, default=64)
+    parser.add_argument("--lists", type=int, default=100)
+    parser.add_argument("--sweep", default=None,
+                        help="쉼표 구분 ef_search(hnsw) 또는 probes(ivfflat) 값 목록")
+    parser.add_argument("--filtered", action="store_true",
+                        help="쿼리마다 company_id·최근 180일 필터 (pipeline 뉴스 검색과 같은 형태)")
+    parser.add_argument("--companies", type=int, default=2000, help="--filtered 의 회사 수")
+    parser.add_argument("--iterative-scan", default="",
+                        help="--filtered + hnsw 에서 비교할 쉼표 구분 hnsw.iterative_scan 값 (pgvector 0.8 이상, 기본: 설정 안 함)")
+    parser.add_argument("--keep", action="store_true", help="벤치마크 테이블 유지")
+    args = parser.parse_args()
+
+    sweep = [int(x) for x in (args.sweep or ("10,20,40,80,160" if args.method == "hnsw" else "1,5,10,20,50")).split(",")]
+    guc = "hnsw.ef_search" if args.method == "hnsw" else "ivfflat.probes"
+    scans = args.iterative_scan.split(",") if args.iterative_scan and args.filtered and args.method == "hnsw" else [None]
+
+    rng = np.random.default_rng(42)
+    conn = psycopg2.connect(dsn=args.dsn)
+    try:
+        print(f"loading {args.rows} x {args.dim} vectors ...")
+        _load_corpus(conn, args.rows, args.dim, args.companies, rng)
+        queries = [
+            (_vec_text(v), rng.choice(args.companies, COMPANIES_PER_QUERY, replace=False).tolist() if args.filtered else None)
+            for v in rng.standard_normal((args.queries, args.dim)).astype(np.float32)
+        ]
+
+        exact, exact_lat = _search(conn, queries, args.k, [
+            "SET LOCAL enable_indexscan = off",
+            "SET LOCAL enable_bitmapscan = off",
+        ])
+
+        build_s = _build_index(conn, args.method, args.m, args.ef_construction, args.lists)
+        print(f"index build: {build_s:.1f}s ({args.method})")
+        print(f"{'setting':<40}{'recall@' + str(args.k):>10}{'rows':>8}{'p50 ms':>10}{'p95 ms':>10}")
+
+        def report(name, found, lat):
+            rows = np.mean([len(f) for f in found])
+            print(f"{name:<40}{_recall(found, exact):>10.3f}{rows:>8.1f}"
+                  f"{np.percentile(lat, 50):>10.2f}{np.percentile(lat, 95):>10.2f}")
+
+        report("exact", exact, exact_lat)
+        for scan in scans:
+            for value in sweep:
+                stmts = [f"SET LOCAL {guc} = {value}"]
+                name = f"{guc}={value}"
+                if scan is not None:
+                    stmts.append(f"SET LOCAL hnsw.iterative_scan = {scan}")
+                    name += f" iterative_scan={scan}"
+                approx, lat = _search(conn, queries, args.k, stmts)
+                report(name, approx, lat)
+    finally:
+        if not args.keep:
+            with conn.cursor() as cur:
+                cur.execute(f"DROP TABLE IF EXISTS {TABLE}")
+            conn.commit()
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+회사 요약 검색: SQL(pgvector exact scan) vs 메모리 매핑 스냅샷 (합성 코퍼스)
+
+임시 테이블과 스냅샷에 같은 무작위 벡터를 적재하고, 요청마다 회사 --companies 개 중
+요약 top-5 를 찾는 비용을 비교합니다. 스냅샷 결과가 SQL 결과와 같은지도 확인합니다.
+
+    python -m backend.benchmarks.company_snapshot --dsn $DATABASE_URL --rows 5000
+    python -m backend.benchmarks.company_snapshot --no-db --rows 50000 --batch 64   # 스냅샷만
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+import psycopg2
+
+from backend.app.services.company_snapshot import TOP_K, load_snapshot, write_snapshot
+from backend.benchmarks.ann_recall import _vec_text
+
+TABLE = "company_snapshot_bench"
+
+
+def _load_table(conn, vectors: np.ndarray) -> None:
+    with conn.cursor() as cur:
+        cur.execute(f"DROP TABLE IF EXISTS {TABLE}")
+        cur.execute(
+            f"CREATE UNLOGGED TABLE {TABLE} (id INT PRIMARY KEY, summary_text TEXT, embedding VECTOR({vectors.shape[1]}))"
+        )
+        for i, v in enumerate(vectors):
+            cur.execute(f"INSERT INTO {TABLE} VALUES (%s, %s, %s::vector)", (i, f"summary {i}", _vec_text(v)))
+        cur.execute(f"ANALYZE {TABLE}")
+    conn.commit()
+
+
+def _sql_search(conn, queries: np.ndarray, ids_list: list[list[int]]) -> tuple[list[list[str]], np.ndarray]:
+    results, latencies = [], []
+    with conn.cursor() as cur:
+        for q, ids in zip(queries, ids_list):
+            start = time.perf_counter()
+            cur.execute(
+                f"SELECT summary_text FROM {TABLE} WHERE id = ANY(%s) AND embedding IS NOT NULL"
+                f" ORDER BY embedding <=> %s::vector LIMIT {TOP_K}",
+                (ids, _vec_text(q)),
+            )
+            results.append([r[0] for r in cur.fetchall()])
+            latencies.append((time.perf_counter() - start) * 1_000)
+    conn.rollback()
+    return results, np.array(latencies)
+
+
+def _snapshot_search(snapshot, queries: np.ndarray, ids_list: list[list[int]]) -> tuple[list[list[str]], np.ndarray]:
+    results, latencies = [], []
+    for q, ids in zip(queries, ids_list):
+        start = time.perf_counter()
+        results.extend(snapshot.search([q], [ids]))
+        latencies.append((time.perf_counter() - start) * 1_000)
+    return results, np.array(latencies)
+
+
+def _row(name: str, latencies: np.ndarray) -> str:
+    return f"{name:<24}{np.percentile(latencies, 50):>10.3f}{np.percentile(latencies, 95):>10.3f}"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--dsn", default=os.getenv("DATABASE_URL"))
+    parser.add_argument("--no-db", action="store_true", help="SQL 경로 없이 스냅샷만 측정")
+    parser.add_argument("--rows", type=int, default=5_000)
+    parser.add_argument("--dim", type=int, default=1536)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--companies", type=int, default=4, help="요청당 회사 수 (경력 수)")
+    parser.add_argument("--batch", type=int, default=32, help="retrieve_contexts 한 번에 묶는 지원자 수")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    vectors = rng.standard_normal((args.rows, args.dim)).astype(np.float32)
+    queries = rng.standard_normal((args.queries, args.dim)).astype(np.float32)
+    ids_list = [rng.choice(args.rows, size=args.companies, replace=False).tolist() for _ in range(args.queries)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        ids = list(range(args.rows))
+        write_snapshot(directory, ids, [f"company {i}" for i in ids], [f"summary {i}" for i in ids], vectors)
+        snapshot = load_snapshot(directory)
+        snap_results, snap_lat = _snapshot_search(snapshot, queries, ids_list)
+
+        start = time.perf_counter()
+        for i in range(0, args.queries, args.batch):
+            snapshot.search(queries[i:i + args.batch], ids_list[i:i + args.batch])
+        batch_us = (time.perf_counter() - start) / args.queries * 1e6
+
+    print(f"rows={args.rows}, dim={args.dim}, companies/request={args.companies}, queries={args.queries}")
+    print(f"{'path':<24}{'p50 ms':>10}{'p95 ms':>10}")
+    if not args.no_db:
+        conn = psycopg2.connect(dsn=args.dsn)
+        try:
+            print(f"loading {args.rows} x {args.dim} vectors ...")
+            _load_table(conn, vectors)
+            sql_results, sql_lat = _sql_search(conn, queries, ids_list)
+        finally:
+            with conn.cursor() as cur:
+                cur.execute(f"DROP TABLE IF EXISTS {TABLE}")
+            conn.commit()
+            conn.close()
+        print(_row("sql (exact)", sql_lat))
+        agree = np.mean([a == b for a, b in zip(sql_results, snap_results)])
+        print(f"top-{TOP_K} 일치율: {agree:.3f}")
+    print(_row("snapshot", snap_lat))
+    print(f"snapshot batch={args.batch}: {batch_us:.1f} µs/request")
+
+
+if __name__ == "__main__":
+    main()
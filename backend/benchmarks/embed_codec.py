@@ -0,0 +1,51 @@
+"""
+임베딩 캐시 직렬화 포맷 비교 (pickle list[float] vs packed float32)
+
+    python -m backend.benchmarks.embed_codec [--dim 1536] [--n 2000]
+"""
+import argparse
+import pickle
+import time
+
+import numpy as np
+
+from backend.app.utils.vector_codec import encode_vector, decode_vector
+
+
+def _bench(fn, payloads: list, repeat: int = 3) -> float:
+    """payload 1건당 평균 소요 시간(µs), repeat 회 중 최솟값"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for p in payloads:
+            fn(p)
+        best = min(best, time.perf_counter() - start)
+    return best / len(payloads) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--dim", type=int, default=1536)
+    parser.add_argument("--n", type=int, default=2000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    vectors = [rng.standard_normal(args.dim).astype(np.float32).tolist() for _ in range(args.n)]
+
+    pickled = [pickle.dumps(v) for v in vectors]
+    packed = [encode_vector(v) for v in vectors]
+
+    rows = [
+        ("pickle(list[float])", len(pickled[0]), _bench(pickle.loads, pickled), _bench(pickle.dumps, vectors)),
+        ("float32 v1", len(packed[0]), _bench(decode_vector, packed), _bench(encode_vector, vectors)),
+        ("legacy → float32", len(pickled[0]), _bench(decode_vector, pickled), float("nan")),
+    ]
+
+    print(f"dim={args.dim}, n={args.n}")
+    print(f"{'format':<22}{'bytes':>10}{'decode µs':>12}{'encode µs':>12}")
+    for name, size, dec, enc in rows:
+        print(f"{name:<22}{size:>10}{dec:>12.2f}{enc:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
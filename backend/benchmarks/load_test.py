@@ -0,0 +1,145 @@
+"""
+/api/infer 부하 테스트 (example_datas/talent_ex*.json 프로필 사용)
+
+처리량과 end-to-end p50/p95/p99 를 보고하고, in-process 모드에서는 @timed 단계별 분위수도 함께 보고합니다.
+in-process 모드는 기본으로 오프라인 LLM/임베딩 대역(LLM_BACKEND=fake)을 쓰므로 비용이 들지 않습니다.
+(DB·Redis 는 실제로 필요합니다)
+
+    python -m backend.benchmarks.load_test --requests 200 --concurrency 16
+    python -m backend.benchmarks.load_test --llm-latency-ms 1200 --llm-error-rate 0.05
+    python -m backend.benchmarks.load_test --url http://127.0.0.1:8000 --requests 500 --concurrency 32
+"""
+import argparse
+import asyncio
+import json
+import logging
+import pathlib
+import time
+from collections import Counter, defaultdict
+
+import httpx
+import numpy as np
+
+PROFILE_DIR = pathlib.Path(__file__).resolve().parents[2] / "example_datas"
+
+
+def load_profiles(pattern: str = "talent_ex*.json") -> list[dict]:
+    profiles = []
+    for path in sorted(PROFILE_DIR.glob(pattern)):
+        with open(path, encoding="utf-8") as f:
+            profiles.append(json.load(f))
+    if not profiles:
+        raise SystemExit(f"{PROFILE_DIR}/{pattern} 프로필이 없습니다.")
+    return profiles
+
+
+def _payload(profiles: list[dict], i: int, unique: bool) -> dict:
+    payload = dict(profiles[i % len(profiles)])
+    if unique:
+        # 결과 캐시·single-flight 에 걸리지 않도록 요청마다 프롬프트를 조금씩 다르게
+        payload["summary"] = f"{payload.get('summary', '')} #{i}"
+    return payload
+
+
+def _percentiles(samples: list[float]) -> tuple[float, float, float]:
+    if not samples:
+        return 0.0, 0.0, 0.0
+    p50, p95, p99 = np.percentile(samples, [50, 95, 99])
+    return float(p50), float(p95), float(p99)
+
+
+async def run_load(client: httpx.AsyncClient, path: str, profiles: list[dict],
+                   total: int, concurrency: int, unique: bool, no_cache: bool):
+    headers = {"Cache-Control": "no-cache"} if no_cache else {}
+    latencies: list[float] = []
+    statuses: Counter = Counter()
+    counter = iter(range(total))
+
+    async def worker():
+        for i in counter:
+            start = time.perf_counter()
+            try:
+                resp = await client.post(path, json=_payload(profiles, i, unique), headers=headers)
+                statuses[resp.status_code] += 1
+            except httpx.HTTPError as e:
+                statuses[type(e).__name__] += 1
+            latencies.append((time.perf_counter() - start) * 1_000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return time.perf_counter() - start, latencies, statuses
+
+
+def report(elapsed: float, latencies: list[float], statuses: Counter, stages: dict | None) -> None:
+    total = sum(statuses.values())
+    print(f"requests: {total}  elapsed: {elapsed:.2f}s  throughput: {total / elapsed:.1f} req/s")
+    print("status:", ", ".join(f"{k}={v}" for k, v in sorted(statuses.items(), key=str)))
+    print(f"{'stage':<40}{'count':>8}{'err':>6}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    print(f"{'end-to-end':<40}{len(latencies):>8}{'':>6}" + "".join(f"{v:>10.1f}" for v in _percentiles(latencies)))
+    for label, (samples, errors) in sorted((stages or {}).items()):
+        print(f"{label:<40}{len(samples):>8}{errors:>6}" + "".join(f"{v:>10.1f}" for v in _percentiles(samples)))
+
+
+async def run_in_process(args, profiles: list[dict]) -> None:
+    from backend.app.configs import settings
+    from backend.app.utils import profiler
+
+    if not args.real_openai:
+        settings.llm_backend = "fake"
+        settings.fake_llm_latency_p50_ms = args.llm_latency_ms
+        settings.fake_llm_error_rate = args.llm_error_rate
+        settings.fake_embed_latency_p50_ms = args.embed_latency_ms
+
+    from backend.app.main import app
+
+    stages: dict[str, tuple[list[float], int]] = defaultdict(lambda: ([], 0))
+    def observe(label: str, elapsed_ms: float, ok: bool) -> None:
+        samples, errors = stages[label]
+        samples.append(elapsed_ms)
+        if not ok:
+            stages[label] = (samples, errors + 1)
+
+    profiler.add_observer(observe)
+    try:
+        async with app.router.lifespan_context(app):
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://load-test", timeout=args.timeout) as client:
+                result = await run_load(client, args.path, profiles, args.requests, args.concurrency,
+                                        args.unique, args.no_cache)
+    finally:
+        profiler.remove_observer(observe)
+    report(*result, dict(stages))
+
+
+async def run_remote(args, profiles: list[dict]) -> None:
+    limits = httpx.Limits(max_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.url, timeout=args.timeout, limits=limits) as client:
+        result = await run_load(client, args.path, profiles, args.requests, args.concurrency,
+                                args.unique, args.no_cache)
+    report(*result, None)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--url", default=None, help="지정 시 실행 중인 서버에 요청 (미지정: in-process)")
+    parser.add_argument("--path", default="/api/infer")
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--unique", action=argparse.BooleanOptionalAction, default=True,
+                        help="요청마다 프로필을 조금씩 바꿔 캐시/병합을 피함")
+    parser.add_argument("--no-cache", action=argparse.BooleanOptionalAction, default=True,
+                        help="Cache-Control: no-cache 로 결과 캐시 우회")
+    parser.add_argument("--real-openai", action="store_true", help="in-process 에서도 실제 OpenAI 사용")
+    parser.add_argument("--llm-latency-ms", type=float, default=800.0, help="대역 LLM 지연 중앙값")
+    parser.add_argument("--llm-error-rate", type=float, default=0.0)
+    parser.add_argument("--embed-latency-ms", type=float, default=40.0)
+    args = parser.parse_args()
+
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    profiles = load_profiles()
+    asyncio.run(run_remote(args, profiles) if args.url else run_in_process(args, profiles))
+
+
+if __name__ == "__main__":
+    main()
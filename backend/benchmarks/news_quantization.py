@@ -0,0 +1,188 @@
+"""
+company_news.embedding 저장 형식별 크기 / recall@k (float32 vector 기준)
+
+- vector    float32 그대로 (기준)
+- halfvec   float16 으로 저장, 쿼리도 halfvec 으로 캐스트해 정확한 코사인 거리
+- binary    binary_quantize (부호 비트) 해밍 거리만으로 top-k
+- binary+C  해밍 거리로 후보 C 개 → 저장 형식(--rerank-type)의 정확한 거리로 재정렬
+            (backend NEWS_BINARY_RERANK_CANDIDATES = C 와 같은 방식)
+
+DB 모드는 company_news 에서 표본을 읽어 실제 컬럼 크기·테이블 크기를 함께 보고하고,
+(halfvec·binary_quantize 가 없는 pgvector 0.7 미만이면 vector 크기만 재고 나머지는 형식 크기로 추정)
+--synthetic 은 군집 구조가 있는 무작위 벡터로 계산만 합니다.
+쿼리는 표본에서 떼어낸 뉴스 임베딩입니다. (표본 안 exact 검색 - 회사·날짜 필터 없음)
+
+    python -m backend.benchmarks.news_quantization --dsn $DATABASE_URL --sample 20000
+    python -m backend.benchmarks.news_quantization --synthetic --rows 50000 --candidates 20,40,80,160
+"""
+import argparse
+import os
+
+import numpy as np
+import psycopg2
+
+STORAGE_SQL = """
+    SELECT format_type(a.atttypid, a.atttypmod),
+           (SELECT count(*) FROM company_news WHERE embedding IS NOT NULL),
+           avg(pg_column_size(s.embedding::vector)),
+           avg(pg_column_size(s.embedding::halfvec)),
+           avg(pg_column_size(binary_quantize(s.embedding)))
+    FROM (SELECT embedding FROM company_news WHERE embedding IS NOT NULL LIMIT 10000) s,
+         pg_attribute a
+    WHERE a.attrelid = 'company_news'::regclass AND a.attname = 'embedding'
+    GROUP BY 1
+"""
+# pgvector 0.7 미만 - halfvec·binary_quantize 없음
+VECTOR_STORAGE_SQL = """
+    SELECT format_type(a.atttypid, a.atttypmod),
+           (SELECT count(*) FROM company_news WHERE embedding IS NOT NULL),
+           avg(pg_column_size(s.embedding)),
+           max(vector_dims(s.embedding))
+    FROM (SELECT embedding FROM company_news WHERE embedding IS NOT NULL LIMIT 10000) s,
+         pg_attribute a
+    WHERE a.attrelid = 'company_news'::regclass AND a.attname = 'embedding'
+    GROUP BY 1
+"""
+HALFVEC_MIN_PGVECTOR = (0, 7, 0)
+TABLE_SIZE_SQL = """
+    SELECT coalesce(sum(pg_table_size(relid)), 0), coalesce(sum(pg_indexes_size(relid)), 0)
+    FROM pg_partition_tree('company_news')
+"""
+
+
+def _normalize(x: np.ndarray) -> np.ndarray:
+    return x / np.maximum(np.linalg.norm(x, axis=1, keepdims=True), 1e-12)
+
+
+def _topk(scores: np.ndarray, k: int) -> np.ndarray:
+    """점수 큰 순 상위 k 개 인덱스 (행마다)"""
+    part = np.argpartition(-scores, min(k, scores.shape[1] - 1), axis=1)[:, :k]
+    order = np.take_along_axis(scores, part, axis=1).argsort(axis=1)[:, ::-1]
+    return np.take_along_axis(part, order, axis=1)
+
+
+def _recall(found: np.ndarray, truth: np.ndarray) -> float:
+    return float(np.mean([len(set(f) & set(t)) / len(t) for f, t in zip(found, truth)]))
+
+
+def _hamming(query_bits: np.ndarray, corpus_bits: np.ndarray) -> np.ndarray:
+    """(Q, B) x (N, B) packbits → (Q, N) 해밍 거리"""
+    return np.stack([np.bitwise_count(corpus_bits ^ q).sum(axis=1) for q in query_bits])
+
+
+def evaluate(corpus: np.ndarray, queries: np.ndarray, k: int, candidates: list[int], rerank_type: str):
+    """(이름, recall@k) 목록"""
+    base = _normalize(corpus.astype(np.float32))
+    q32 = _normalize(queries.astype(np.float32))
+    truth = _topk(q32 @ base.T, k)
+
+    half = _normalize(corpus.astype(np.float16).astype(np.float32))
+    q16 = _normalize(queries.astype(np.float16).astype(np.float32))
+    rows = [("vector (float32)", 1.0), ("halfvec (float16)", _recall(_topk(q16 @ half.T, k), truth))]
+
+    # binary_quantize: 양수면 1
+    corpus_bits = np.packbits(corpus > 0, axis=1)
+    hamming = _hamming(np.packbits(queries > 0, axis=1), corpus_bits)
+    rows.append(("binary", _recall(_topk(-hamming.astype(np.float32), k), truth)))
+
+    exact, q_exact = (half, q16) if rerank_type == "halfvec" else (base, q32)
+    for c in candidates:
+        cand = _topk(-hamming.astype(np.float32), c)
+        scores = np.einsum("qd,qcd->qc", q_exact, exact[cand])
+        found = np.take_along_axis(cand, _topk(scores, k), axis=1)
+        rows.append((f"binary+{c} → {rerank_type}", _recall(found, truth)))
+    return rows
+
+
+def _synthetic(rows: int, dim: int, rng: np.random.Generator) -> np.ndarray:
+    """주제 군집 + 잡음 (순수 가우시안보다 실제 임베딩에 가까운 이웃 구조)"""
+    centers = rng.standard_normal((64, dim)).astype(np.float32)
+    return centers[rng.integers(64, size=rows)] + 0.6 * rng.standard_normal((rows, dim)).astype(np.float32)
+
+
+def _load_sample(conn, n: int) -> tuple[np.ndarray, str]:
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            SELECT format_type(atttypid, atttypmod) FROM pg_attribute
+            WHERE attrelid = 'company_news'::regclass AND attname = 'embedding'
+            """
+        )
+        column = cur.fetchone()[0]
+        cur.execute(
+            "SELECT embedding::vector::real[] FROM company_news WHERE embedding IS NOT NULL ORDER BY random() LIMIT %s",
+            (n,),
+        )
+        return np.asarray([r[0] for r in cur.fetchall()], dtype=np.float32), column
+
+
+def _pgvector_version(cur) -> tuple[int, ...]:
+    cur.execute("SELECT extversion FROM pg_extension WHERE extname = 'vector'")
+    row = cur.fetchone()
+    return tuple(int(x) for x in row[0].split(".")) if row else (0,)
+
+
+def _storage_report(conn) -> None:
+    with conn.cursor() as cur:
+        version = _pgvector_version(cur)
+        if version >= HALFVEC_MIN_PGVECTOR:
+            cur.execute(STORAGE_SQL)
+            column, count, vec_bytes, half_bytes, bit_bytes = cur.fetchone()
+        else:
+            cur.execute(VECTOR_STORAGE_SQL)
+            column, count, vec_bytes, dim = cur.fetchone()
+            half_bytes, bit_bytes = 8 + 2 * dim, 8 + dim / 8
+            print(f"pgvector {'.'.join(map(str, version))}: halfvec·bit 크기는 형식 크기로 추정 (0.7 이상에서 실측)")
+        cur.execute(TABLE_SIZE_SQL)
+        table_bytes, index_bytes = cur.fetchone()
+    conn.rollback()
+    print(f"company_news.embedding = {column}, rows={count:,}")
+    print(f"table {table_bytes / 2**20:,.1f} MiB, indexes {index_bytes / 2**20:,.1f} MiB")
+    _print_storage(count, float(vec_bytes), float(half_bytes), float(bit_bytes))
+
+
+def _print_storage(count: int, vec_bytes: float, half_bytes: float, bit_bytes: float) -> None:
+    print(f"{'format':<12}{'bytes/row':>12}{'total MiB':>12}{'vs vector':>12}")
+    for name, size in (("vector", vec_bytes), ("halfvec", half_bytes), ("bit", bit_bytes)):
+        print(f"{name:<12}{size:>12,.0f}{count * size / 2**20:>12,.1f}{size / vec_bytes:>12.1%}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--dsn", default=os.getenv("DATABASE_URL"))
+    parser.add_argument("--synthetic", action="store_true", help="DB 없이 합성 벡터로 계산")
+    parser.add_argument("--rows", type=int, default=20_000, help="--synthetic 코퍼스 크기")
+    parser.add_argument("--dim", type=int, default=1536)
+    parser.add_argument("--sample", type=int, default=20_000, help="DB 에서 읽을 표본 크기")
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--candidates", default="20,40,80,160", help="쉼표 구분 해밍 거리 후보 수")
+    parser.add_argument("--rerank-type", choices=("vector", "halfvec"), default="halfvec",
+                        help="재정렬에 쓰는 저장 형식 (NEWS_EMBEDDING_TYPE)")
+    args = parser.parse_args()
+    candidates = [int(x) for x in args.candidates.split(",")]
+
+    if args.synthetic:
+        vectors = _synthetic(args.rows + args.queries, args.dim, np.random.default_rng(42))
+        dim = args.dim
+        # pgvector 값 크기: vector/halfvec = 헤더 8B + 원소, bit = 헤더 8B + 비트
+        _print_storage(args.rows, 8 + 4 * dim, 8 + 2 * dim, 8 + dim / 8)
+    else:
+        conn = psycopg2.connect(dsn=args.dsn)
+        try:
+            _storage_report(conn)
+            vectors, column = _load_sample(conn, args.sample + args.queries)
+        finally:
+            conn.close()
+        if column.startswith("halfvec"):
+            print("주의: 컬럼이 이미 halfvec 이라 기준(float32)도 float16 으로 반올림된 값입니다.")
+
+    queries, corpus = vectors[:args.queries], vectors[args.queries:]
+    print(f"\ncorpus={len(corpus):,}, queries={len(queries)}, k={args.k}")
+    print(f"{'format':<28}{'recall@' + str(args.k):>10}")
+    for name, recall in evaluate(corpus, queries, args.k, candidates, args.rerank_type):
+        print(f"{name:<28}{recall:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
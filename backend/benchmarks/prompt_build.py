@@ -0,0 +1,88 @@
+"""
+preprocess / build_prompt 비용 비교 (경력 수백 건짜리 큰 프로필)
+
+    python -m backend.benchmarks.prompt_build [--positions 300] [--n 200] [--budget 8000]
+
+- legacy: 전처리 결과를 임베딩용으로 한 번, build_prompt 안에서 또 한 번 (RequestContext 도입 전 경로)
+- context: RequestContext 로 전처리 1회 + 미리 렌더링한 프롬프트 조각 결합 (예산 미적용)
+- budget: context + 토큰 예산 적용 (토큰 계산·축약 비용 포함)
+"""
+import argparse
+import json
+import logging
+import time
+from pathlib import Path
+
+from backend.app.configs import settings
+from backend.app.models.candidate import Candidate
+from backend.app.services import pipeline
+from backend.app.utils.tokens import count_tokens, tokenizer_name
+
+SAMPLE_PATH = Path(__file__).resolve().parents[1] / "app" / "examples" / "sample_candidate.json"
+
+
+def large_candidate(positions: int) -> Candidate:
+    data = json.loads(SAMPLE_PATH.read_text(encoding="utf-8"))
+    base = data["positions"]
+    data["positions"] = [
+        {**base[i % len(base)], "title": f"{base[i % len(base)]['title']} #{i}"} for i in range(positions)
+    ]
+    return Candidate.model_validate(data)
+
+
+def _legacy(candidate: Candidate, contexts: list[str]) -> str:
+    pipeline.preprocess(candidate)          # 임베딩 텍스트
+    return pipeline.build_prompt(candidate, contexts)
+
+
+def _context(candidate: Candidate, contexts: list[str]) -> str:
+    req = pipeline.RequestContext(candidate)
+    req.text                                # 임베딩 텍스트
+    req.contexts = contexts
+    return req.build_prompt()
+
+
+def _bench(fn, candidate: Candidate, contexts: list[str], n: int, repeat: int = 3) -> float:
+    """요청 1건당 평균 소요 시간(µs), repeat 회 중 최솟값"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(n):
+            fn(candidate, contexts)
+        best = min(best, time.perf_counter() - start)
+    return best / n * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--positions", type=int, default=300)
+    parser.add_argument("--n", type=int, default=200)
+    parser.add_argument("--budget", type=int, default=settings.prompt_token_budget)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)        # @timed 디버그 로그·예산 초과 경고 제외
+
+    candidate = large_candidate(args.positions)
+    contexts = [f"회사 요약/뉴스 {i}" for i in range(15)]
+
+    settings.prompt_token_budget = 0
+    full = _context(candidate, contexts)
+    assert _legacy(candidate, contexts) == full
+    rows = [
+        ("preprocess", _bench(lambda c, _ctx: pipeline.preprocess(c), candidate, contexts, args.n)),
+        ("legacy (preprocess x2)", _bench(_legacy, candidate, contexts, args.n)),
+        ("RequestContext", _bench(_context, candidate, contexts, args.n)),
+    ]
+    settings.prompt_token_budget = args.budget
+    trimmed = _context(candidate, contexts)
+    rows.append((f"+ budget {args.budget}", _bench(_context, candidate, contexts, args.n)))
+
+    model = pipeline.LLM_MODEL
+    print(f"positions={args.positions}, n={args.n}, tokenizer={tokenizer_name(model)}")
+    print(f"prompt tokens: {count_tokens(full, model)} → {count_tokens(trimmed, model)} (budget {args.budget})")
+    print(f"{'path':<26}{'µs/request':>12}")
+    for name, us in rows:
+        print(f"{name:<26}{us:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+import asyncio
+import json
+import pathlib
+import time
+from contextlib import asynccontextmanager, contextmanager
+
+import anyio
+import httpx
+import pytest
+
+from backend.app.apis.v1 import infer as infer_api
+from backend.app.main import app
+from backend.app.services import async_pipeline
+from backend.app.utils.profiler import timed
+
+LLM_LATENCY = 0.05
+FAKE_LLM_RAW = json.dumps({"tags": [{"tag": "리더쉽", "evidence": "Tech Lead"}]})
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture()
+def sample_candidate():
+    here = pathlib.Path(__file__).parent
+    with open(here / "sample_candidate.json", encoding="utf-8") as f:
+        return json.load(f)
+
+
+class FakeAsyncConn:
+    def __init__(self):
+        self._queues = [[(0, "요약1", 0.1), (1, "뉴스1", 0.1), (1, "뉴스2", 0.2)]]
+        self.args = []
+    async def fetch(self, _sql, *args):
+        self.args.append(args)
+        return self._queues.pop(0)
+
+
+@pytest.mark.anyio
+async def test_timed_supports_coroutines(caplog):
+    @timed("⏱ coro")
+    async def coro():
+        await asyncio.sleep(0)
+        return "done"
+
+    with caplog.at_level("DEBUG", logger="prof"):
+        assert await coro() == "done"
+    assert any(r.getMessage().startswith("⏱ coro:") for r in caplog.records)
+
+
+@pytest.mark.anyio
+async def test_retrieve_context_async(monkeypatch):
+    async def fake_emb(_text):
+        return [0.1, 0.2]
+    monkeypatch.setattr(async_pipeline, "get_cached_embedding_async", fake_emb)
+    async def fake_resolve(names, _conn):
+        return [7] if names else []
+    monkeypatch.setattr(async_pipeline.company_directory, "resolve_ids_async", fake_resolve)
+
+    conn = FakeAsyncConn()
+    ctx = await async_pipeline.retrieve_context("txt", ["네이버"], conn)
+
+    assert ctx == ["요약1", "뉴스1", "뉴스2"]
+    # 회사/뉴스 검색이 한 번의 fetch 로 처리
+    assert conn.args == [([0.1, 0.2], [7])]
+
+
+@pytest.fixture
+def stub_io(monkeypatch):
+    """DB·임베딩·LLM 을 고정 지연을 가진 가짜 구현으로 교체 (sync/async 양쪽)"""
+    @contextmanager
+    def fake_conn():
+        yield None
+
+    @asynccontextmanager
+    async def fake_async_conn():
+        yield None
+
+    def slow_llm(_prompt):
+        time.sleep(LLM_LATENCY)
+        return FAKE_LLM_RAW
+
+    async def slow_llm_async(_prompt):
+        await asyncio.sleep(LLM_LATENCY)
+        return FAKE_LLM_RAW
+
+    async def no_ctx_async(*_a):
+        return []
+
+    monkeypatch.setattr(infer_api.settings, "result_cache_enabled", False)
+    monkeypatch.setattr(infer_api, "get_db_connection", fake_conn)
+    monkeypatch.setattr(infer_api, "retrieve_context", lambda *_a: [])
+    monkeypatch.setattr(infer_api, "call_llm", slow_llm)
+    monkeypatch.setattr(infer_api, "get_async_db_connection", fake_async_conn)
+    monkeypatch.setattr(async_pipeline, "retrieve_context", no_ctx_async)
+    monkeypatch.setattr(async_pipeline, "call_llm", slow_llm_async)
+
+
+async def _throughput(path: str, payload: dict, n: int) -> float:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        start = time.perf_counter()
+        responses = await asyncio.gather(*(client.post(path, json=payload) for _ in range(n)))
+        elapsed = time.perf_counter() - start
+    assert all(r.status_code == 200 for r in responses)
+    return n / elapsed
+
+
+@pytest.mark.anyio
+async def test_async_handler_outperforms_sync_under_load(stub_io, sample_candidate, monkeypatch):
+    """스레드풀이 4개로 제한된 상황에서 동시 32건 처리량 비교"""
+    # 기본 limiter 는 이벤트 루프 전역이라 테스트가 끝나면 원래 값으로 되돌림
+    monkeypatch.setattr(anyio.to_thread.current_default_thread_limiter(), "total_tokens", 4)
+
+    sync_rps = await _throughput("/api/infer", sample_candidate, 32)
+    async_rps = await _throughput("/api/infer/async", sample_candidate, 32)
+
+    assert async_rps > sync_rps * 2
+
+
+def test_timed_notifies_observers():
+    from backend.app.utils import profiler
+
+    seen = []
+    observer = lambda label, ms, ok: seen.append((label, ok))
+    profiler.add_observer(observer)
+    try:
+        @timed("stage")
+        def boom():
+            raise ValueError
+
+        timed("stage")(lambda: 1)()
+        with pytest.raises(ValueError):
+            boom()
+    finally:
+        profiler.remove_observer(observer)
+
+    assert seen == [("stage", True), ("stage", False)]
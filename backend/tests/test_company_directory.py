@@ -0,0 +1,164 @@
+import os
+
+import pytest
+
+from backend.app.services import company_directory as cd_mod
+from backend.app.services import pipeline
+from backend.app.services.company_directory import CompanyDirectory
+
+
+def _row(company_id, name, kr=None, en=None, url=None, products=()):
+    seed_corp = {"corpNameKr": kr, "corpNameEn": en, "homeUrl": url}
+    return (company_id, name, seed_corp, [{"prodNameKr": p, "prodNameEn": ""} for p in products])
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+    def execute(self, _sql, params=None):
+        self.conn.loads.append(params[0])
+    def fetchall(self):
+        since = self.conn.loads[-1]
+        return [r for r in self.conn.rows if r[0] > since]
+    def __enter__(self):
+        return self
+    def __exit__(self, *exc):
+        pass
+
+
+class FakeConn:
+    def __init__(self, rows):
+        self.rows = rows
+        self.loads = []
+    def cursor(self):
+        return FakeCursor(self)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cd_mod.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(cd_mod.settings, "company_map_refresh_interval", 60.0)
+    monkeypatch.setattr(cd_mod.settings, "company_map_miss_refresh_interval", 5.0)
+    monkeypatch.setattr(cd_mod.settings, "company_fuzzy_match_threshold", 0.6)
+    return now
+
+
+@pytest.fixture
+def rows():
+    return [
+        _row(1, "비바리퍼블리카", "비바리퍼블리카", "VIVA REPUBLICA CO.,LTD.", "toss.im", ["토스", "토스보험파트너"]),
+        _row(2, "네이버", "네이버", "NAVER Corporation", "navercorp.com", ["네이버", "밴드"]),
+        _row(3, "리디", "밀리의서재", "MILLY'S LIBRARY CO.,LTD.", "www.millie.co.kr"),
+    ]
+
+
+@pytest.mark.parametrize("raw, norm", [
+    ("(주)네이버", "네이버"),
+    ("㈜ 네이버", "네이버"),
+    ("NAVER Corp.", "naver"),
+    ("VIVA REPUBLICA CO.,LTD.", "vivarepublica"),
+    ('Genie Music (the former "KT Music")', "geniemusic"),
+])
+def test_normalize_company_name(raw, norm):
+    assert cd_mod.normalize_company_name(raw) == norm
+
+
+def test_resolve_ids_uses_aliases_and_dedupes(clock, rows):
+    directory = CompanyDirectory()
+    conn = FakeConn(rows)
+
+    names = ["Toss", "토스", "NAVER Corp", "밀리의서재", "(주)비바리퍼블리카", "Kookmin Bank"]
+    assert directory.resolve_ids(names, conn) == [1, 2, 3]
+    assert directory.resolve_ids(["네이버"], conn) == [2]
+    assert conn.loads == [0]
+
+
+def test_fuzzy_match_above_threshold_only(clock, rows):
+    directory = CompanyDirectory()
+    conn = FakeConn(rows)
+
+    assert directory.resolve_ids(["Viva Republic"], conn) == [1]
+    # 부분 일치가 약한 이름은 엉뚱한 회사로 매칭하지 않음
+    assert directory.resolve_ids(["네이버웹툰컴퍼니"], conn) == []
+    assert directory.stats()["fuzzy_hits"] == 1
+
+
+def test_unknown_name_triggers_incremental_reload(clock, rows):
+    directory = CompanyDirectory()
+    conn = FakeConn(rows)
+    directory.resolve_ids(["네이버"], conn)
+
+    conn.rows.append(_row(4, "요기요", "위대한상상", "Wesang Co.,Ltd.", "wesang.com", ["요기요"]))
+    # miss 적재 간격 이내에는 DB 를 다시 읽지 않음
+    assert directory.resolve_ids(["위대한상상"], conn) == []
+    clock[0] += 5.0
+    assert directory.resolve_ids(["위대한상상"], conn) == [4]
+    # 증분 적재는 마지막으로 읽은 id 이후만 조회
+    assert conn.loads == [0, 3]
+    assert len(directory) == 4
+
+
+def test_periodic_full_refresh_drops_deleted(clock, rows):
+    directory = CompanyDirectory()
+    conn = FakeConn(rows)
+    assert directory.resolve_ids(["리디"], conn) == [3]
+
+    conn.rows.pop()
+    clock[0] += 60.0
+    assert directory.resolve_ids(["리디"], conn) == []
+    assert directory.stats()["full_loads"] == 2
+
+
+def test_async_resolve_parses_json_text(clock, rows):
+    import asyncio, json
+
+    class FakeAsyncConn:
+        async def fetch(self, _sql, since):
+            return [(r[0], r[1], json.dumps(r[2]), json.dumps(r[3])) for r in rows if r[0] > since]
+
+    directory = CompanyDirectory()
+    assert asyncio.run(directory.resolve_ids_async(["toss"], FakeAsyncConn())) == [1]
+
+
+# ---------- 실행 계획 회귀 테스트 (실제 Postgres + pgvector 필요) ----------
+TEST_DSN = os.getenv("TEST_DATABASE_URL")
+
+
+@pytest.mark.skipif(not TEST_DSN, reason="TEST_DATABASE_URL 미설정")
+def test_context_query_plan_uses_company_news_index():
+    import psycopg2
+
+    conn = psycopg2.connect(dsn=TEST_DSN)
+    try:
+        with conn.cursor() as cur:
+            cur.execute("CREATE EXTENSION IF NOT EXISTS vector")
+            # 같은 세션의 임시 테이블이 실제 테이블을 가림
+            cur.execute("""
+                CREATE TEMP TABLE company (
+                    id INT PRIMARY KEY, name TEXT, summary_text TEXT, embedding VECTOR(3)
+                ) ON COMMIT DROP
+            """)
+            cur.execute("""
+                CREATE TEMP TABLE company_news (
+                    id SERIAL PRIMARY KEY, company_id INT NOT NULL, title TEXT,
+                    news_date DATE NOT NULL, embedding VECTOR(3)
+                ) ON COMMIT DROP
+            """)
+            cur.execute(
+                "CREATE INDEX company_news_company_id_news_date_idx ON company_news (company_id, news_date)"
+            )
+            cur.execute("ANALYZE company; ANALYZE company_news")
+            cur.execute("SET LOCAL enable_seqscan = off")
+            cur.execute(
+                "EXPLAIN (FORMAT TEXT) " + pipeline.CONTEXT_SQL.rstrip().rstrip(";"),
+                {"ids": [1, 2], "vec": "[0.1,0.2,0.3]"},
+            )
+            plan = "\n".join(row[0] for row in cur.fetchall())
+    finally:
+        conn.rollback()
+        conn.close()
+
+    assert "company_news_company_id_news_date_idx" in plan
+    # 이름 → id 서브쿼리가 사라졌는지
+    assert "SubPlan" not in plan
@@ -0,0 +1,104 @@
+from datetime import date
+
+import pytest
+
+from backend.app.models.candidate import Candidate, Position
+from backend.app.services import company_facts, pipeline, rule_tagger
+from backend.app.services.company_directory import CompanyEvent, CompanyFacts
+from backend.app.services.company_facts import MonthFacts, TenureFacts
+
+
+def _position(start, end=None, company="리디"):
+    dates = {"start": start} if end is None else {"start": start, "end": end}
+    return Position(title="Backend Engineer", companyName=company, description="서비스 개발",
+                    startEndDate=dates, companyLocation="서울")
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+    def execute(self, _sql, params):
+        self.conn.queries.append(params)
+    def fetchall(self):
+        params = self.conn.queries[-1]
+        return [(idx, self.conn.months, self.conn.events) for idx in params["idxs"]]
+    def __enter__(self):
+        return self
+    def __exit__(self, *exc):
+        pass
+
+
+class FakeConn:
+    def __init__(self, months, events=None):
+        self.months, self.events = months, events
+        self.queries = []
+    def cursor(self):
+        return FakeCursor(self)
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    company_facts.local_cache.clear()
+
+
+def test_tenure_window_covers_whole_months():
+    assert company_facts.tenure_window(_position({"year": 2022, "month": 2}, {"year": 2024, "month": 2})) == (
+        date(2022, 2, 1), date(2024, 2, 29),
+    )
+    # 재직 중이면 오늘이 속한 달 말일까지, 월이 없으면 연초~연말
+    assert company_facts.tenure_window(_position({"year": 2023}), today=date(2025, 1, 15)) == (
+        date(2023, 1, 1), date(2025, 1, 31),
+    )
+    assert company_facts.tenure_window(_position({})) is None
+
+
+def test_tenure_facts_one_query_then_cache():
+    conn = FakeConn(
+        months=[["2022-02-01", 150, 726765, 30000000000], ["2023-01-01", 190, None, 40000000000]],
+        events=[["2022-06-10", "funding", "series D"]],
+    )
+    windows = [(3, date(2022, 1, 1), date(2023, 1, 31)), None, (4, date(2020, 1, 1), date(2020, 12, 31))]
+
+    facts = company_facts.tenure_facts(windows, conn)
+
+    assert len(conn.queries) == 1 and conn.queries[0]["idxs"] == [0, 2]
+    assert facts[1] is None
+    assert facts[0].months[0] == MonthFacts(date(2022, 2, 1), 150, 726765, 30000000000)
+    assert facts[0].events == (CompanyEvent(date(2022, 6, 10), "funding", "series D"),)
+    assert facts[0].peak_headcount == 190
+    assert facts[0].headcount_growth == pytest.approx(190 / 150 - 1)
+
+    assert company_facts.tenure_facts(windows, conn) == facts
+    assert len(conn.queries) == 1                       # 두 번째는 캐시에서
+
+
+def test_rules_use_headcount_during_tenure():
+    candidate = Candidate(firstName="A", lastName="B", positions=[_position({"year": 2022, "month": 2}, {"year": 2024, "month": 1})])
+    facts = [CompanyFacts(3, 188, ())]
+    months = (MonthFacts(date(2022, 2, 1), 120, None, None), MonthFacts(date(2024, 1, 1), 190, None, None))
+    tenure = TenureFacts(3, date(2022, 2, 1), date(2024, 1, 31), months, ())
+
+    outcome = rule_tagger.apply_rules(candidate, facts, 150, tenures=[tenure], growth_min_rate=0.3)
+    tags = {t.tag: t.evidence for t in outcome.tags}
+
+    assert tags["대규모 회사 경험"] == "리디 재직 (당시 직원 190명)"
+    assert tags["성장기 스타트업 경험"] == "리디 재직 중 직원 120→190명"
+    # 기간 사실이 없으면 현재 직원 수(188명)로 판정하지 않고 LLM 에 맡김
+    without_tenure = rule_tagger.apply_rules(candidate, facts, 150)
+    assert "대규모 회사 경험" not in {t.tag for t in without_tenure.tags}
+    assert "대규모 회사 경험" not in without_tenure.resolved
+
+
+def test_load_company_facts_fills_every_request_with_one_query(monkeypatch):
+    positions = [_position({"year": 2022, "month": 2}), _position({"year": 2019, "month": 1}, {"year": 2020, "month": 1}, "모름")]
+    reqs = [pipeline.RequestContext(Candidate(firstName="A", lastName="B", positions=positions)) for _ in range(2)]
+    monkeypatch.setattr(pipeline.company_directory, "facts_for", lambda names: [
+        CompanyFacts(3, 188, ()) if n == "리디" else None for n in names
+    ])
+    conn = FakeConn(months=[["2022-02-01", 150, None, None]])
+
+    pipeline.load_company_facts(reqs, conn)
+
+    assert len(conn.queries) == 1 and conn.queries[0]["cids"] == [3, 3]
+    for req in reqs:
+        assert req.tenures[0].peak_headcount == 150 and req.tenures[1] is None
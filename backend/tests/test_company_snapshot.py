@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+
+from backend.app.services import company_snapshot as cs
+from backend.app.services import pipeline
+
+DIM = 8
+
+
+def _write(directory, vectors, ids=None, no_embedding=()):
+    ids = ids or list(range(1, len(vectors) + 1))
+    return cs.write_snapshot(directory, ids, [f"회사{i}" for i in ids], [f"요약{i}" for i in ids],
+                             vectors, no_embedding)
+
+
+@pytest.fixture()
+def vectors():
+    return np.random.default_rng(0).standard_normal((6, DIM)).astype(np.float32)
+
+
+@pytest.fixture()
+def store(tmp_path, monkeypatch):
+    monkeypatch.setattr(cs.settings, "company_snapshot_dir", str(tmp_path))
+    monkeypatch.setattr(cs.settings, "company_snapshot_check_interval", 0.0)
+    store = cs.SnapshotStore()
+    monkeypatch.setattr(pipeline, "company_snapshot", store)
+    return store
+
+
+def _cosine_order(vectors, query, ids):
+    dist = {i: 1 - vectors[i - 1] @ query / (np.linalg.norm(vectors[i - 1]) * np.linalg.norm(query)) for i in ids}
+    return [f"요약{i}" for i in sorted(ids, key=dist.get)]
+
+
+def test_search_matches_cosine_distance_order(tmp_path, vectors):
+    original = vectors.copy()
+    _write(tmp_path, vectors, no_embedding=[99])
+    snapshot = cs.load_snapshot(tmp_path)
+    queries = np.random.default_rng(1).standard_normal((2, DIM)).astype(np.float32)
+
+    assert isinstance(snapshot.matrix, np.memmap)           # 프로세스 간 페이지 공유
+    assert np.array_equal(vectors, original)                # 입력을 바꾸지 않음
+    got = snapshot.search(list(queries), [[1, 2, 3, 4, 5, 6], [6, 2, 99]])
+    assert got[0] == _cosine_order(vectors, queries[0], [1, 2, 3, 4, 5, 6])[:cs.TOP_K]
+    assert got[1] == _cosine_order(vectors, queries[1], [6, 2])
+    assert snapshot.covers([1, 99]) and not snapshot.covers([1, 7])
+
+
+def test_unchanged_export_keeps_version_and_new_version_hot_reloads(tmp_path, vectors, store):
+    assert store.get() is None                              # 아직 스냅샷 없음
+    v1 = _write(tmp_path, vectors)
+    assert _write(tmp_path, vectors) == v1
+    assert store.get().version == v1
+
+    v2 = _write(tmp_path, vectors[::-1].copy())
+    assert v2 != v1 and store.get().version == v2
+    assert store.stats()["loads"] == 2
+
+    (tmp_path / cs.MANIFEST).write_text("{broken", encoding="utf-8")
+    assert store.get().version == v2                        # 깨진 manifest 는 무시하고 이전 버전 유지
+    assert store.stats()["load_errors"] == 1
+
+
+def test_retrieve_context_reads_company_summaries_from_snapshot(tmp_path, vectors, store, monkeypatch):
+    _write(tmp_path, vectors)
+    monkeypatch.setattr(pipeline.company_directory, "resolve_ids", lambda names, _conn: [2, 3])
+    monkeypatch.setattr(pipeline, "get_cached_embedding", lambda _text: vectors[2])
+    executed = []
+
+    class FakeCursor:
+        def execute(self, sql, params=None):
+            executed.append(sql)
+        def fetchall(self):
+            return [(1, "뉴스", 0.1)]
+        def __enter__(self):
+            return self
+        def __exit__(self, *exc):
+            pass
+
+    class FakeConn:
+        def cursor(self):
+            return FakeCursor()
+
+    assert pipeline.retrieve_context("지원자", ["a", "b"], FakeConn()) == ["요약3", "요약2", "뉴스"]
+    assert executed[-1] == pipeline.NEWS_CONTEXT_SQL
+
+    monkeypatch.setattr(pipeline.company_directory, "resolve_ids", lambda names, _conn: [2, 42])
+    assert pipeline.retrieve_context("지원자", ["a", "b"], FakeConn()) == ["뉴스"]
+    assert executed[-1] == pipeline.CONTEXT_SQL              # 스냅샷 이후 추가된 회사 → SQL 경로
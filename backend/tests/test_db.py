@@ -0,0 +1,103 @@
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette import status
+
+from backend.app import db
+from backend.app.exceptions import AppError
+from backend.app.main import app
+
+
+class FakeConn:
+    def __init__(self):
+        self.closed = 0
+    def rollback(self):
+        pass
+    def close(self):
+        self.closed = 1
+
+
+@pytest.fixture
+def fake_connect(monkeypatch):
+    """psycopg2.connect 대체 - 실제로 열린 커넥션 목록을 기록"""
+    opened: list[FakeConn] = []
+
+    def _connect(*_a, **_kw):
+        conn = FakeConn()
+        opened.append(conn)
+        return conn
+
+    monkeypatch.setattr("psycopg2.connect", _connect)
+    monkeypatch.setattr(db.settings, "db_pool_min_size", 1)
+    monkeypatch.setattr(db.settings, "db_pool_max_size", 2)
+    db.close_db_pool()
+    yield opened
+    db.close_db_pool()
+
+
+def test_pool_reuses_connection_across_requests(fake_connect, monkeypatch):
+    seen = []
+    monkeypatch.setattr(
+        "backend.app.apis.v1.infer.infer_batch",
+        lambda cands, conn: seen.append(conn) or [],
+    )
+    client = TestClient(app)
+
+    for _ in range(3):
+        response = client.post("/api/infer/batch", json=[])
+        assert response.status_code == status.HTTP_200_OK
+
+    assert len(fake_connect) == 1
+    assert seen == [fake_connect[0]] * 3
+
+    stats = client.get("/api/health/db-pool").json()
+    assert stats["acquired_total"] == 3
+    assert stats["in_use"] == 0
+
+
+def test_pool_acquire_timeout(fake_connect):
+    pool = db.DBPool(dsn="", min_size=0, max_size=1, acquire_timeout=0.01)
+    held = pool.acquire()
+
+    with pytest.raises(AppError) as exc:
+        pool.acquire()
+    assert exc.value.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert pool.stats()["timeouts_total"] == 1
+
+    pool.release(held)
+    with pool.connection() as conn:
+        assert conn is held
+
+
+def test_pool_waits_for_release(fake_connect):
+    pool = db.DBPool(dsn="", min_size=0, max_size=1, acquire_timeout=1.0)
+    held = pool.acquire()
+    threading.Timer(0.05, pool.release, args=(held,)).start()
+
+    with pool.connection() as conn:
+        assert conn is held
+    assert len(fake_connect) == 1
+
+
+def test_app_starts_when_db_is_down(monkeypatch):
+    def refuse(*_a, **_kw):
+        raise db.psycopg2.OperationalError("connection refused")
+    async def refuse_async(*_a, **_kw):
+        raise ConnectionRefusedError("connection refused")
+    monkeypatch.setattr("psycopg2.connect", refuse)
+    monkeypatch.setattr(db.asyncpg, "create_pool", refuse_async)
+    db.close_db_pool()
+
+    with TestClient(app) as client:         # lifespan 이 DB 연결 실패로 죽지 않음
+        stats = client.get("/api/health/db-pool").json()
+        assert stats["idle"] == 0 and stats["in_use"] == 0
+        assert client.post("/api/infer/batch", json=[]).json()["code"] == "DB_CONN_ERROR"
+    db.close_db_pool()
+
+
+def test_warm_opens_min_size_connections(fake_connect):
+    pool = db.DBPool(dsn="", min_size=2, max_size=2, acquire_timeout=0.01)
+    assert len(fake_connect) == 0           # 생성만으로는 연결하지 않음
+    assert pool.warm() == 2 and pool.warm() == 0
+    assert pool.stats()["idle"] == 2
@@ -0,0 +1,206 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from backend.app.clients import embed_cache
+from backend.app.utils.lru_cache import LRUCache
+from backend.app.utils.vector_codec import HEADER_V1, decode_vector, encode_vector
+
+
+@pytest.fixture(autouse=True)
+def fresh_local_cache(monkeypatch):
+    monkeypatch.setattr(embed_cache, "local_cache", LRUCache(max_entries=100, max_bytes=1 << 20, ttl=60))
+
+
+class FakeRedis:
+    def __init__(self, store=None):
+        self.store = dict(store or {})
+    def get(self, key):
+        return self.store.get(key)
+    def setex(self, key, _ttl, value):
+        self.store[key] = value
+    def set(self, key, value, keepttl=False):
+        self.store[key] = value
+
+
+def test_vector_codec_roundtrip():
+    vec = [0.5, -1.25, 3.0]
+    raw = encode_vector(vec)
+
+    assert raw.startswith(HEADER_V1)
+    assert len(raw) == len(HEADER_V1) + 4 * len(vec)
+    out = decode_vector(raw)
+    assert out.dtype == np.float32
+    assert out.tolist() == vec
+
+
+def test_vector_codec_rejects_pickled_objects():
+    class Evil:
+        def __reduce__(self):
+            return (print, ("pwned",))
+
+    with pytest.raises(pickle.UnpicklingError):
+        decode_vector(pickle.dumps(Evil()))
+    with pytest.raises(ValueError):
+        decode_vector(pickle.dumps([0.1]), allow_legacy=False)
+
+
+def test_cached_embedding_miss_stores_packed(monkeypatch):
+    fake = FakeRedis()
+    monkeypatch.setattr(embed_cache, "rds", fake)
+    monkeypatch.setattr(embed_cache, "embed_one", lambda _text: [0.25, 0.5])
+
+    vec = embed_cache.get_cached_embedding("hello")
+
+    assert vec.tolist() == [0.25, 0.5]
+    assert fake.store[embed_cache._cache_key("hello")] == encode_vector([0.25, 0.5])
+
+
+def test_cached_embedding_migrates_legacy_pickle(monkeypatch):
+    key = embed_cache._cache_key("hello")
+    fake = FakeRedis({key: pickle.dumps([0.25, 0.5])})
+    monkeypatch.setattr(embed_cache, "rds", fake)
+
+    vec = embed_cache.get_cached_embedding("hello")
+
+    assert vec.tolist() == [0.25, 0.5]
+    assert fake.store[key].startswith(HEADER_V1)
+
+
+def test_unreadable_legacy_entry_is_a_miss_when_legacy_reads_are_off(monkeypatch):
+    key = embed_cache._cache_key("hello")
+    fake = FakeRedis({key: pickle.dumps([0.25, 0.5])})
+    monkeypatch.setattr(embed_cache, "rds", fake)
+    monkeypatch.setattr(embed_cache.settings, "embed_cache_read_legacy", False)
+    monkeypatch.setattr(embed_cache, "embed_one", lambda _text: [0.75, 1.0])
+
+    vec = embed_cache.get_cached_embedding("hello")
+
+    assert vec.tolist() == [0.75, 1.0]                   # 다시 계산
+    assert fake.store[key] == encode_vector([0.75, 1.0])  # 새 포맷으로 덮어씀
+
+
+def test_local_cache_skips_redis_on_repeat(monkeypatch):
+    fake = FakeRedis({embed_cache._cache_key("hello"): encode_vector([1.0])})
+    monkeypatch.setattr(embed_cache, "rds", fake)
+
+    first = embed_cache.get_cached_embedding("hello")
+    fake.store.clear()
+    second = embed_cache.get_cached_embedding("hello")
+
+    assert second is first
+    assert not second.flags.writeable
+    assert embed_cache.embed_cache_stats()["hits"] == 1
+
+
+def test_local_cache_disabled_by_flag(monkeypatch):
+    fake = FakeRedis({embed_cache._cache_key("hello"): encode_vector([1.0])})
+    monkeypatch.setattr(embed_cache, "rds", fake)
+    monkeypatch.setattr(embed_cache.settings, "embed_local_cache_enabled", False)
+
+    embed_cache.get_cached_embedding("hello")
+    assert embed_cache.local_cache.stats()["entries"] == 0
+
+
+def test_lru_evicts_by_entries_and_bytes():
+    cache = LRUCache(max_entries=2, max_bytes=100, ttl=60)
+    cache.put("a", 1, 10)
+    cache.put("b", 2, 10)
+    cache.get("a")                  # a 를 최근 사용으로
+    cache.put("c", 3, 10)           # 항목 수 초과 → b 제거
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+
+    cache.put("d", 4, 95)           # 바이트 초과 → 나머지 모두 제거
+    assert cache.stats()["entries"] == 1
+    assert cache.stats()["evictions"] == 3
+
+    cache.put("too-big", 5, 101)    # 단일 항목이 한도보다 크면 저장하지 않음
+    assert cache.get("too-big") is None
+
+
+def test_lru_ttl_expiry(monkeypatch):
+    now = {"t": 1000.0}
+    monkeypatch.setattr("backend.app.utils.lru_cache.time.monotonic", lambda: now["t"])
+    cache = LRUCache(max_entries=10, max_bytes=100, ttl=5)
+    cache.put("a", 1, 1)
+
+    now["t"] += 6
+    assert cache.get("a") is None
+    assert cache.stats()["expirations"] == 1
+
+
+def test_micro_batcher_coalesces_concurrent_requests(monkeypatch):
+    import threading
+    from backend.app.clients.embed_batcher import EmbeddingMicroBatcher
+    import backend.app.clients.embed_batcher as batcher_mod
+
+    calls = []
+    def fake_embeddings(input, model):
+        calls.append(list(input))
+        return [[float(len(t))] for t in input]
+    monkeypatch.setattr(batcher_mod, "embeddings", fake_embeddings)
+    monkeypatch.setattr(batcher_mod.settings, "embed_micro_batch_wait_ms", 50.0)
+
+    batcher = EmbeddingMicroBatcher("m")
+    texts = ["a", "bb", "ccc", "bb"]
+    results = [None] * len(texts)
+    def worker(i):
+        results[i] = batcher.embed(texts[i])
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(len(texts))]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert results == [[1.0], [2.0], [3.0], [2.0]]
+    # 동시 요청 4건 → 중복 제거된 다건 호출 1회
+    assert len(calls) == 1 and sorted(calls[0]) == ["a", "bb", "ccc"]
+    assert batcher.stats()["batch_sizes"]["max"] == 4
+
+
+def test_micro_batcher_async(monkeypatch):
+    import asyncio
+    from backend.app.clients.embed_batcher import EmbeddingMicroBatcher
+    import backend.app.clients.embed_batcher as batcher_mod
+
+    calls = []
+    async def fake_embeddings_async(input, model):
+        calls.append(list(input))
+        return [[float(len(t))] for t in input]
+    monkeypatch.setattr(batcher_mod, "embeddings_async", fake_embeddings_async)
+
+    batcher = EmbeddingMicroBatcher("m")
+    async def run():
+        return await asyncio.gather(*(batcher.embed_async(t) for t in ["a", "bb", "ccc"]))
+
+    assert asyncio.run(run()) == [[1.0], [2.0], [3.0]]
+    assert calls == [["a", "bb", "ccc"]]
+
+
+def test_micro_batcher_async_keeps_inflight_batch_task(monkeypatch):
+    import asyncio
+    import gc
+    from backend.app.clients.embed_batcher import EmbeddingMicroBatcher
+    import backend.app.clients.embed_batcher as batcher_mod
+
+    async def slow_embeddings_async(input, model):
+        await asyncio.sleep(0.01)
+        return [[1.0] for _ in input]
+    monkeypatch.setattr(batcher_mod, "embeddings_async", slow_embeddings_async)
+
+    batcher = EmbeddingMicroBatcher("m")
+    async def run():
+        waiter = asyncio.ensure_future(batcher.embed_async("a"))
+        while not batcher._async_tasks:
+            await asyncio.sleep(0.001)
+        gc.collect()
+        # 보내는 중인 묶음 태스크는 참조가 유지되고, 끝나면 정리됨
+        assert len(batcher._async_tasks) == 1
+        result = await waiter
+        await asyncio.sleep(0)
+        return result
+
+    assert asyncio.run(run()) == [1.0]
+    assert batcher._async_tasks == set()
@@ -49,4 +49,12 @@ def test_infer_success(sample_candidate, monkeypatch):
 
 def test_infer_invalid_payload():
     response = client.post("/api/infer", json={"foo": "bar"})
-    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
\ No newline at end of file
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+def test_infer_batch_too_large(sample_candidate, monkeypatch):
+    monkeypatch.setattr("backend.app.apis.v1.infer.settings.batch_max_size", 1)
+
+    response = client.post("/api/infer/batch", json=[sample_candidate, sample_candidate])
+    assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    assert response.json()["code"] == "BATCH_TOO_LARGE"
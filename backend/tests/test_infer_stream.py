@@ -0,0 +1,96 @@
+import json
+import pathlib
+from contextlib import asynccontextmanager
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.app.apis.v1 import infer as infer_api
+from backend.app.main import app
+from backend.app.services import async_pipeline
+from backend.app.services.tag_stream import TagStreamParser
+import backend.app.clients.openai_client as client_mod
+
+client = TestClient(app)
+
+RAW = json.dumps({"tags": [
+    {"tag": "리더쉽", "evidence": 'CTO "}]" 역할'},
+    {"tag": "IPO"},                                     # evidence 누락 - 건너뜀
+    {"tag": "M&A 경험", "evidence": "인수 합병"},
+]}, ensure_ascii=False)
+
+
+@pytest.fixture()
+def sample_candidate():
+    with open(pathlib.Path(__file__).parent / "sample_candidate.json", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _events(body: str) -> list[tuple[str, dict]]:
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, len(RAW)])
+def test_tag_stream_parser_emits_tags_as_objects_close(chunk_size):
+    parser = TagStreamParser()
+    tags = []
+    for i in range(0, len(RAW), chunk_size):
+        tags += parser.feed(RAW[i:i + chunk_size])
+
+    assert [t.tag for t in tags] == ["리더쉽", "M&A 경험"]
+    assert tags[0].evidence == 'CTO "}]" 역할'
+    assert parser.text == RAW
+
+
+def test_tag_stream_parser_emits_first_tag_before_response_ends():
+    parser = TagStreamParser()
+    first_end = RAW.index('역할"}') + len('역할"}')
+    assert parser.feed(RAW[:first_end - 1]) == []
+    assert [t.tag for t in parser.feed(RAW[first_end - 1:first_end])] == ["리더쉽"]
+    assert parser.feed(RAW[first_end:first_end + 5]) == []
+
+
+@pytest.fixture
+def stub_stream_io(monkeypatch):
+    @asynccontextmanager
+    async def fake_async_conn():
+        yield None
+
+    async def no_ctx_async(*_a):
+        return []
+
+    monkeypatch.setattr(infer_api.settings, "result_cache_enabled", False)
+    monkeypatch.setattr(infer_api.settings, "rule_tagger_enabled", False)   # LLM 스트림 경로만 검증
+    monkeypatch.setattr(infer_api, "get_async_db_connection", fake_async_conn)
+    monkeypatch.setattr(async_pipeline, "retrieve_context", no_ctx_async)
+
+
+def test_infer_stream_sends_tags_then_result(stub_stream_io, monkeypatch, sample_candidate):
+    async def fake_stream(_prompt):
+        for i in range(0, len(RAW), 5):
+            yield RAW[i:i + 5]
+    monkeypatch.setattr(async_pipeline, "call_llm_stream", fake_stream)
+
+    response = client.post("/api/infer/stream", json=sample_candidate)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = _events(response.text)
+    assert [e for e, _ in events] == ["tag", "tag", "error"]    # 최종 검증 실패(evidence 누락)는 error 로
+    assert events[0][1] == {"tag": "리더쉽", "evidence": 'CTO "}]" 역할'}
+    assert events[-1][1]["code"] == "LLM_ERROR"
+
+
+def test_infer_stream_with_fake_backend(stub_stream_io, monkeypatch, sample_candidate):
+    monkeypatch.setattr(client_mod.settings, "llm_backend", "fake")
+    monkeypatch.setattr(client_mod.settings, "fake_llm_latency_p50_ms", 0)
+
+    events = _events(client.post("/api/infer/stream", json=sample_candidate).text)
+
+    kinds = [e for e, _ in events]
+    assert kinds[-1] == "result" and set(kinds[:-1]) == {"tag"}
+    assert [{"tag": t["tag"], "evidence": t["evidence"]} for _, t in events[:-1]] == events[-1][1]["tags"]
@@ -0,0 +1,217 @@
+import json
+import pathlib
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.app import worker
+from backend.app.clients import job_queue
+from backend.app.main import app
+from backend.app.models.response import InferenceResult
+from backend.app.utils import metrics
+
+client = TestClient(app)
+
+RESULT = InferenceResult.model_validate({"tags": [{"tag": "리더쉽", "evidence": "Tech Lead"}]})
+
+
+def _b(value) -> bytes:
+    return value if isinstance(value, bytes) else str(value).encode()
+
+
+class FakeRedis:
+    """job_queue 가 쓰는 명령만 흉내 (값은 실제 Redis 처럼 bytes)"""
+
+    def __init__(self):
+        self.hashes: dict[str, dict[bytes, bytes]] = {}
+        self.lists: dict[str, list[bytes]] = {}
+        self.zsets: dict[str, dict[bytes, float]] = {}
+        self.strings: dict[str, bytes] = {}
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    # hash
+    def hset(self, key, field=None, value=None, mapping=None):
+        h = self.hashes.setdefault(key, {})
+        for k, v in (mapping or {field: value}).items():
+            h[_b(k)] = _b(v)
+    def hget(self, key, field):
+        return self.hashes.get(key, {}).get(_b(field))
+    def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+    def hdel(self, key, *fields):
+        for f in fields:
+            self.hashes.get(key, {}).pop(_b(f), None)
+    def hincrby(self, key, field, amount=1):
+        value = int(self.hget(key, field) or 0) + amount
+        self.hset(key, field, value)
+        return value
+    def expire(self, key, _ttl):
+        pass
+    def delete(self, key):
+        self.hashes.pop(key, None)
+
+    # list (왼쪽 = index 0)
+    def lpush(self, key, value):
+        self.lists.setdefault(key, []).insert(0, _b(value))
+    def rpush(self, key, value):
+        self.lists.setdefault(key, []).append(_b(value))
+    def rpop(self, key):
+        items = self.lists.get(key)
+        return items.pop() if items else None
+    def blmove(self, src_key, dst_key, _timeout, src="LEFT", dest="RIGHT"):
+        items = self.lists.get(src_key)
+        if not items:
+            return None
+        value = items.pop() if src == "RIGHT" else items.pop(0)
+        (self.lpush if dest == "LEFT" else self.rpush)(dst_key, value)
+        return value
+    def lrem(self, key, _count, value):
+        items = self.lists.get(key, [])
+        if _b(value) in items:
+            items.remove(_b(value))
+    def lrange(self, key, _start, _end):
+        return list(self.lists.get(key, []))
+    def llen(self, key):
+        return len(self.lists.get(key, []))
+
+    # zset
+    def zadd(self, key, mapping):
+        self.zsets.setdefault(key, {}).update({_b(k): v for k, v in mapping.items()})
+    def zrem(self, key, member):
+        self.zsets.get(key, {}).pop(_b(member), None)
+    def zcard(self, key):
+        return len(self.zsets.get(key, {}))
+    def zrangebyscore(self, key, _min, max_, start=0, num=None):
+        due = sorted((s, m) for m, s in self.zsets.get(key, {}).items() if s <= max_)
+        return [m for _, m in due][start:start + num if num else None]
+
+    # string
+    def set(self, key, value, nx=False, px=None):
+        if nx and key in self.strings:
+            return None
+        self.strings[key] = _b(value)
+        return True
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self._redis = redis
+        self._calls = []
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self._calls.append((name, args, kwargs))
+        return queue
+    def execute(self):
+        return [getattr(self._redis, n)(*a, **kw) for n, a, kw in self._calls]
+
+
+@pytest.fixture()
+def sample_candidate():
+    with open(pathlib.Path(__file__).parent / "sample_candidate.json", encoding="utf-8") as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    fake = FakeRedis()
+    monkeypatch.setattr(job_queue, "rds", fake)
+    monkeypatch.setattr(job_queue.settings, "job_max_attempts", 2)
+    return fake
+
+
+def _unlock(fake):
+    fake.strings.pop(job_queue.MAINTENANCE_LOCK_KEY, None)
+
+
+def test_submit_process_and_fetch_result(fake_redis, monkeypatch, sample_candidate):
+    monkeypatch.setattr(worker, "run_job", lambda _c: RESULT)
+
+    submitted = client.post("/api/jobs", json=sample_candidate)
+    assert submitted.status_code == 202
+    job_id = submitted.json()["job_id"]
+    assert client.get(f"/api/jobs/{job_id}").json()["status"] == "queued"
+    assert client.get(f"/api/jobs/{job_id}/result").json()["code"] == "JOB_NOT_READY"
+
+    assert worker.process_one(timeout=0) == job_queue.SUCCEEDED
+    assert worker.process_one(timeout=0) is None
+
+    body = client.get(f"/api/jobs/{job_id}/result").json()
+    assert body["job"]["status"] == "succeeded" and body["job"]["attempts"] == 1
+    assert body["result"] == RESULT.model_dump()
+    assert fake_redis.llen(job_queue.PROCESSING_KEY) == 0
+
+
+def test_failed_job_is_retried_then_dead_lettered(fake_redis, monkeypatch, sample_candidate):
+    def boom(_c):
+        raise RuntimeError("LLM down")
+    monkeypatch.setattr(worker, "run_job", boom)
+    monkeypatch.setattr(job_queue.settings, "job_retry_backoff", 10.0)
+    dead_before = metrics.jobs_finished.labels(result="dead").value
+
+    job_id = client.post("/api/jobs/batch", json=[sample_candidate]).json()["jobs"][0]["job_id"]
+
+    assert worker.process_one(timeout=0) == job_queue.RETRIED
+    assert client.get("/api/health/jobs").json() == {"queued": 0, "delayed": 1, "running": 0, "dead": 0}
+    assert job_queue.maintain()["promoted"] == 0               # backoff 전
+    _unlock(fake_redis)
+    assert job_queue.maintain(now=job_queue.time.time() + 11)["promoted"] == 1
+
+    assert worker.process_one(timeout=0) == job_queue.DEAD
+    info = client.get(f"/api/jobs/{job_id}").json()
+    assert info["status"] == "failed" and info["attempts"] == 2
+    assert info["error"]["message"] == "RuntimeError: LLM down"
+    assert client.get(f"/api/jobs/{job_id}/result").json()["code"] == "JOB_FAILED"
+    assert metrics.jobs_finished.labels(result="dead").value == dead_before + 1
+    assert 'app_job_queue_depth{queue="dead"} 1' in client.get("/api/metrics").text
+
+    assert client.post("/api/jobs/dead/retry").json() == {"requeued": 1}
+    assert client.get(f"/api/jobs/{job_id}").json()["status"] == "queued"
+
+
+def test_stale_running_job_is_recovered_then_quarantined(fake_redis, monkeypatch, sample_candidate):
+    monkeypatch.setattr(job_queue.settings, "job_timeout", 60.0)
+    job_id = job_queue.submit([job_queue.Candidate.model_validate(sample_candidate)])[0].job_id
+
+    for _ in range(2):                      # 워커가 작업 도중 죽은 상황
+        assert job_queue.claim(0) is not None
+        _unlock(fake_redis)
+        assert job_queue.maintain(now=job_queue.time.time() + 61)["recovered"] == 1
+
+    assert job_queue.claim(0) is None       # 시도 한도 초과 → dead-letter
+    info, _ = job_queue.get_job(job_id)
+    assert info.status == "failed" and info.error.code == "JOB_TIMEOUT"
+
+
+def test_job_moved_without_started_at_is_recovered_after_grace(fake_redis, monkeypatch, sample_candidate):
+    monkeypatch.setattr(job_queue.settings, "job_timeout", 60.0)
+    job_id = job_queue.submit([job_queue.Candidate.model_validate(sample_candidate)])[0].job_id
+    # BLMOVE 직후 started_at 을 쓰기 전에 워커가 죽은 상황
+    fake_redis.blmove(job_queue.QUEUE_KEY, job_queue.PROCESSING_KEY, 0, src="RIGHT", dest="LEFT")
+    now = job_queue.time.time()
+
+    assert job_queue.maintain(now=now)["recovered"] == 0                # 처음 발견 - 표시만
+    _unlock(fake_redis)
+    assert job_queue.maintain(now=now + 30)["recovered"] == 0           # 유예 시간 안
+    _unlock(fake_redis)
+    assert job_queue.maintain(now=now + 61)["recovered"] == 1
+    assert fake_redis.lists[job_queue.QUEUE_KEY] == [job_id.encode()]
+    assert fake_redis.hget(job_queue._key(job_id), "orphaned_at") is None
+    assert job_queue.claim(0)[0] == job_id
+
+
+def test_retry_dead_maps_redis_errors(monkeypatch):
+    def down(*_a, **_kw):
+        raise ConnectionError("redis down")
+    monkeypatch.setattr(job_queue, "retry_dead", down)
+
+    response = client.post("/api/jobs/dead/retry")
+    assert response.status_code == 503
+    assert response.json()["code"] == "QUEUE_ERROR"
+
+
+def test_unknown_job_returns_404(fake_redis):
+    response = client.get("/api/jobs/nope")
+    assert response.status_code == 404
+    assert response.json()["code"] == "JOB_NOT_FOUND"
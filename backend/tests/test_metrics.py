@@ -0,0 +1,102 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.app.main import app
+from backend.app.utils import metrics
+from backend.app.utils.profiler import timed
+import backend.app.clients.openai_client as client_mod
+
+client = TestClient(app)
+
+
+def _value(family, **labels) -> float:
+    return family.labels(**labels).value
+
+
+def test_timed_records_histogram_counts_and_errors():
+    @timed("⏱ metrics_stage")
+    def ok():
+        return 1
+
+    @timed("⏱ metrics_stage")
+    def fail():
+        raise RuntimeError
+
+    @timed("metrics_stage_async")
+    async def coro():
+        return 2
+
+    before = _value(metrics.stage_calls, stage="metrics_stage")
+    ok()
+    with pytest.raises(RuntimeError):
+        fail()
+    asyncio.run(coro())
+
+    assert _value(metrics.stage_calls, stage="metrics_stage") - before == 2
+    assert _value(metrics.stage_errors, stage="metrics_stage") >= 1
+    assert metrics.stage_duration.labels(stage="metrics_stage_async").snapshot()["count"] == 1
+
+
+def test_openai_retries_are_labeled_by_attempt(monkeypatch):
+    calls = {"n": 0}
+
+    def flaky(*_a, **_kw):
+        calls["n"] += 1
+        if calls["n"] < 3:
+            raise client_mod.openai.APIError("temporary", request=None, body=None)
+        return SimpleNamespace(data=[SimpleNamespace(index=0, embedding=[0.1])])
+
+    monkeypatch.setattr(client_mod.openai.embeddings, "create", flaky)
+    monkeypatch.setattr("time.sleep", lambda *_: None)
+    before = [_value(metrics.openai_retries, fn="embeddings_request", attempt=n, error="APIError") for n in (1, 2)]
+
+    client_mod.embeddings(input=["a"], model="m")
+
+    after = [_value(metrics.openai_retries, fn="embeddings_request", attempt=n, error="APIError") for n in (1, 2)]
+    assert [a - b for a, b in zip(after, before)] == [1, 1]
+
+
+def test_final_failed_attempt_is_not_counted_as_retry(monkeypatch):
+    def down(*_a, **_kw):
+        raise client_mod.openai.APIError("down", request=None, body=None)
+
+    monkeypatch.setattr(client_mod.openai.embeddings, "create", down)
+    monkeypatch.setattr("time.sleep", lambda *_: None)
+    last = client_mod.settings.openai_max_retries
+    attempts = range(1, last + 1)
+    before = [_value(metrics.openai_retries, fn="embeddings_request", attempt=n, error="APIError") for n in attempts]
+
+    with pytest.raises(client_mod.openai.APIError):
+        client_mod.embeddings(input=["a"], model="m")
+
+    after = [_value(metrics.openai_retries, fn="embeddings_request", attempt=n, error="APIError") for n in attempts]
+    assert [a - b for a, b in zip(after, before)] == [1] * (last - 1) + [0]
+
+
+def test_metrics_endpoint_renders_prometheus_text():
+    metrics.cache_requests.labels(cache="result", result="hit").inc()
+    timed("endpoint_stage")(lambda: None)()
+
+    response = client.get("/api/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    assert "# TYPE app_stage_duration_seconds histogram" in body
+    assert 'app_stage_duration_seconds_bucket{stage="endpoint_stage",le="+Inf"}' in body
+    assert 'app_cache_requests_total{cache="result",result="hit"}' in body
+
+
+def test_token_count_falls_back_to_utf8_bytes(monkeypatch):
+    from backend.app.utils import tokens
+
+    monkeypatch.setattr(tokens, "tiktoken", None)
+    tokens._encoding.cache_clear()
+    try:
+        assert tokens.count_tokens("토스 backend", "gpt-4o-mini") == len("토스 backend".encode("utf-8"))
+        assert tokens.tokenizer_name("gpt-4o-mini") == tokens.FALLBACK_TOKENIZER
+    finally:
+        tokens._encoding.cache_clear()
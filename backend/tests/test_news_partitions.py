@@ -0,0 +1,70 @@
+from contextlib import contextmanager
+
+from backend.app import worker
+from backend.app.services import news_partitions
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+    def execute(self, sql, params):
+        self.conn.queries.append((sql, params))
+    def fetchall(self):
+        return self.conn.rows
+    def __enter__(self):
+        return self
+    def __exit__(self, *exc):
+        pass
+
+
+class FakeConn:
+    def __init__(self, rows=()):
+        self.rows = list(rows)
+        self.queries = []
+        self.commits = 0
+    def cursor(self):
+        return FakeCursor(self)
+    def commit(self):
+        self.commits += 1
+
+
+def test_maintain_applies_settings_and_commits(monkeypatch):
+    monkeypatch.setattr(news_partitions.settings, "news_partition_premake_months", 2)
+    monkeypatch.setattr(news_partitions.settings, "news_retention_months", 12)
+    monkeypatch.setattr(news_partitions.settings, "news_retention_drop", True)
+    conn = FakeConn([("created", "company_news_p202612"), ("dropped", "company_news_p202409")])
+
+    actions = news_partitions.maintain_news_partitions(conn)
+
+    assert actions == [("created", "company_news_p202612"), ("dropped", "company_news_p202409")]
+    assert conn.queries == [(news_partitions.MAINTAIN_SQL, (2, 12, True))]
+    assert conn.commits == 1                # 풀 반환 시 rollback 되므로 직접 commit
+
+
+def test_worker_maintains_partitions_once_per_interval(monkeypatch):
+    monkeypatch.setattr(worker.settings, "news_partition_maintenance_interval", 60.0)
+    conn = FakeConn()
+
+    @contextmanager
+    def fake_db():
+        yield conn
+    monkeypatch.setattr(worker, "get_db_connection", fake_db)
+
+    w = worker.Worker(concurrency=1)
+    for now in (0.0, 30.0, 61.0):
+        w.maintain_partitions(now=now)
+    assert conn.commits == 2
+
+    monkeypatch.setattr(worker.settings, "news_partition_maintenance_interval", 0.0)
+    w.maintain_partitions(now=1000.0)
+    assert conn.commits == 2
+
+
+def test_worker_survives_maintenance_failure(monkeypatch):
+    @contextmanager
+    def broken_db():
+        raise RuntimeError("function company_news_maintain does not exist")
+        yield
+    monkeypatch.setattr(worker, "get_db_connection", broken_db)
+
+    worker.Worker(concurrency=1).maintain_partitions(now=0.0)
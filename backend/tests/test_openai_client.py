@@ -33,3 +33,77 @@ def test_embedding_retry_exhaust(monkeypatch):
 
     with pytest.raises(client_mod.openai.APIError):
         embedding(input=["bar"], model="text-embedding-3-small")
+
+
+def test_embeddings_returns_all_in_input_order(monkeypatch):
+    def fake_embeddings_create(*args, **kwargs):
+        return SimpleNamespace(data=[
+            SimpleNamespace(index=1, embedding=[0.2]),
+            SimpleNamespace(index=0, embedding=[0.1]),
+        ])
+
+    monkeypatch.setattr(client_mod.openai.embeddings, "create", fake_embeddings_create)
+
+    assert client_mod.embeddings(input=["a", "b"], model="text-embedding-3-small") == [[0.1], [0.2]]
+
+
+def test_split_embedding_batches_respects_item_and_token_limits():
+    texts = ["a" * 10, "b" * 10, "c" * 10, "d" * 25, "e"]
+    batches = client_mod.split_embedding_batches(texts, max_items=2, max_tokens=30)
+
+    assert batches == [["a" * 10, "b" * 10], ["c" * 10], ["d" * 25, "e"]]
+    # 한도보다 큰 단일 입력도 혼자서는 보냄
+    assert client_mod.split_embedding_batches(["x" * 50], max_items=2, max_tokens=30) == [["x" * 50]]
+
+
+def test_embeddings_splits_requests_and_records_batch_sizes(monkeypatch):
+    sizes = []
+    def fake_embeddings_create(input, **kwargs):
+        sizes.append(len(input))
+        return SimpleNamespace(data=[
+            SimpleNamespace(index=i, embedding=[float(t)]) for i, t in enumerate(input)
+        ])
+
+    monkeypatch.setattr(client_mod.openai.embeddings, "create", fake_embeddings_create)
+    monkeypatch.setattr(client_mod.settings, "embed_batch_max_items", 2)
+    before = client_mod.embed_batch_sizes.snapshot()["count"]
+
+    out = client_mod.embeddings(input=["1", "2", "3", "4", "5"], model="text-embedding-3-small")
+
+    assert out == [[1.0], [2.0], [3.0], [4.0], [5.0]]
+    assert sizes == [2, 2, 1]
+    assert client_mod.embed_batch_sizes.snapshot()["count"] - before == 3
+
+
+def test_fake_backend_returns_valid_inference_and_stable_embeddings(monkeypatch):
+    from backend.app.models.candidate import Candidate
+    from backend.app.models.response import InferenceResult
+    from backend.app.services import pipeline
+    import json, pathlib
+
+    monkeypatch.setattr(client_mod.settings, "llm_backend", "fake")
+    monkeypatch.setattr(client_mod.settings, "fake_llm_latency_p50_ms", 0)
+    monkeypatch.setattr(client_mod.settings, "fake_embed_latency_p50_ms", 0)
+    monkeypatch.setattr(client_mod.settings, "fake_embed_dim", 8)
+
+    here = pathlib.Path(__file__).parent
+    with open(here / "sample_candidate.json", encoding="utf-8") as f:
+        prompt = pipeline.build_prompt(Candidate.model_validate(json.load(f)), [])
+
+    raw = client_mod.chat_completion(messages=[{"role": "user", "content": prompt}], **pipeline.LLM_PARAMS)
+    result = InferenceResult.model_validate_json(raw)
+    assert result.tags and all(t.tag in pipeline._TAG_LIST for t in result.tags)
+    assert client_mod.chat_completion(messages=[{"role": "user", "content": prompt}]) == raw
+
+    first, again = client_mod.embeddings(input=["a", "b"], model="m"), client_mod.embeddings(input=["a"], model="m")
+    assert len(first[0]) == 8 and first[0] == again[0] and first[0] != first[1]
+
+
+def test_fake_backend_error_rate_goes_through_retry(monkeypatch):
+    monkeypatch.setattr(client_mod.settings, "llm_backend", "fake")
+    monkeypatch.setattr(client_mod.settings, "fake_embed_latency_p50_ms", 0)
+    monkeypatch.setattr(client_mod.settings, "fake_embed_error_rate", 1.0)
+    monkeypatch.setattr("time.sleep", lambda *_: None)
+
+    with pytest.raises(client_mod.openai.APIError):
+        client_mod.embeddings(input=["a"], model="m")
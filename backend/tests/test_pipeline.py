@@ -30,12 +30,13 @@ def test_extract_company_names(sample_candidate):
 
 class FakeCursor:
     def __init__(self):
+        # (part, text, dist) - part 0: 회사 요약, 1: 뉴스
         self._queues = [
-            [("요약1",), ("요약2",)],
-            [("뉴스1",), ("뉴스2",)],
+            [(0, "요약1", 0.1), (0, "요약2", 0.2), (1, "뉴스1", 0.1), (1, "뉴스2", 0.3)],
         ]
+        self.executed = 0
     def execute(self, *_a, **_kw):
-        pass
+        self.executed += 1
     def fetchall(self):
         return self._queues.pop(0)
     def __enter__(self):
@@ -45,22 +46,39 @@ class FakeCursor:
 
 
 class FakeConn:
+    def __init__(self):
+        self.cur = FakeCursor()
     def cursor(self):
-        return FakeCursor()
+        return self.cur
 
 def test_retrieve_context(monkeypatch, sample_candidate):
     monkeypatch.setattr(
         "backend.app.services.pipeline.get_cached_embedding",
         lambda *a, **kw: [0.1, 0.2]
     )
+    monkeypatch.setattr(pipeline.company_directory, "resolve_ids", lambda names, _conn: [1, 2])
     cand_obj = pipeline.Candidate.model_validate(sample_candidate)
     txt = pipeline.preprocess(cand_obj)
+    conn = FakeConn()
     ctx = pipeline.retrieve_context(
         txt,
         ["네이버", "토스"],
-        FakeConn()
+        conn
     )
     assert ctx == ["요약1", "요약2", "뉴스1", "뉴스2"]
+    # set_config + 검색 쿼리 1회
+    assert conn.cur.executed == 2
+
+
+def test_retrieve_context_skips_search_for_unknown_companies(monkeypatch):
+    def fail(*_a, **_kw):
+        raise AssertionError("임베딩을 호출하면 안 됨")
+    monkeypatch.setattr(pipeline, "get_cached_embedding", fail)
+    monkeypatch.setattr(pipeline.company_directory, "resolve_ids", lambda names, _conn: [])
+
+    conn = FakeConn()
+    assert pipeline.retrieve_context("txt", ["없는회사"], conn) == []
+    assert conn.cur.executed == 0
 
 
 def test_build_prompt_contains_sections(sample_candidate):
@@ -73,6 +91,61 @@ def test_build_prompt_contains_sections(sample_candidate):
     assert "상위권대학교" in pr
 
 
+def test_request_context_preprocesses_once(sample_candidate, monkeypatch):
+    cand_obj = pipeline.Candidate.model_validate(sample_candidate)
+    open_tags = pipeline.RequestContext(cand_obj).open_tags
+    expected = pipeline.build_prompt(cand_obj, ["컨텍스트1"], tags=open_tags)
+
+    calls = []
+    original = pipeline.preprocess
+    monkeypatch.setattr(pipeline, "preprocess", lambda c: calls.append(c) or original(c))
+
+    req = pipeline.RequestContext(cand_obj)
+    req.contexts = ["컨텍스트1"]
+    assert req.text and req.text == req.text
+    assert req.build_prompt() == expected
+    assert req.prompt == expected
+    assert len(calls) == 1
+
+
+def _long_candidate(sample_candidate, n_positions: int):
+    base = sample_candidate["positions"][0]
+    data = dict(sample_candidate, positions=[
+        dict(base, companyName=f"회사{i}", description="설명" * 200,
+             startEndDate={"start": {"year": 2000 + i, "month": 1}})
+        for i in range(n_positions)
+    ])
+    return pipeline.Candidate.model_validate(data)
+
+
+def test_fit_prompt_budget_trims_contexts_then_oldest_positions(sample_candidate, monkeypatch):
+    monkeypatch.setattr(pipeline, "count_tokens", lambda text, _model: len(text))
+    monkeypatch.setattr(pipeline.settings, "prompt_token_budget", 3000)
+    monkeypatch.setattr(pipeline.settings, "prompt_min_contexts", 2)
+    monkeypatch.setattr(pipeline.settings, "prompt_description_max_chars", 50)
+    cand = _long_candidate(sample_candidate, 10)
+    contexts = [f"컨텍스트{i}" for i in range(6)]
+    trims_before = pipeline.metrics.prompt_trims.labels(section="position").value
+
+    prompt = pipeline.fit_prompt_budget(cand, contexts, pipeline.build_prompt(cand, contexts))
+
+    assert len(prompt) <= 3000
+    assert "- 컨텍스트1" in prompt and "- 컨텍스트2" not in prompt     # 유사도 하위부터 제거
+    assert "회사9" in prompt and "회사0" not in prompt                # 오래된 경력부터 제거
+    assert "설명" * 25 + "…" in prompt                               # 남은 경력 설명은 축약
+    assert pipeline.metrics.prompt_trims.labels(section="position").value > trims_before
+
+
+def test_fit_prompt_budget_keeps_prompt_within_budget(sample_candidate, monkeypatch):
+    monkeypatch.setattr(pipeline.settings, "prompt_token_budget", 100_000)
+    cand = pipeline.Candidate.model_validate(sample_candidate)
+    prompt = pipeline.build_prompt(cand, ["컨텍스트1"])
+    assert pipeline.fit_prompt_budget(cand, ["컨텍스트1"], prompt) is prompt
+
+    monkeypatch.setattr(pipeline.settings, "prompt_token_budget", 0)
+    assert pipeline.fit_prompt_budget(cand, ["컨텍스트1"], prompt) is prompt
+
+
 def test_call_llm_returns_content(monkeypatch):
     monkeypatch.setattr(
         pipeline,
@@ -80,3 +153,101 @@ def test_call_llm_returns_content(monkeypatch):
         lambda **kwargs: "OK",
     )
     assert pipeline.call_llm("any prompt") == "OK"
+
+
+class FakeBatchCursor(FakeCursor):
+    def __init__(self):
+        self._queues = [
+            [(0, 0, "요약A", 0.1), (1, 0, "요약B1", 0.1), (1, 0, "요약B2", 0.2), (1, 1, "뉴스B", 0.1)],
+        ]
+        self.params = []
+    def execute(self, _sql, params=None):
+        self.params.append(params)
+
+
+def test_vector_search_params_follow_settings(monkeypatch):
+    monkeypatch.setattr(pipeline.settings, "hnsw_ef_search", 100)
+    monkeypatch.setattr(pipeline.settings, "ivfflat_probes", 7)
+    monkeypatch.setattr(pipeline.settings, "hnsw_iterative_scan", "relaxed_order")
+    cur = FakeBatchCursor()
+
+    pipeline.set_vector_search_params(cur)
+
+    assert cur.params == [(
+        "hnsw.ef_search", "100", "ivfflat.probes", "7", "hnsw.iterative_scan", "relaxed_order",
+    )]
+
+    monkeypatch.setattr(pipeline.settings, "hnsw_iterative_scan", "")       # 기본값 - pgvector 0.8 미만에서도 동작
+    pipeline.set_vector_search_params(cur)
+    assert cur.params[-1] == ("hnsw.ef_search", "100", "ivfflat.probes", "7")
+
+
+def test_news_query_reranks_binary_candidates_when_enabled(monkeypatch):
+    where = "n.company_id = ANY(%(ids)s::int[])"
+    monkeypatch.setattr(pipeline.settings, "news_binary_rerank_candidates", 0)
+    plain = pipeline._news_ranked_sql("", "%(vec)s::vector::halfvec", where)
+    assert "<~>" not in plain and "LIMIT 10" in plain
+
+    monkeypatch.setattr(pipeline.settings, "news_binary_rerank_candidates", 40)
+    reranked = pipeline._news_ranked_sql("", "%(vec)s::vector::halfvec", where)
+    # 해밍 거리로 후보 40개 → 바깥에서 정확한 코사인 거리로 10개
+    assert "binary_quantize(embedding)::bit(1536) <~> binary_quantize(%(vec)s::vector::halfvec)" in reranked
+    assert reranked.index("LIMIT 40") < reranked.index("LIMIT 10")
+
+    monkeypatch.setattr(pipeline.settings, "news_binary_rerank_candidates", 5)
+    assert "LIMIT 5" not in pipeline._news_ranked_sql("", "%(vec)s::vector", where)
+
+
+class FakeBatchConn:
+    def __init__(self):
+        self.cur = FakeBatchCursor()
+    def cursor(self):
+        return self.cur
+
+
+def test_retrieve_contexts_groups_by_input_order(monkeypatch):
+    calls = []
+    def fake_embeddings(texts):
+        calls.append(texts)
+        return [[0.1, 0.2] for _ in texts]
+    monkeypatch.setattr(pipeline, "get_cached_embeddings", fake_embeddings)
+    ids = {"네이버": 10, "토스": 20, "리디": 30}
+    monkeypatch.setattr(
+        pipeline.company_directory, "resolve_ids",
+        lambda names, _conn: [ids[n] for n in names if n in ids],
+    )
+
+    conn = FakeBatchConn()
+    ctx = pipeline.retrieve_contexts(["a", "b", "c"], [["네이버"], ["토스", "리디"], []], conn)
+
+    # 회사가 없는 지원자는 임베딩/검색 대상에서 제외
+    assert calls == [["a", "b"]]
+    assert ctx == [["요약A"], ["요약B1", "요약B2", "뉴스B"], []]
+    # 지원자별 company id 는 (idx, id) 쌍으로 평탄화되어 한 번의 쿼리로 전달
+    assert len(conn.cur.params) == 2
+    assert conn.cur.params[1]["cidxs"] == [0, 1, 1]
+    assert conn.cur.params[1]["cids"] == [10, 20, 30]
+
+
+def test_infer_batch_keeps_order_and_isolates_errors(monkeypatch, sample_candidate):
+    cands = [pipeline.Candidate.model_validate(sample_candidate) for _ in range(3)]
+    monkeypatch.setattr(pipeline, "retrieve_contexts", lambda texts, *_a: [[] for _ in texts])
+
+    prompts = iter(range(3))
+    def fake_call_llm(prompt):
+        n = next(prompts)
+        if n == 1:
+            raise pipeline.AppError(pipeline.Err.LLM_ERROR, "boom")
+        return '{"tags": [{"tag": "리더쉽", "evidence": "Tech Lead"}]}'
+    monkeypatch.setattr(pipeline, "call_llm", fake_call_llm)
+    monkeypatch.setattr(pipeline.settings, "batch_llm_concurrency", 1)
+    monkeypatch.setattr(pipeline.settings, "result_cache_enabled", False)
+    monkeypatch.setattr(pipeline.settings, "rule_tagger_enabled", False)
+
+    results = pipeline.infer_batch(cands, None)
+
+    assert [r.index for r in results] == [0, 1, 2]
+    assert results[0].result.tags[0].tag == "리더쉽"
+    assert results[1].result is None
+    assert results[1].error.code == "LLM_ERROR"
+    assert results[2].error is None
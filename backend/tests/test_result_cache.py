@@ -0,0 +1,104 @@
+import json
+import pathlib
+from contextlib import contextmanager
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.app.apis.v1 import infer as infer_api
+from backend.app.clients import result_cache
+from backend.app.main import app
+from backend.app.services import pipeline
+
+client = TestClient(app)
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store: dict[str, bytes] = {}
+    def get(self, key):
+        return self.store.get(key)
+    def mget(self, keys):
+        return [self.store.get(k) for k in keys]
+    def setex(self, key, _ttl, value):
+        self.store[key] = value.encode() if isinstance(value, str) else value
+    def delete(self, key):
+        return 1 if self.store.pop(key, None) is not None else 0
+
+
+@pytest.fixture()
+def sample_candidate():
+    here = pathlib.Path(__file__).parent
+    with open(here / "sample_candidate.json", encoding="utf-8") as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    fake = FakeRedis()
+    monkeypatch.setattr(result_cache, "rds", fake)
+    monkeypatch.setattr(result_cache, "counters", result_cache._Counters())
+    return fake
+
+
+def test_cache_key_ignores_formatting_and_non_prompt_fields(sample_candidate):
+    base = pipeline.Candidate.model_validate(sample_candidate)
+
+    noisy = json.loads(json.dumps(sample_candidate))
+    noisy["firstName"] = "Other"
+    noisy["headline"] = "changed"
+    noisy["positions"][0]["description"] = "  " + noisy["positions"][0]["description"].replace("\n", " \n  ")
+    assert pipeline.result_cache_key(pipeline.Candidate.model_validate(noisy)) == pipeline.result_cache_key(base)
+
+    changed = json.loads(json.dumps(sample_candidate))
+    changed["skills"].append("Rust")
+    assert pipeline.result_cache_key(pipeline.Candidate.model_validate(changed)) != pipeline.result_cache_key(base)
+
+
+def test_cache_key_tracks_prompt_version(sample_candidate, monkeypatch):
+    cand = pipeline.Candidate.model_validate(sample_candidate)
+    before = pipeline.result_cache_key(cand)
+    monkeypatch.setattr(pipeline, "PROMPT_VERSION", "v-next")
+    assert pipeline.result_cache_key(cand) != before
+
+
+@pytest.mark.parametrize("field, value", [("rule_large_company_min_employees", 1), ("rule_growth_min_rate", 9.0)])
+def test_cache_key_tracks_rule_thresholds(sample_candidate, monkeypatch, field, value):
+    cand = pipeline.Candidate.model_validate(sample_candidate)
+    before = pipeline.result_cache_key(cand)
+    monkeypatch.setattr(pipeline.settings, field, value)
+    assert pipeline.result_cache_key(cand) != before
+
+
+def test_infer_result_cache_hit_miss_and_invalidate(fake_redis, sample_candidate, monkeypatch):
+    calls = {"n": 0}
+
+    @contextmanager
+    def fake_conn():
+        yield None
+
+    def fake_llm(_prompt):
+        calls["n"] += 1
+        return json.dumps({"tags": [{"tag": "리더쉽", "evidence": "Tech Lead"}]})
+
+    monkeypatch.setattr(infer_api, "get_db_connection", fake_conn)
+    monkeypatch.setattr(infer_api, "retrieve_context", lambda *_a: [])
+    monkeypatch.setattr(infer_api, "call_llm", fake_llm)
+
+    first = client.post("/api/infer", json=sample_candidate)
+    second = client.post("/api/infer", json=sample_candidate)
+    bypass = client.post("/api/infer", json=sample_candidate, headers={"Cache-Control": "no-cache"})
+
+    assert first.headers["X-Cache-Status"] == "MISS"
+    assert second.headers["X-Cache-Status"] == "HIT"
+    assert bypass.headers["X-Cache-Status"] == "BYPASS"
+    assert second.json() == first.json()
+    assert calls["n"] == 2
+
+    assert client.post("/api/infer/cache/invalidate", json=sample_candidate).json() == {"invalidated": True}
+    assert client.post("/api/infer", json=sample_candidate).headers["X-Cache-Status"] == "MISS"
+
+    stats = client.get("/api/health/result-cache").json()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["invalidations"] == 1
@@ -0,0 +1,199 @@
+import json
+import pathlib
+from contextlib import contextmanager
+from datetime import date
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.app.apis.v1 import infer as infer_api
+from backend.app.main import app
+from backend.app.services import pipeline, rule_tagger
+from backend.app.services.company_directory import CompanyDirectory, CompanyEvent, CompanyFacts
+from backend.app.services.company_facts import MonthFacts, TenureFacts
+
+client = TestClient(app)
+
+TODAY = date(2025, 1, 1)
+NAVER = CompanyFacts(2, 4559, (CompanyEvent(date(2002, 10, 29), "ipo", "IPO"),))
+TOSS = CompanyFacts(1, 1105, (
+    CompanyEvent(date(2016, 3, 2), "funding", "series B"),
+    CompanyEvent(date(2018, 12, 10), "funding", "series E"),
+    CompanyEvent(date(2021, 6, 14), "funding", "series G"),
+))
+
+
+@pytest.fixture()
+def sample_candidate():
+    with open(pathlib.Path(__file__).parent / "sample_candidate.json", encoding="utf-8") as f:
+        return pipeline.Candidate.model_validate(json.load(f))
+
+
+def _tenure(company_id: int, *headcounts: int) -> TenureFacts:
+    """재직 기간 사실 - 월별 직원 수만 (이벤트 없음)"""
+    months = tuple(MonthFacts(date(2020, i + 1, 1), h, None, None) for i, h in enumerate(headcounts))
+    return TenureFacts(company_id, date(2020, 1, 1), date(2020, 12, 31), months, ())
+
+
+def _tags(outcome) -> dict[str, str]:
+    return {t.tag: t.evidence for t in outcome.tags}
+
+
+@pytest.mark.parametrize("raw, norm", [
+    ("서울대학교 (Seoul National University)", "서울대학교"),
+    ("Emory University - Goizueta Business School", "emoryuniversity"),
+    ("KAIST", "kaist"),
+    ("연세대학교 대학원", "연세대학교"),
+])
+def test_normalize_school_name(raw, norm):
+    assert rule_tagger.normalize_school_name(raw) == norm
+
+
+def test_rule_tags_match_pipeline_tag_list():
+    names = {v for k, v in vars(rule_tagger).items() if k.isupper() and isinstance(v, str) and k != "RULES_VERSION"}
+    assert names <= set(pipeline._TAG_LIST)
+
+
+def test_apply_rules_with_known_companies(sample_candidate):
+    # 네이버 2건, 토스 2건 (2016.01–2019.01)
+    outcome = rule_tagger.apply_rules(sample_candidate, [NAVER, NAVER, TOSS, TOSS], 1000, today=TODAY)
+    tags = _tags(outcome)
+
+    assert tags["상위권대학교"] == "연세대학교 (학사 · 컴퓨터 공학)"
+    # 최근 경력부터 1~2개, 60자에서 자름
+    assert tags["신규 투자 유치 경험"].startswith("토스 재직 중 series E 투자 유치 (2018.12); 토스 재직 중 series B")
+    assert tags["성장기 스타트업 경험"] == "토스 series B 단계 재직 (2016.03)"
+    assert all(len(e) <= rule_tagger.EVIDENCE_MAX_CHARS for e in tags.values())
+    # 네이버 상장(2002)은 재직 전, M&A 이력 없음 → 모든 회사를 아니까 '없음' 확정
+    assert "IPO" not in tags and "M&A 경험" not in tags
+    # 리더쉽·대용량 데이터 처리 경험은 규칙이 판정하지 않음, 재직 기간 직원 수가 없으면 대규모 회사 경험도 LLM 에
+    assert "대규모 회사 경험" not in tags
+    assert outcome.resolved == frozenset(pipeline._TAG_LIST) - {"리더쉽", "대용량 데이터 처리 경험", "대규모 회사 경험"}
+
+
+def test_large_company_uses_only_headcount_during_tenure(sample_candidate):
+    facts = [NAVER, NAVER, TOSS, TOSS]
+    # 토스 2016–2019 재직 기간에는 월별 직원 수가 없음 - 현재 직원 수(1,105명)로 판정하지 않음
+    tenures = [_tenure(2, 4000, 4559), _tenure(2, 3800), _tenure(1), _tenure(1)]
+    outcome = rule_tagger.apply_rules(sample_candidate, facts, 1000, today=TODAY, tenures=tenures)
+    assert _tags(outcome)["대규모 회사 경험"] == "네이버 재직 (당시 직원 4,559명); 네이버 재직 (당시 직원 3,800명)"
+
+    # 근거가 없고 토스 기간 직원 수를 모르면 '없음'을 확정하지 않음
+    small = [_tenure(2, 300), _tenure(2, 200), _tenure(1), _tenure(1)]
+    outcome = rule_tagger.apply_rules(sample_candidate, facts, 1000, today=TODAY, tenures=small)
+    assert "대규모 회사 경험" not in _tags(outcome) and "대규모 회사 경험" not in outcome.resolved
+
+    # emp_count 가 NULL 인 회사도 마찬가지 (기간 사실 없음)
+    no_count = CompanyFacts(1, None, TOSS.events)
+    outcome = rule_tagger.apply_rules(sample_candidate, [NAVER, NAVER, no_count, no_count], 1000, today=TODAY,
+                                      tenures=small[:2] + [None, None])
+    assert "대규모 회사 경험" not in outcome.resolved
+
+    # 모든 경력의 기간 직원 수를 알면 '없음' 확정
+    known = [_tenure(2, 300), _tenure(2, 200), _tenure(1, 80), _tenure(1, 40)]
+    outcome = rule_tagger.apply_rules(sample_candidate, facts, 1000, today=TODAY, tenures=known)
+    assert "대규모 회사 경험" not in _tags(outcome) and "대규모 회사 경험" in outcome.resolved
+
+
+@pytest.mark.parametrize("title, description", [
+    ("이사회 사무국 담당", ""),
+    ("창업지원팀 매니저", ""),
+    ("대표이사 비서", ""),
+    ("Lead Generation Specialist", ""),
+    ("Backend Engineer", "kafka 컨슈머 설정 검토, 피크 TPS 모니터링 대시보드 작성"),
+])
+def test_leadership_and_large_data_are_left_to_llm(sample_candidate, title, description):
+    positions = [p.model_copy(update={"title": title, "description": description}) for p in sample_candidate.positions]
+    candidate = sample_candidate.model_copy(update={"positions": positions})
+    outcome = rule_tagger.apply_rules(candidate, [NAVER, NAVER, TOSS, TOSS], 1000, today=TODAY)
+
+    assert {"리더쉽", "대용량 데이터 처리 경험"}.isdisjoint(_tags(outcome))
+    assert {"리더쉽", "대용량 데이터 처리 경험"}.isdisjoint(outcome.resolved)
+
+
+def test_grant_is_not_funding(sample_candidate):
+    grant_only = CompanyFacts(1, 30, (CompanyEvent(date(2017, 5, 1), "grant", "지원금"),))
+    outcome = rule_tagger.apply_rules(sample_candidate, [NAVER, NAVER, grant_only, grant_only], 1000, today=TODAY)
+
+    assert "신규 투자 유치 경험" not in _tags(outcome) and "신규 투자 유치 경험" in outcome.resolved
+
+
+def test_unknown_company_leaves_absent_company_tags_to_llm(sample_candidate):
+    outcome = rule_tagger.apply_rules(sample_candidate, [NAVER, NAVER, None, None], 1000, today=TODAY,
+                                      tenures=[_tenure(2, 4559), _tenure(2, 4000), None, None])
+
+    assert "대규모 회사 경험" in _tags(outcome)          # 아는 회사에서 근거를 찾으면 확정
+    assert {"IPO", "M&A 경험", "신규 투자 유치 경험", "성장기 스타트업 경험"}.isdisjoint(outcome.resolved)
+
+
+def test_directory_loads_facts_with_aliases():
+    rows = [(1, "비바리퍼블리카", {"corpNameKr": "비바리퍼블리카"}, [{"prodNameKr": "토스"}],
+             1105, json.dumps([["2021-06-14", "funding", "series G"]]))]
+
+    class FakeCursor:
+        def execute(self, *_a):
+            pass
+        def fetchall(self):
+            return rows
+        def __enter__(self):
+            return self
+        def __exit__(self, *exc):
+            pass
+
+    class FakeConn:
+        def cursor(self):
+            return FakeCursor()
+
+    directory = CompanyDirectory()
+    assert directory.facts_for(["토스"]) == [None]         # 적재 전에는 DB 를 읽지 않음
+    directory.refresh(FakeConn())
+    assert directory.facts_for(["토스", "당근"]) == [
+        CompanyFacts(1, 1105, (CompanyEvent(date(2021, 6, 14), "funding", "series G"),)), None,
+    ]
+
+
+def test_llm_sees_only_open_tags_and_cannot_override_rules(sample_candidate, monkeypatch):
+    monkeypatch.setattr(pipeline.company_directory, "facts_for", lambda names: [None] * len(names))
+    req = pipeline.RequestContext(sample_candidate)
+
+    assert req.open_tags == [
+        "대규모 회사 경험", "성장기 스타트업 경험", "리더쉽", "대용량 데이터 처리 경험", "IPO", "M&A 경험", "신규 투자 유치 경험",
+    ]
+    prompt = req.build_prompt()
+    assert "- 대규모 회사 경험" in prompt and "- 상위권대학교" not in prompt
+
+    llm = pipeline.InferenceResult.model_validate({"tags": [
+        {"tag": "상위권대학교", "evidence": "LLM 이 낸 근거"},
+        {"tag": "리더쉽", "evidence": "Tech Lead 로 팀 리드"},
+        {"tag": "IPO", "evidence": "상장 준비"},
+    ]})
+    merged = _tags(req.merge(llm))
+    assert merged["상위권대학교"] != "LLM 이 낸 근거"
+    assert merged["리더쉽"] == "Tech Lead 로 팀 리드" and merged["IPO"] == "상장 준비"
+
+
+def test_infer_asks_llm_only_for_tags_rules_cannot_decide(sample_candidate, monkeypatch):
+    monkeypatch.setattr(pipeline.company_directory, "facts_for", lambda names: [NAVER, NAVER, TOSS, TOSS])
+    monkeypatch.setattr(infer_api.settings, "result_cache_enabled", False)
+    monkeypatch.setattr(pipeline, "tenure_facts", lambda windows, _conn: [None] * len(windows))
+
+    @contextmanager
+    def fake_db():
+        yield None
+    monkeypatch.setattr(infer_api, "get_db_connection", fake_db)
+    monkeypatch.setattr(infer_api, "retrieve_context", lambda *_a: ["맥락"])
+    prompts = []
+
+    def fake_llm(prompt):
+        prompts.append(prompt)
+        return json.dumps({"tags": [{"tag": "리더쉽", "evidence": "Tech Lead 로 팀 리드"}]}, ensure_ascii=False)
+    monkeypatch.setattr(infer_api, "call_llm", fake_llm)
+
+    response = client.post("/api/infer", json=sample_candidate.model_dump())
+
+    assert response.status_code == 200
+    assert "- 리더쉽" in prompts[0] and "- 대용량 데이터 처리 경험" in prompts[0]
+    assert "- 상위권대학교" not in prompts[0] and "- IPO" not in prompts[0]
+    assert {t["tag"] for t in response.json()["tags"]} == {
+        "상위권대학교", "신규 투자 유치 경험", "성장기 스타트업 경험", "리더쉽",
+    }
@@ -0,0 +1,190 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from backend.app.clients import single_flight as sf_mod
+from backend.app.clients.single_flight import SingleFlight
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+        self._lock = threading.Lock()
+    def set(self, key, value, nx=False, px=None):
+        with self._lock:
+            if nx and key in self.store:
+                return None
+            self.store[key] = value
+            return True
+    def get(self, key):
+        return self.store.get(key)
+    def setex(self, key, _ttl, value):
+        self.store[key] = value
+    def exists(self, key):
+        return int(key in self.store)
+    def eval(self, _script, _n, key, token):
+        with self._lock:
+            if self.store.get(key) == token:
+                del self.store[key]
+                return 1
+            return 0
+
+
+class FakeAsyncRedis:
+    def __init__(self, sync: FakeRedis):
+        self._sync = sync
+    async def set(self, *a, **kw):
+        return self._sync.set(*a, **kw)
+    async def get(self, key):
+        return self._sync.get(key)
+    async def setex(self, *a):
+        return self._sync.setex(*a)
+    async def exists(self, key):
+        return self._sync.exists(key)
+    async def eval(self, *a):
+        return self._sync.eval(*a)
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    fake = FakeRedis()
+    monkeypatch.setattr(sf_mod, "rds", fake)
+    monkeypatch.setattr(sf_mod, "ards", FakeAsyncRedis(fake))
+    monkeypatch.setattr(sf_mod.settings, "single_flight_poll_interval", 0.005)
+    monkeypatch.setattr(sf_mod.settings, "single_flight_wait_timeout", 2.0)
+    return fake
+
+
+def test_concurrent_calls_share_one_execution(fake_redis):
+    sf = SingleFlight()
+    calls = {"n": 0}
+
+    def compute():
+        calls["n"] += 1
+        time.sleep(0.05)
+        return "value"
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda _: sf.do("k", compute, lambda: None), range(8)))
+
+    assert results == ["value"] * 8
+    assert calls["n"] == 1
+    assert sf.stats()["local_followers"] == 7
+    assert "sf:lock:k" not in fake_redis.store       # 락 해제 확인
+
+
+def test_leader_error_propagates_to_followers(fake_redis):
+    sf = SingleFlight()
+
+    def compute():
+        time.sleep(0.05)
+        raise RuntimeError("boom")
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(sf.do, "k", compute, lambda: None) for _ in range(4)]
+    for f in futures:
+        with pytest.raises(RuntimeError):
+            f.result()
+
+
+def test_remote_follower_waits_for_published_result(fake_redis):
+    fake_redis.store["sf:lock:k"] = "other-worker"
+    threading.Timer(0.03, fake_redis.setex, args=("result", 60, "remote")).start()
+
+    sf = SingleFlight()
+    value = sf.do("k", lambda: pytest.fail("다른 워커가 계산 중이면 직접 호출하지 않아야 함"),
+                  lambda: fake_redis.get("result"))
+
+    assert value == "remote"
+    assert sf.stats()["remote_followers"] == 1
+
+
+def test_remote_follower_falls_back_when_lock_released_without_result(fake_redis):
+    fake_redis.store["sf:lock:k"] = "other-worker"
+    threading.Timer(0.03, fake_redis.store.pop, args=("sf:lock:k",)).start()
+
+    sf = SingleFlight()
+    assert sf.do("k", lambda: "mine", lambda: None) == "mine"
+    assert sf.stats()["fallbacks"] == 1
+
+
+def test_coalesce_shared_publishes_result(fake_redis):
+    assert sf_mod.coalesce_shared("llm:x", lambda: "raw") == "raw"
+    assert fake_redis.get("sf:res:llm:x") == "raw"
+
+
+@pytest.mark.anyio
+async def test_async_calls_share_one_execution(fake_redis):
+    sf = SingleFlight()
+    calls = {"n": 0}
+
+    async def compute():
+        calls["n"] += 1
+        await asyncio.sleep(0.02)
+        return "value"
+
+    async def peek():
+        return None
+
+    results = await asyncio.gather(*(sf.do_async("k", compute, peek) for _ in range(5)))
+
+    assert results == ["value"] * 5
+    assert calls["n"] == 1
+
+
+def test_remote_follower_falls_back_when_redis_fails(fake_redis, monkeypatch):
+    fake_redis.store["sf:lock:k"] = "other-worker"
+
+    def broken(_key):
+        raise ConnectionError("redis down")
+    monkeypatch.setattr(fake_redis, "exists", broken)
+
+    sf = SingleFlight()
+    assert sf.do("k", lambda: "mine", lambda: None) == "mine"
+    assert sf.stats()["fallbacks"] == 1
+
+
+def test_lock_ttl_covers_worst_case_openai_call(monkeypatch):
+    monkeypatch.setattr(sf_mod.settings, "single_flight_lock_ttl", None)
+    monkeypatch.setattr(sf_mod.settings, "single_flight_wait_timeout", None)
+    monkeypatch.setattr(sf_mod.settings, "openai_timeout", 15.0)
+    monkeypatch.setattr(sf_mod.settings, "openai_max_retries", 4)
+    monkeypatch.setattr(sf_mod.settings, "openai_backoff_max", 4.0)
+
+    assert sf_mod.lock_ttl() == 15.0 * 4 + 4.0 * 3
+    assert sf_mod.wait_timeout() == sf_mod.lock_ttl()
+
+
+@pytest.mark.anyio
+async def test_followers_compute_when_async_leader_is_cancelled(fake_redis):
+    sf = SingleFlight()
+    started = asyncio.Event()
+
+    async def slow():
+        started.set()
+        await asyncio.sleep(10)
+
+    async def mine():
+        return "mine"
+
+    async def peek():
+        return None
+
+    leader = asyncio.create_task(sf.do_async("k", slow, peek))
+    await started.wait()
+    follower = asyncio.create_task(sf.do_async("k", mine, peek))
+    await asyncio.sleep(0)
+    leader.cancel()                     # 예: 클라이언트 연결 끊김
+
+    assert await follower == "mine"
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    assert sf.stats()["fallbacks"] == 1
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
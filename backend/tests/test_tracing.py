@@ -0,0 +1,124 @@
+import json
+from contextlib import asynccontextmanager, contextmanager
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.app.apis.v1 import infer as infer_api
+from backend.app.main import app
+from backend.app.services import async_pipeline
+from backend.app.utils import tracing
+import backend.app.clients.openai_client as client_mod
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def stub_pipeline(monkeypatch, tmp_path):
+    @contextmanager
+    def fake_conn():
+        yield None
+
+    monkeypatch.setattr(infer_api, "get_db_connection", fake_conn)
+    monkeypatch.setattr(infer_api, "retrieve_context", lambda *_a: ["ctx"])
+    monkeypatch.setattr(infer_api.settings, "result_cache_enabled", False)
+    monkeypatch.setattr(infer_api.settings, "single_flight_enabled", False)
+    monkeypatch.setattr("time.sleep", lambda *_: None)
+
+    calls = {"n": 0}
+    def flaky_create(**_kw):
+        calls["n"] += 1
+        if calls["n"] == 1:
+            raise client_mod.openai.APIError("temporary", request=None, body=None)
+        content = json.dumps({"tags": [{"tag": "리더쉽", "evidence": "Tech Lead"}]}, ensure_ascii=False)
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+            usage=SimpleNamespace(prompt_tokens=321, completion_tokens=12),
+        )
+    monkeypatch.setattr(client_mod.openai.chat.completions, "create", flaky_create)
+    return tmp_path / "traces.jsonl"
+
+
+@pytest.fixture
+def sample_candidate():
+    import pathlib
+    with open(pathlib.Path(__file__).parent / "sample_candidate.json", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_server_timing_on_request(stub_pipeline, sample_candidate):
+    response = client.post(
+        "/api/infer", json=sample_candidate,
+        headers={"X-Server-Timing": "1", "X-Request-ID": "req-123"},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["X-Request-ID"] == "req-123"
+    timing = response.headers["Server-Timing"]
+    for stage in ("total;dur=", "preprocess;dur=", "build_prompt;dur=", "call_llm;dur=", "openai.chat_completion;dur="):
+        assert stage in timing
+
+
+def test_no_trace_without_request_or_export(stub_pipeline, sample_candidate):
+    response = client.post("/api/infer", json=sample_candidate)
+
+    assert "Server-Timing" not in response.headers
+    assert response.headers["X-Request-ID"]
+
+
+def test_exports_otlp_json_with_attributes(monkeypatch, stub_pipeline, sample_candidate):
+    monkeypatch.setattr(tracing.settings, "trace_export_path", str(stub_pipeline))
+
+    client.post("/api/infer", json=sample_candidate, headers={"X-Request-ID": "req-otlp"})
+
+    [line] = stub_pipeline.read_text(encoding="utf-8").splitlines()
+    spans = json.loads(line)["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    by_name = {s["name"]: s for s in spans}
+    attrs = lambda s: {a["key"]: next(iter(a["value"].values())) for a in s["attributes"]}
+
+    root = by_name["POST /api/infer"]
+    assert "parentSpanId" not in root
+    assert attrs(root)["request.id"] == "req-otlp"
+    assert attrs(root)["cache.result"] == "BYPASS"
+    assert attrs(root)["http.status_code"] == "200"
+
+    llm = by_name["openai.chat_completion"]
+    assert attrs(llm)["openai.retries"] == "1"
+    assert attrs(llm)["llm.prompt_tokens"] == "321"
+    # call_llm 아래에 openai 호출 span 이 붙음
+    assert llm["parentSpanId"] == by_name["call_llm"]["spanId"]
+    assert {s["traceId"] for s in spans} == {root["traceId"]}
+
+
+def test_streaming_trace_includes_spans_after_headers(monkeypatch, tmp_path, sample_candidate):
+    path = tmp_path / "traces.jsonl"
+    monkeypatch.setattr(tracing.settings, "trace_export_path", str(path))
+    monkeypatch.setattr(infer_api.settings, "result_cache_enabled", False)
+    monkeypatch.setattr(infer_api.settings, "rule_tagger_enabled", False)
+
+    @asynccontextmanager
+    async def fake_async_conn():
+        yield None
+
+    async def no_ctx_async(*_a):
+        return []
+
+    async def fake_stream(_prompt):
+        # 응답 헤더가 나간 뒤 본문을 만들면서 생기는 span
+        with tracing.span("llm.stream"):
+            yield json.dumps({"tags": [{"tag": "리더쉽", "evidence": "Tech Lead"}]}, ensure_ascii=False)
+
+    monkeypatch.setattr(infer_api, "get_async_db_connection", fake_async_conn)
+    monkeypatch.setattr(async_pipeline, "retrieve_context", no_ctx_async)
+    monkeypatch.setattr(async_pipeline, "call_llm_stream", fake_stream)
+
+    response = client.post("/api/infer/stream", json=sample_candidate)
+
+    assert response.status_code == 200 and "event: result" in response.text
+    [line] = path.read_text(encoding="utf-8").splitlines()
+    spans = json.loads(line)["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    by_name = {s["name"]: s for s in spans}
+    root, streamed = by_name["POST /api/infer/stream"], by_name["llm.stream"]
+    assert streamed["parentSpanId"] == root["spanId"]
+    assert int(root["endTimeUnixNano"]) >= int(streamed["endTimeUnixNano"])
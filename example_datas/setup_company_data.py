@@ -1,12 +1,35 @@
 #!/usr/bin/env python
+"""
+company_ex*.json → company 테이블 적재 (증분).
+
+규칙 기반 태깅용 사실도 data 에서 뽑아 함께 저장합니다. (요청 경로는 JSONB 를 읽지 않음)
+  - company.emp_count / listed_at : 현재 직원 수, 상장일
+  - company_event  : 투자/IPO/M&A 이벤트
+  - company_month  : 월별 직원 수(organization)·MAU(mau, 제품 합)·해당 연도 매출(finance)
+
+data 와 생성한 요약문의 해시를 company 행에 저장해 두고, 다음 실행에서
+  - 해시가 모두 같으면 건너뛰고 (skipped)
+  - 요약이 같으면 임베딩 없이 data 만 갱신하고 (updated, 재임베딩 없음)
+  - 요약이 바뀌었거나 신규면 모아서 다건 임베딩 요청으로 한 번에 처리합니다.
+파일 로드와 요약 생성은 프로세스 풀에서 병렬로 실행합니다.
+
+    python ./setup_company_data.py
+    python ./setup_company_data.py --workers 8
+    python ./setup_company_data.py --force     # 해시와 무관하게 전부 재임베딩
+"""
 import os
 import sys
 import json
 import glob
+import hashlib
 import logging
+import argparse
 import openai
+from datetime import date
+from concurrent.futures import ProcessPoolExecutor
 
 import psycopg2
+from psycopg2.extras import execute_values
 from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
 
 from dotenv import load_dotenv
@@ -85,6 +108,8 @@ def create_company_table(conn):
 
             # pgvector 확장
             cursor.execute("CREATE EXTENSION IF NOT EXISTS vector;")
+            # 이미 설치된 확장은 이미지를 올려도 이전 버전 그대로라 설치된 최신 버전으로 갱신
+            cursor.execute("ALTER EXTENSION vector UPDATE;")
             # summary_text 컬럼 추가
             cursor.execute(
                 """
@@ -99,6 +124,49 @@ def create_company_table(conn):
                 ADD COLUMN IF NOT EXISTS embedding VECTOR(1536);
                 """
             )
+            # 증분 적재용 내용 해시 컬럼
+            cursor.execute(
+                """
+                ALTER TABLE company
+                ADD COLUMN IF NOT EXISTS data_hash TEXT,
+                ADD COLUMN IF NOT EXISTS summary_hash TEXT;
+                """
+            )
+            # 규칙 기반 태깅용 사실 (facts_version 이 FACTS_VERSION 과 다르면 다시 추출)
+            cursor.execute(
+                """
+                ALTER TABLE company
+                ADD COLUMN IF NOT EXISTS emp_count INT,
+                ADD COLUMN IF NOT EXISTS listed_at DATE,
+                ADD COLUMN IF NOT EXISTS facts_version INT;
+                """
+            )
+            cursor.execute(
+                """
+                CREATE TABLE IF NOT EXISTS company_event (
+                    company_id INT NOT NULL REFERENCES company(id) ON DELETE CASCADE,
+                    event_date DATE NOT NULL,
+                    kind TEXT NOT NULL,          -- funding | ipo | ma | grant
+                    level TEXT,                  -- series A, IPO, M&A ...
+                    amount BIGINT
+                );
+                CREATE INDEX IF NOT EXISTS company_event_company_id_event_date_idx
+                    ON company_event (company_id, event_date);
+                """
+            )
+            # 재직 기간 조회용 월별 사실 - (company_id, month) PK 범위 조회
+            cursor.execute(
+                """
+                CREATE TABLE IF NOT EXISTS company_month (
+                    company_id INT NOT NULL REFERENCES company(id) ON DELETE CASCADE,
+                    month DATE NOT NULL,         -- 월 첫날
+                    headcount INT,
+                    mau BIGINT,                  -- 제품별 MAU 합
+                    revenue BIGINT,              -- 해당 연도 매출 (연간)
+                    PRIMARY KEY (company_id, month)
+                );
+                """
+            )
 
     except psycopg2.Error as e:
         logger.error(f"테이블 생성 오류: {e}")
@@ -178,6 +246,88 @@ def make_summary(data: dict) -> str:
     return ". ".join(parts)
 
 
+# extract_facts 규칙을 바꾸면 올려주세요 - 다음 실행에서 전체 회사의 사실을 다시 추출합니다.
+FACTS_VERSION = 3
+
+
+def _parse_date(value):
+    try:
+        return date.fromisoformat(value[:10]) if value else None
+    except ValueError:
+        return None
+
+
+def _event_kind(level: str) -> str:
+    """
+    투자 이력 level → kind.
+    지원금·보조금(정부 과제 등)은 투자 유치가 아니라 grant 로 따로 두고 (규칙 태깅에 쓰지 않음),
+    비공개는 단계만 숨긴 투자 라운드라 funding 으로 봅니다. (단계를 모르니 성장기 판정에는 안 걸림)
+    """
+    lowered = level.lower()
+    if "ipo" in lowered or "상장" in level:
+        return "ipo"
+    if "m&a" in lowered or "인수" in level or "합병" in level:
+        return "ma"
+    if "지원금" in level or "보조금" in level or "grant" in lowered:
+        return "grant"
+    return "funding"
+
+
+def _month_start(value):
+    """'2024-12' → date(2024, 12, 1)"""
+    return _parse_date(f"{value}-01") if value else None
+
+
+def extract_months(data: dict) -> list:
+    """data → [(월 첫날, 직원 수, MAU, 연 매출)] (월 오름차순)"""
+    months = {}
+
+    def row(month):
+        return months.setdefault(month, {"headcount": None, "mau": None, "revenue": None})
+
+    for item in data.get("organization", {}).get("data") or []:
+        if (month := _month_start(item.get("referenceMonth"))) and item.get("value") is not None:
+            row(month)["headcount"] = item["value"]
+
+    for product in data.get("mau", {}).get("list") or []:
+        for item in product.get("data") or []:
+            if (month := _month_start(item.get("referenceMonth"))) and item.get("value") is not None:
+                r = row(month)
+                r["mau"] = (r["mau"] or 0) + item["value"]
+
+    # 같은 연도에 여러 기준이 있으면 연결(CONSOLIDATED) 재무를 우선
+    revenue = {}
+    for item in sorted(data.get("finance", {}).get("data") or [], key=lambda f: f.get("type", "").startswith("CONSOLIDATED")):
+        if item.get("year") and item.get("profit") is not None:
+            revenue[item["year"]] = item["profit"]
+    for year, value in revenue.items():
+        for m in range(1, 13):
+            row(date(year, m, 1))["revenue"] = value
+
+    return [(month, r["headcount"], r["mau"], r["revenue"]) for month, r in sorted(months.items())]
+
+
+def extract_facts(data: dict) -> dict:
+    """data → (직원 수, 상장일, 이벤트 목록, 월별 사실) - 투자 이력의 IPO/M&A 는 별도 kind 로 분류"""
+    corp = data["base_company_info"]["data"].get("seedCorp", {})
+    events = []
+    for inv in data.get("investment", {}).get("data", []):
+        when = _parse_date(inv.get("investAt"))
+        level = (inv.get("level") or "").strip()
+        if when and level:
+            events.append((when, _event_kind(level), level, inv.get("investmentAmount")))
+
+    listed_at = _parse_date(corp.get("listingDate"))
+    if listed_at and not any(kind == "ipo" for _, kind, _, _ in events):
+        events.append((listed_at, "ipo", "IPO", None))
+    return {
+        "emp_count": corp.get("empWholeVal"),
+        "listed_at": listed_at,
+        "events": sorted(events),
+        "months": extract_months(data),
+    }
+
+
 def load_company_data(file_path):
     """회사 데이터 파일 불러오기"""
     try:
@@ -191,44 +341,189 @@ def load_company_data(file_path):
         return None, None
 
 
-def insert_company_data(conn, name, data):
-    """회사 데이터를 데이터베이스에 삽입"""
-    summary = make_summary(data)
+def content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def prepare_company(file_path):
+    """
+    파일 로드 + 요약 생성 + 해시 계산 (프로세스 풀 작업 단위).
+    data 는 키 정렬한 JSON 으로 직렬화해 해시가 키 순서에 흔들리지 않도록 합니다.
+    """
+    company_name, data = load_company_data(file_path)
+    if not (company_name and data):
+        return None
     try:
+        summary = make_summary(data)
+    except (KeyError, TypeError, ValueError, IndexError) as e:
+        logger.error(f"요약 생성 오류 ({file_path}): {e}")
+        return None
+
+    data_json = json.dumps(data, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return {
+        "name": company_name,
+        "data_json": data_json,
+        "data_hash": content_hash(data_json),
+        "summary": summary,
+        "summary_hash": content_hash(summary),
+        "facts": extract_facts(data),
+    }
+
+
+def fetch_existing_hashes(conn, names):
+    """이름 → (data_hash, summary_hash, 임베딩 존재 여부, facts_version)"""
+    with conn.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT name, data_hash, summary_hash, embedding IS NOT NULL, facts_version
+            FROM company
+            WHERE name = ANY(%s)
+            """,
+            (names,),
+        )
+        return {name: tuple(rest) for name, *rest in cursor.fetchall()}
+
+
+def classify_companies(companies, existing, force=False):
+    """
+    (신규, 재임베딩 필요한 변경, data 만 변경, 변경 없음) 으로 분류
+    """
+    new, to_embed, data_only, unchanged = [], [], [], []
+    for c in companies:
+        if c["name"] not in existing:
+            new.append(c)
+            continue
+        data_hash, summary_hash, has_emb, facts_version = existing[c["name"]]
+        if force or summary_hash != c["summary_hash"] or not has_emb:
+            to_embed.append(c)
+        elif data_hash != c["data_hash"] or facts_version != FACTS_VERSION:
+            data_only.append(c)
+        else:
+            unchanged.append(c)
+    return new, to_embed, data_only, unchanged
+
+
+def embed_summaries(summaries, batch_size=256):
+    """요약문 목록을 다건 입력 요청으로 임베딩 (입력 순서 유지)"""
+    vectors = []
+    for i in range(0, len(summaries), batch_size):
         response = openai.embeddings.create(
-            input=[summary],
+            input=summaries[i:i + batch_size],
             model="text-embedding-3-small"
         )
-        embedding = response.data[0].embedding
-    except Exception as e:
-        logger.error(f"임베딩 생성에 실패했습니다.: {e}")
-        sys.exit(1)
+        vectors.extend(d.embedding for d in sorted(response.data, key=lambda d: d.index))
+    return vectors
+
 
+def upsert_companies(conn, companies, embeddings):
+    """
+    회사 데이터를 한 번의 INSERT ... ON CONFLICT 로 반영.
+    embedding 이 None 인 행(data 만 변경)은 기존 임베딩을 유지합니다.
+    호출하는 쪽 트랜잭션 안에서 실행해야 합니다. (회사 행의 해시·facts_version 과 사실을 함께 커밋)
+    """
+    if not companies:
+        return
+    rows = [
+        (
+            c["name"], c["data_json"], c["summary"],
+            "[" + ",".join(map(str, e)) + "]" if e is not None else None,
+            c["data_hash"], c["summary_hash"],
+            c["facts"]["emp_count"], c["facts"]["listed_at"], FACTS_VERSION,
+        )
+        for c, e in zip(companies, embeddings)
+    ]
+    with conn.cursor() as cursor:
+        ids = execute_values(
+            cursor,
+            """
+            INSERT INTO company (name, data, summary_text, embedding, data_hash, summary_hash,
+                                 emp_count, listed_at, facts_version)
+            VALUES %s
+            ON CONFLICT (name) DO UPDATE
+            SET data = EXCLUDED.data,
+                summary_text = EXCLUDED.summary_text,
+                embedding = COALESCE(EXCLUDED.embedding, company.embedding),
+                data_hash = EXCLUDED.data_hash,
+                summary_hash = EXCLUDED.summary_hash,
+                emp_count = EXCLUDED.emp_count,
+                listed_at = EXCLUDED.listed_at,
+                facts_version = EXCLUDED.facts_version
+            RETURNING id, name;
+            """,
+            rows,
+            template="(%s, %s::jsonb, %s, %s::vector, %s, %s, %s, %s, %s)",
+            page_size=len(rows),
+            fetch=True,
+        )
+    replace_company_facts(conn, dict((name, cid) for cid, name in ids), companies)
+
+
+def replace_company_facts(conn, id_by_name, companies):
+    """갱신한 회사들의 이벤트·월별 사실을 지우고 새로 넣음"""
+    company_ids = list(id_by_name.values())
+    tables = {
+        "company_event": ("(company_id, event_date, kind, level, amount)", "events"),
+        "company_month": ("(company_id, month, headcount, mau, revenue)", "months"),
+    }
+    with conn.cursor() as cursor:
+        for table, (columns, key) in tables.items():
+            rows = [(id_by_name[c["name"]], *fact) for c in companies for fact in c["facts"][key]]
+            cursor.execute(f"DELETE FROM {table} WHERE company_id = ANY(%s)", (company_ids,))
+            if rows:
+                execute_values(cursor, f"INSERT INTO {table} {columns} VALUES %s", rows, page_size=1000)
+
+
+def sync_companies(conn, company_files, workers=None, force=False):
+    """회사 파일들을 증분 적재하고 건수 리포트를 반환"""
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        prepared = list(pool.map(prepare_company, sorted(company_files)))
+    companies = [c for c in prepared if c]
+    failed = len(prepared) - len(companies)
+
+    existing = fetch_existing_hashes(conn, [c["name"] for c in companies])
+    new, to_embed, data_only, unchanged = classify_companies(companies, existing, force)
+
+    embed_targets = new + to_embed
+    if embed_targets:
+        try:
+            embeddings = embed_summaries([c["summary"] for c in embed_targets])
+        except Exception as e:
+            logger.error(f"임베딩 생성에 실패했습니다.: {e}")
+            sys.exit(1)
+    else:
+        embeddings = []
+
+    # 연결은 autocommit 이라 이 단계만 트랜잭션으로 묶음 - 중간에 실패하면 회사 행(해시)까지 되돌려
+    # 다음 실행이 같은 회사를 다시 반영하도록 합니다.
+    conn.autocommit = False
     try:
-        with conn.cursor() as cursor:
-        
-            # 데이터 삽입
-            cursor.execute(
-                """
-                INSERT INTO company (name, data, summary_text, embedding)
-                VALUES (%s, %s::jsonb, %s, %s::vector)
-                ON CONFLICT (name) DO UPDATE
-                SET data = EXCLUDED.data,
-                    summary_text = EXCLUDED.summary_text,
-                    embedding = EXCLUDED.embedding;
-                """,
-                (name, json.dumps(data), summary, embedding),
-            )
-            logger.info(f"회사 '{name}'의 데이터가 성공적으로 삽입되었습니다.")
-            return True
+        with conn:
+            upsert_companies(conn, embed_targets + data_only, embeddings + [None] * len(data_only))
     except psycopg2.Error as e:
         logger.error(f"데이터 삽입 오류: {e}")
-        conn.rollback()
-        return False
+        raise
+    finally:
+        conn.autocommit = True
+
+    return {
+        "new": len(new),
+        "updated": len(to_embed) + len(data_only),
+        "re_embedded": len(to_embed),
+        "skipped": len(unchanged),
+        "failed": failed,
+    }
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="company 증분 적재")
+    parser.add_argument("--workers", type=int, default=None, help="파일 로드/요약 프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--force", action="store_true", help="해시와 무관하게 전부 재임베딩")
+    return parser.parse_args()
 
 
 def main():
     """메인 함수"""
+    args = parse_args()
     try:
         # 데이터베이스 연결
         conn = connect_to_db()
@@ -241,14 +536,12 @@ def main():
         logger.info(f"{len(company_files)}개의 회사 데이터 파일을 찾았습니다.")
 
         # 데이터 처리 및 삽입
-        success_count = 0
-        for file_path in sorted(company_files):
-            company_name, company_data = load_company_data(file_path)
-            if company_name and company_data:
-                if insert_company_data(conn, company_name, company_data):
-                    success_count += 1
-
-        logger.info(f"총 {success_count}개의 회사 데이터가 성공적으로 삽입되었습니다.")
+        report = sync_companies(conn, company_files, workers=args.workers, force=args.force)
+
+        logger.info(
+            "적재 결과 - 신규 {new}, 갱신 {updated} (재임베딩 {re_embedded}), "
+            "변경 없음 {skipped}, 실패 {failed}".format(**report)
+        )
 
     except Exception as e:
         logger.error(f"예상치 못한 오류가 발생했습니다: {e}")
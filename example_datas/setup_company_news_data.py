@@ -1,13 +1,40 @@
 #!/usr/bin/env python
+"""
+company_news.csv → company_news 테이블 적재.
+
+company_news 는 news_date 월 단위 RANGE 파티션 테이블입니다. (company_news_pYYYYMM)
+청크마다 필요한 월 파티션을 만들고, 끝나면 NEWS_PARTITION_PREMAKE_MONTHS 개월 앞 파티션을 미리 만들고
+NEWS_RETENTION_MONTHS 개월보다 오래된 파티션은 떼어냅니다. (NEWS_RETENTION_DROP=true 면 삭제)
+보존 기간보다 오래된 뉴스는 적재하지 않습니다. backend 워커도 같은 정책을 주기적으로 적용합니다.
+
+임베딩 컬럼 형식은 NEWS_EMBEDDING_TYPE(--embedding-type) 로 고릅니다. backend 와 같은 값을 쓰세요.
+    vector   float32, 행당 약 6KB (기본)
+    halfvec  float16, 행당 약 3KB - 코사인 거리 순서는 거의 같음
+기존 테이블의 형식이 다르면 컬럼을 변환(테이블 재작성)하고 벡터 인덱스를 지우므로,
+변환 후 setup_vector_index.py 를 다시 실행하세요. 절감량·recall 은 backend/benchmarks/news_quantization.py 로 확인합니다.
+
+CSV 를 청크 단위로 읽어 (company_id, title, news_date) 유니크 제약으로 중복을 거르고,
+제목 임베딩은 다건 입력 배치를 제한된 동시성으로 요청한 뒤 execute_values 로 한 번에 씁니다.
+청크가 끝날 때마다 체크포인트 파일에 진행 위치를 기록하므로, 중단된 실행은 같은 명령으로 이어서 돌릴 수 있습니다.
+
+    python ./setup_company_news_data.py
+    python ./setup_company_news_data.py --chunk-size 2000 --embed-batch-size 512 --embed-concurrency 8
+    python ./setup_company_news_data.py --reset        # 체크포인트 무시하고 처음부터
+"""
 import os
 import sys
 import csv
+import json
 import logging
+import argparse
 import openai
-from datetime import datetime
+from datetime import date, datetime
+from concurrent.futures import ThreadPoolExecutor
 
 import psycopg2
+from psycopg2.extras import execute_values
 from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+from tenacity import retry, stop_after_attempt, wait_exponential
 
 from dotenv import load_dotenv
 load_dotenv()
@@ -52,86 +79,304 @@ def connect_to_db():
         raise
 
 
-def create_company_news_table(conn):
-    """company_news 테이블 생성 (존재하지 않을 경우)"""
+EMBED_MODEL = "text-embedding-3-small"
+UNIQUE_CONSTRAINT = "company_news_company_id_title_news_date_key"
+
+
+PARTITION_LOCK = "company_news_partitions"
+EMBED_DIM = 1536
+EMBEDDING_TYPES = ("vector", "halfvec")
+
+# 월 파티션 생성·보존 정책 함수 - 적재 스크립트와 backend 워커(services/news_partitions.py)가 함께 사용
+PARTITION_FUNCTIONS_SQL = """
+CREATE OR REPLACE FUNCTION company_news_partition_name(p_month date) RETURNS text
+LANGUAGE sql IMMUTABLE AS $$
+    SELECT 'company_news_p' || to_char(p_month, 'YYYYMM')
+$$;
+
+CREATE OR REPLACE FUNCTION company_news_ensure_partition(p_month date) RETURNS text
+LANGUAGE plpgsql AS $$
+DECLARE
+    start_d date := date_trunc('month', p_month)::date;
+    name text := company_news_partition_name(start_d);
+BEGIN
+    PERFORM pg_advisory_xact_lock(hashtext('company_news_partitions'));
+    IF to_regclass(name) IS NULL THEN
+        -- 부모의 B-tree·BRIN·벡터 인덱스가 새 파티션에도 자동으로 만들어짐
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF company_news FOR VALUES FROM (%L) TO (%L)',
+            name, start_d, (start_d + interval '1 month')::date
+        );
+    END IF;
+    RETURN name;
+END
+$$;
+
+CREATE OR REPLACE FUNCTION company_news_maintain(premake_months int, retention_months int, drop_old boolean)
+RETURNS TABLE (action text, partition_name text)
+LANGUAGE plpgsql AS $$
+DECLARE
+    this_month date := date_trunc('month', CURRENT_DATE)::date;
+    m date;
+    cutoff date;
+    part record;
+BEGIN
+    PERFORM pg_advisory_xact_lock(hashtext('company_news_partitions'));
+    FOR i IN 0..premake_months LOOP
+        m := (this_month + make_interval(months => i))::date;
+        IF to_regclass(company_news_partition_name(m)) IS NULL THEN
+            action := 'created';
+            partition_name := company_news_ensure_partition(m);
+            RETURN NEXT;
+        END IF;
+    END LOOP;
+
+    IF retention_months > 0 THEN
+        -- 파티션의 마지막 날까지 전부 보존 기간 밖이면 떼어냄
+        cutoff := (this_month - make_interval(months => retention_months))::date;
+        FOR part IN
+            SELECT c.relname
+            FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid
+            WHERE i.inhparent = 'company_news'::regclass
+                AND c.relname ~ '^company_news_p[0-9]{6}$'
+                AND to_date(right(c.relname, 6), 'YYYYMM') < cutoff
+            ORDER BY c.relname
+        LOOP
+            EXECUTE format('ALTER TABLE company_news DETACH PARTITION %I', part.relname);
+            IF drop_old THEN
+                EXECUTE format('DROP TABLE %I', part.relname);
+                action := 'dropped';
+            ELSE
+                action := 'detached';
+            END IF;
+            partition_name := part.relname;
+            RETURN NEXT;
+        END LOOP;
+    END IF;
+END
+$$;
+"""
+
+
+HALFVEC_MIN_PGVECTOR = (0, 7, 0)
+
+
+def pgvector_version(cursor) -> tuple[int, ...]:
+    """설치된 pgvector 확장 버전 (없으면 (0,))"""
+    cursor.execute("SELECT extversion FROM pg_extension WHERE extname = 'vector'")
+    row = cursor.fetchone()
+    return tuple(int(x) for x in row[0].split(".")) if row else (0,)
+
+
+def create_company_news_table(conn, embedding_type="vector"):
+    """
+    company_news 를 news_date 월 단위 RANGE 파티션 테이블로 생성 (존재하지 않을 경우).
+    예전 단일 테이블이 있으면 파티션 테이블로 옮깁니다. (벡터 인덱스는 setup_vector_index.py 로 다시 생성)
+    """
     try:
         with conn.cursor() as cursor:
-            # 테이블이 존재하는지 확인
+            if embedding_type == "halfvec" and pgvector_version(cursor) < HALFVEC_MIN_PGVECTOR:
+                raise RuntimeError("halfvec 은 pgvector 0.7 이상이 필요합니다. (docker-compose 이미지·ALTER EXTENSION vector UPDATE 확인)")
+            cursor.execute("SELECT relkind FROM pg_class WHERE oid = to_regclass('company_news')")
+            row = cursor.fetchone()
+            if row is not None and row[0] == "p":
+                logger.info("company_news 파티션 테이블이 이미 존재합니다. 테이블 생성을 건너뜁니다.")
+                cursor.execute(PARTITION_FUNCTIONS_SQL)
+                ensure_embedding_type(cursor, embedding_type)
+                return
+
+            cursor.execute("BEGIN")
+            if row is not None:
+                logger.info("단일 company_news 테이블을 월 파티션 테이블로 옮깁니다.")
+                rename_legacy_table(cursor)
+            # 유니크 제약·PK 는 파티션 키(news_date)를 포함해야 함
             cursor.execute(
+                f"""
+                CREATE TABLE company_news (
+                    id SERIAL,
+                    company_id INTEGER NOT NULL,
+                    title VARCHAR(1000) NOT NULL,
+                    original_link TEXT,
+                    news_date DATE NOT NULL,
+                    embedding {embedding_type}({EMBED_DIM}),
+                    PRIMARY KEY (id, news_date),
+                    CONSTRAINT {UNIQUE_CONSTRAINT} UNIQUE (company_id, title, news_date),
+                    FOREIGN KEY (company_id) REFERENCES company(id) ON DELETE CASCADE
+                ) PARTITION BY RANGE (news_date);
                 """
-                SELECT EXISTS (
-                    SELECT FROM information_schema.tables 
-                    WHERE table_name = 'company_news'
-                );
-            """
             )
-            table_exists = cursor.fetchone()[0]
-
-            if not table_exists:
-                logger.info(
-                    "company_news 테이블이 존재하지 않습니다. 새로운 테이블을 생성합니다."
-                )
-                cursor.execute(
-                    """
-                    CREATE TABLE company_news (
-                        id SERIAL PRIMARY KEY,
-                        company_id INTEGER NOT NULL,
-                        title VARCHAR(1000) NOT NULL,
-                        original_link TEXT,
-                        news_date DATE NOT NULL,
-                        embedding VECTOR(1536),
-                        FOREIGN KEY (company_id) REFERENCES company(id) ON DELETE CASCADE
-                    );
-                """
-                )
-                # embedding 컬럼
-                cursor.execute(
-                    """
-                    ALTER TABLE company_news
-                    ADD COLUMN IF NOT EXISTS embedding VECTOR(1536);
-                    """
-                )
-                logger.info("company_news 테이블이 성공적으로 생성되었습니다.")
-            else:
-                logger.info(
-                    "company_news 테이블이 이미 존재합니다. 테이블 생성을 건너뜁니다."
-                )
+            # 회사별 최근 뉴스 조회(company_id = ANY(...) AND news_date >= ...)용 복합 인덱스
+            cursor.execute(
+                "CREATE INDEX company_news_company_id_news_date_idx ON company_news (company_id, news_date)"
+            )
+            # 날짜 범위 스캔용 - 적재 순서가 대체로 날짜 순이라 BRIN 이 작게 유지됨
+            cursor.execute("CREATE INDEX company_news_news_date_brin_idx ON company_news USING brin (news_date)")
+            cursor.execute(PARTITION_FUNCTIONS_SQL)
+            if row is not None:
+                copy_legacy_rows(cursor, embedding_type)
+            cursor.execute("COMMIT")
+            logger.info("company_news 파티션 테이블이 성공적으로 생성되었습니다.")
     except psycopg2.Error as e:
         logger.error(f"테이블 생성 오류: {e}")
         raise
 
 
-def load_news_data(file_path):
-    """뉴스 데이터 CSV 파일 불러오기"""
-    news_data = []
+def rename_legacy_table(cursor):
+    """이름이 겹치지 않도록 예전 테이블·인덱스·시퀀스에 _legacy 를 붙임"""
+    cursor.execute("ALTER TABLE company_news RENAME TO company_news_legacy")
+    cursor.execute("SELECT indexname FROM pg_indexes WHERE tablename = 'company_news_legacy'")
+    for (name,) in cursor.fetchall():
+        cursor.execute(f'ALTER INDEX "{name}" RENAME TO "{name[:55]}_legacy"')
+    cursor.execute("ALTER SEQUENCE IF EXISTS company_news_id_seq RENAME TO company_news_id_seq_legacy")
+
+
+def copy_legacy_rows(cursor, embedding_type):
+    """필요한 월 파티션을 만들고 예전 행을 옮긴 뒤 예전 테이블 삭제"""
+    cursor.execute(
+        """
+        SELECT company_news_ensure_partition(month)
+        FROM (SELECT DISTINCT date_trunc('month', news_date)::date AS month FROM company_news_legacy) m
+        """
+    )
+    cursor.execute(
+        f"""
+        INSERT INTO company_news (id, company_id, title, original_link, news_date, embedding)
+        SELECT id, company_id, title, original_link, news_date, embedding::{embedding_type}({EMBED_DIM})
+        FROM company_news_legacy
+        ORDER BY id
+        ON CONFLICT ON CONSTRAINT {UNIQUE_CONSTRAINT} DO NOTHING
+        """
+    )
+    # 유니크 제약 이전에 적재된 중복 행은 가장 먼저 들어온 행만 남음
+    logger.info(f"{cursor.rowcount}건을 파티션 테이블로 옮겼습니다.")
+    cursor.execute("SELECT setval('company_news_id_seq', GREATEST((SELECT max(id) FROM company_news), 1))")
+    cursor.execute("DROP TABLE company_news_legacy")
+
+
+def ensure_embedding_type(cursor, embedding_type):
+    """
+    embedding 컬럼 형식이 다르면 변환 (vector ↔ halfvec).
+    연산자 클래스가 형식마다 달라 ANN 인덱스(hnsw/ivfflat)는 먼저 지우고, 변환 후 다시 만들어야 합니다.
+    """
+    cursor.execute(
+        """
+        SELECT format_type(atttypid, atttypmod) FROM pg_attribute
+        WHERE attrelid = 'company_news'::regclass AND attname = 'embedding'
+        """
+    )
+    current = cursor.fetchone()[0]
+    if current == f"{embedding_type}({EMBED_DIM})":
+        return
+    logger.info(f"company_news.embedding 을 {current} → {embedding_type}({EMBED_DIM}) 로 변환합니다. (테이블 재작성)")
+    cursor.execute("BEGIN")
+    cursor.execute(
+        """
+        SELECT c.relname FROM pg_index i
+        JOIN pg_class c ON c.oid = i.indexrelid
+        JOIN pg_am a ON a.oid = c.relam
+        WHERE i.indrelid = 'company_news'::regclass AND a.amname IN ('hnsw', 'ivfflat')
+        """
+    )
+    for (name,) in cursor.fetchall():
+        cursor.execute(f'DROP INDEX "{name}"')
+        logger.info(f"벡터 인덱스 {name} 제거 - setup_vector_index.py 로 다시 만드세요.")
+    cursor.execute(
+        f"ALTER TABLE company_news ALTER COLUMN embedding TYPE {embedding_type}({EMBED_DIM})"
+        f" USING embedding::{embedding_type}({EMBED_DIM})"
+    )
+    cursor.execute("COMMIT")
+
+
+def ensure_partitions(cursor, news_dates):
+    """적재할 뉴스 날짜들의 월 파티션이 없으면 생성"""
+    months = sorted({d[:7] + "-01" for d in news_dates})
+    if months:
+        cursor.execute("SELECT company_news_ensure_partition(m) FROM unnest(%s::date[]) AS m", (months,))
+
+
+def maintain_partitions(conn, premake_months, retention_months, drop_old):
+    """앞으로 쓸 월 파티션을 미리 만들고 보존 기간이 지난 파티션을 떼어냄 (drop_old 면 삭제)"""
+    with conn.cursor() as cursor:
+        cursor.execute(
+            "SELECT action, partition_name FROM company_news_maintain(%s, %s, %s)",
+            (premake_months, retention_months, drop_old),
+        )
+        for action, name in cursor.fetchall():
+            logger.info(f"파티션 {name}: {action}")
+
+
+def retention_cutoff(retention_months, today=None):
+    """보존 기간 시작일 (이보다 오래된 뉴스는 적재하지 않음) - 0 이면 None"""
+    if retention_months <= 0:
+        return None
+    today = today or date.today()
+    months = today.year * 12 + today.month - 1 - retention_months
+    return date(months // 12, months % 12 + 1, 1).isoformat()
+
+
+def parse_news_row(row):
+    """CSV 행 → 뉴스 dict (형식 오류 시 None)"""
+    try:
+        news_date = datetime(int(row["year"]), int(row["month"]), int(row["day"])).strftime("%Y-%m-%d")
+        return {
+            "company_name": row["name"],
+            "title": row["title"],
+            "original_link": row["original_link"],
+            "news_date": news_date,
+        }
+    except (ValueError, KeyError, TypeError) as e:
+        logger.error(f"데이터 행 처리 오류: {e}, 행: {row}")
+        return None
+
+
+def iter_news_chunks(file_path, chunk_size, start_row=0):
+    """
+    CSV 를 chunk_size 행씩 읽어 (처리한 누적 행 수, 뉴스 목록) 을 순서대로 내보냅니다.
+    start_row 이전 행은 읽기만 하고 건너뜁니다. (체크포인트 재개)
+    """
+    with open(file_path, "r", encoding="utf-8") as file:
+        chunk, row_no = [], 0
+        for row_no, row in enumerate(csv.DictReader(file), start=1):
+            if row_no <= start_row:
+                continue
+            if (news := parse_news_row(row)) is not None:
+                chunk.append(news)
+            if row_no % chunk_size == 0:
+                yield row_no, chunk
+                chunk = []
+        if row_no > start_row and (chunk or row_no % chunk_size):
+            yield row_no, chunk
+
+
+# ---------- 체크포인트 ----------
+def _file_signature(file_path):
+    st = os.stat(file_path)
+    return {"file": os.path.abspath(file_path), "size": st.st_size, "mtime": int(st.st_mtime)}
+
+
+def load_checkpoint(path, file_path):
+    """같은 CSV 에 대한 체크포인트가 있으면 처리한 행 수를, 없으면 0 을 반환"""
     try:
-        with open(file_path, "r", encoding="utf-8") as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                try:
-                    # 날짜 변환
-                    year = int(row["year"])
-                    month = int(row["month"])
-                    day = int(row["day"])
-                    news_date = datetime(year, month, day).strftime("%Y-%m-%d")
-
-                    news_data.append(
-                        {
-                            "company_name": row["name"],
-                            "title": row["title"],
-                            "original_link": row["original_link"],
-                            "news_date": news_date,
-                        }
-                    )
-                except (ValueError, KeyError) as e:
-                    logger.error(f"데이터 행 처리 오류: {e}, 행: {row}")
-                    continue
-
-            logger.info(f"{len(news_data)}개의 뉴스 데이터를 로드했습니다.")
-            return news_data
-    except FileNotFoundError as e:
-        logger.error(f"파일 로드 오류 ({file_path}): {e}")
-        return []
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return 0
+    except (OSError, ValueError) as e:
+        logger.warning(f"체크포인트를 읽지 못해 처음부터 진행합니다: {e}")
+        return 0
+
+    if {k: data.get(k) for k in ("file", "size", "mtime")} != _file_signature(file_path):
+        logger.warning("체크포인트가 다른(또는 변경된) CSV 의 것이라 무시합니다.")
+        return 0
+    return int(data.get("rows_done", 0))
+
+
+def save_checkpoint(path, file_path, rows_done):
+    """임시 파일에 쓴 뒤 교체 - 중간에 죽어도 체크포인트가 깨지지 않음"""
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({**_file_signature(file_path), "rows_done": rows_done}, f)
+    os.replace(tmp, path)
 
 
 def get_company_map(conn):
@@ -150,93 +395,152 @@ def get_company_map(conn):
         return {}
 
 
-def insert_news_data(conn, news_data, company_map):
-    """뉴스 데이터를 데이터베이스에 삽입"""
-    try:
-        inserted_count = 0
-        skipped_count = 0
-        missing_company_count = 0
-
-        with conn.cursor() as cursor:
-            for news in news_data:
-                company_name = news["company_name"]
-
-                # 회사 ID 찾기
-                if company_name not in company_map:
-                    missing_company_count += 1
-                    logger.warning(
-                        f"회사 '{company_name}'가 데이터베이스에 존재하지 않습니다. 해당 뉴스를 건너뜁니다."
-                    )
-                    continue
-
-                company_id = company_map[company_name]
-
-                # 중복 확인
-                cursor.execute(
-                    """
-                    SELECT COUNT(*) FROM company_news 
-                    WHERE company_id = %s AND title = %s AND news_date = %s
-                    """,
-                    (company_id, news["title"], news["news_date"]),
-                )
-                count = cursor.fetchone()[0]
-
-                if count > 0:
-                    skipped_count += 1
-                    continue
-
-                # embedding 생성 (title 중심)
-                try:
-                    response = openai.embeddings.create(
-                        input=[news['title']],
-                        model='text-embedding-3-small'
-                    )
-                    embedding = response.data[0].embedding
-                except Exception as e:
-                    logger.error(f"임베딩 생성 실패: {e}")
-                    sys.exit(1)
-
-                # 데이터 삽입
-                cursor.execute(
-                    """
-                    INSERT INTO company_news (company_id, title, original_link, news_date, embedding) 
-                    VALUES (%s, %s, %s, %s, %s::vector)
-                    """,
-                    (
-                        company_id,
-                        news["title"],
-                        news["original_link"],
-                        news["news_date"],
-                        embedding
-                    ),
-                )
-                inserted_count += 1
-
-                # 로깅 (100개마다)
-                if inserted_count % 100 == 0:
-                    logger.info(f"{inserted_count}개의 뉴스 데이터가 삽입되었습니다.")
-
-        logger.info(f"총 {inserted_count}개의 뉴스 데이터가 삽입되었습니다.")
-        logger.info(f"중복으로 {skipped_count}개의 데이터가 건너뛰어졌습니다.")
-        logger.info(
-            f"존재하지 않는 회사로 인해 {missing_company_count}개의 데이터가 건너뛰어졌습니다."
+@retry(stop=stop_after_attempt(5), wait=wait_exponential(multiplier=1, min=1, max=30), reraise=True)
+def _embed_batch(titles):
+    response = openai.embeddings.create(input=titles, model=EMBED_MODEL)
+    return [d.embedding for d in sorted(response.data, key=lambda d: d.index)]
+
+
+def embed_titles(titles, executor, batch_size):
+    """제목 목록을 batch_size 씩 나눠 executor 의 동시성 한도 안에서 임베딩 (입력 순서 유지)"""
+    batches = [titles[i:i + batch_size] for i in range(0, len(titles), batch_size)]
+    vectors = []
+    for batch_vectors in executor.map(_embed_batch, batches):
+        vectors.extend(batch_vectors)
+    return vectors
+
+
+def _vector_literal(vec):
+    return "[" + ",".join(map(str, vec)) + "]"
+
+
+def filter_existing(cursor, rows):
+    """이미 적재된 (company_id, title, news_date) 를 제외 - 재실행 시 임베딩 비용을 아끼기 위함"""
+    if not rows:
+        return rows
+    cursor.execute(
+        """
+        SELECT n.company_id, n.title, n.news_date::text
+        FROM company_news n
+        JOIN unnest(%s::int[], %s::text[], %s::date[]) AS u(company_id, title, news_date)
+            ON n.company_id = u.company_id AND n.title = u.title AND n.news_date = u.news_date
+        """,
+        ([r[0] for r in rows], [r[1] for r in rows], [r[3] for r in rows]),
+    )
+    existing = set(cursor.fetchall())
+    return [r for r in rows if (r[0], r[1], r[3]) not in existing]
+
+
+def insert_news_chunk(conn, news_chunk, company_map, executor, embed_batch_size, cutoff=None,
+                      embedding_type="vector"):
+    """청크 하나 적재 → (삽입, 중복·보존 기간 밖, 회사 없음) 건수"""
+    rows, missing_company_count, expired = {}, 0, 0
+    for news in news_chunk:
+        if cutoff and news["news_date"] < cutoff:
+            expired += 1
+            continue
+        company_id = company_map.get(news["company_name"])
+        if company_id is None:
+            missing_company_count += 1
+            logger.warning(
+                f"회사 '{news['company_name']}'가 데이터베이스에 존재하지 않습니다. 해당 뉴스를 건너뜁니다."
+            )
+            continue
+        # 청크 안의 중복은 먼저 제거
+        key = (company_id, news["title"], news["news_date"])
+        rows.setdefault(key, (company_id, news["title"], news["original_link"], news["news_date"]))
+
+    candidates = list(rows.values())
+    with conn.cursor() as cursor:
+        new_rows = filter_existing(cursor, candidates)
+        if not new_rows:
+            return 0, len(candidates) + expired, missing_company_count
+        ensure_partitions(cursor, [r[3] for r in new_rows])
+
+        embeddings = embed_titles([r[1] for r in new_rows], executor, embed_batch_size)
+        inserted = execute_values(
+            cursor,
+            f"""
+            INSERT INTO company_news (company_id, title, original_link, news_date, embedding)
+            VALUES %s
+            ON CONFLICT ON CONSTRAINT {UNIQUE_CONSTRAINT} DO NOTHING
+            RETURNING id
+            """,
+            [(*r, _vector_literal(e)) for r, e in zip(new_rows, embeddings)],
+            template=f"(%s, %s, %s, %s, %s::{embedding_type})",
+            page_size=len(new_rows),
+            fetch=True,
         )
-
-        return inserted_count
-    except psycopg2.Error as e:
-        logger.error(f"데이터 삽입 오류: {e}")
-        conn.rollback()
-        return 0
+    return len(inserted), len(candidates) - len(inserted) + expired, missing_company_count
+
+
+def insert_news_data(conn, file_path, company_map, chunk_size=1000, embed_batch_size=256,
+                     embed_concurrency=4, checkpoint_path=None, cutoff=None, embedding_type="vector"):
+    """
+    뉴스 CSV 를 청크 단위로 적재합니다.
+    청크마다 커밋 후 체크포인트를 갱신하고, 모두 끝나면 체크포인트를 삭제합니다.
+    """
+    start_row = load_checkpoint(checkpoint_path, file_path) if checkpoint_path else 0
+    if start_row:
+        logger.info(f"체크포인트에서 재개합니다: {start_row}행 이후부터")
+
+    inserted_count = skipped_count = missing_company_count = 0
+    with ThreadPoolExecutor(max_workers=embed_concurrency) as executor:
+        for rows_done, news_chunk in iter_news_chunks(file_path, chunk_size, start_row):
+            inserted, skipped, missing = insert_news_chunk(
+                conn, news_chunk, company_map, executor, embed_batch_size, cutoff, embedding_type
+            )
+            inserted_count += inserted
+            skipped_count += skipped
+            missing_company_count += missing
+            if checkpoint_path:
+                save_checkpoint(checkpoint_path, file_path, rows_done)
+            logger.info(f"{rows_done}행까지 처리 (누적 삽입 {inserted_count}건)")
+
+    if checkpoint_path and os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+
+    logger.info(f"총 {inserted_count}개의 뉴스 데이터가 삽입되었습니다.")
+    logger.info(f"중복이거나 보존 기간 밖이라 {skipped_count}개의 데이터가 건너뛰어졌습니다.")
+    logger.info(
+        f"존재하지 않는 회사로 인해 {missing_company_count}개의 데이터가 건너뛰어졌습니다."
+    )
+    return inserted_count
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="company_news 적재")
+    parser.add_argument("--file", default="company_news.csv")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="체크포인트 단위 CSV 행 수")
+    parser.add_argument("--embed-batch-size", type=int, default=256, help="임베딩 요청 1회당 제목 수")
+    parser.add_argument("--embed-concurrency", type=int, default=4, help="동시 임베딩 요청 수")
+    parser.add_argument("--checkpoint", default=".company_news.checkpoint.json")
+    parser.add_argument("--reset", action="store_true", help="체크포인트를 지우고 처음부터 적재")
+    parser.add_argument("--premake-months", type=int, default=int(os.getenv("NEWS_PARTITION_PREMAKE_MONTHS", 3)),
+                        help="미리 만들어 둘 다음 달 파티션 수")
+    parser.add_argument("--retention-months", type=int, default=int(os.getenv("NEWS_RETENTION_MONTHS", 24)),
+                        help="보존 개월 수 (0 이면 무제한)")
+    parser.add_argument("--drop-old", action="store_true",
+                        default=os.getenv("NEWS_RETENTION_DROP", "").lower() in ("1", "true", "yes"),
+                        help="보존 기간이 지난 파티션을 떼어내는 대신 삭제")
+    parser.add_argument("--embedding-type", choices=EMBEDDING_TYPES,
+                        default=os.getenv("NEWS_EMBEDDING_TYPE", "vector"),
+                        help="embedding 컬럼 형식 (halfvec 은 크기 절반, 기존 테이블이면 변환)")
+    return parser.parse_args()
 
 
 def main():
     """메인 함수"""
+    args = parse_args()
+    if args.reset and os.path.exists(args.checkpoint):
+        os.remove(args.checkpoint)
+
     try:
         # 데이터베이스 연결
         conn = connect_to_db()
 
         # company_news 테이블 생성
-        create_company_news_table(conn)
+        create_company_news_table(conn, args.embedding_type)
 
         # 회사 매핑 가져오기
         company_map = get_company_map(conn)
@@ -244,17 +548,27 @@ def main():
             logger.error("회사 정보를 가져오지 못했습니다. 프로세스를 중단합니다.")
             return
 
-        # 뉴스 데이터 로드
-        news_data = load_news_data("company_news.csv")
-        if not news_data:
-            logger.error("뉴스 데이터를 로드하지 못했습니다. 프로세스를 중단합니다.")
+        if not os.path.exists(args.file):
+            logger.error(f"뉴스 데이터 파일이 없습니다: {args.file}")
             return
 
         # 데이터 삽입
-        insert_news_data(conn, news_data, company_map)
+        insert_news_data(
+            conn,
+            args.file,
+            company_map,
+            chunk_size=args.chunk_size,
+            embed_batch_size=args.embed_batch_size,
+            embed_concurrency=args.embed_concurrency,
+            checkpoint_path=args.checkpoint,
+            cutoff=retention_cutoff(args.retention_months),
+            embedding_type=args.embedding_type,
+        )
+        maintain_partitions(conn, args.premake_months, args.retention_months, args.drop_old)
 
     except Exception as e:
-        logger.error(f"예상치 못한 오류가 발생했습니다: {e}")
+        logger.error(f"예상치 못한 오류가 발생했습니다: {e} (같은 명령으로 다시 실행하면 체크포인트부터 재개합니다)")
+        sys.exit(1)
     finally:
         if "conn" in locals() and conn:
             conn.close()
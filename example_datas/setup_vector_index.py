@@ -0,0 +1,277 @@
+#!/usr/bin/env python
+"""
+company / company_news 임베딩 컬럼에 ANN 인덱스(HNSW 또는 IVFFlat)를 생성합니다.
+데이터 적재 후에 실행하세요. (IVFFlat 은 기존 행으로 클러스터를 학습하므로 빈 테이블에 만들면 안 됩니다)
+
+    python ./setup_vector_index.py                                 # HNSW (m=16, ef_construction=64)
+    python ./setup_vector_index.py --method hnsw --m 24 --ef-construction 128
+    python ./setup_vector_index.py --method ivfflat --lists 1000
+    python ./setup_vector_index.py --binary                        # + company_news 이진 양자화 인덱스 (해밍 거리)
+    python ./setup_vector_index.py --drop                          # 관리 인덱스 제거 (exact scan 으로 복귀)
+
+조회 시 ef_search / probes 는 backend Settings(HNSW_EF_SEARCH, IVFFLAT_PROBES)로 조정합니다.
+연산자 클래스는 컬럼 형식(vector / halfvec)을 읽어 고릅니다. (vector_cosine_ops / halfvec_cosine_ops)
+--binary 는 binary_quantize(embedding)::bit(차원) 식 인덱스(bit_hamming_ops)를 추가로 만듭니다.
+backend NEWS_BINARY_RERANK_CANDIDATES 로 해밍 거리 1차 후보 → 정확한 거리 재정렬을 켤 때 사용합니다.
+
+파티션 테이블(company_news)은 부모에 ON ONLY 인덱스를 만들고, 파티션마다 CONCURRENTLY 로 빌드해 붙입니다.
+이후 새로 만들어지는 월 파티션에는 같은 파라미터의 인덱스가 자동으로 생성됩니다.
+IVFFlat 은 빈 파티션에서 클러스터를 학습하게 되므로, 월 적재 후 이 스크립트를 다시 실행하세요.
+"""
+import os
+import math
+import logging
+import argparse
+
+import psycopg2
+from psycopg2 import sql
+from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+
+from dotenv import load_dotenv
+load_dotenv()
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+# 데이터베이스 연결 정보
+DB_CONFIG = {
+    "host": os.getenv("DB_HOST"),
+    "port": os.getenv("DB_PORT"),
+    "user": os.getenv("POSTGRES_USER"),
+    "password": os.getenv("POSTGRES_PASSWORD"),
+    "database": os.getenv("POSTGRES_DB"),
+}
+
+# 인덱스를 관리할 (테이블, 컬럼)
+VECTOR_COLUMNS = [("company", "embedding"), ("company_news", "embedding")]
+# 이진 양자화 인덱스를 관리할 (테이블, 컬럼) - --binary
+BINARY_COLUMNS = [("company_news", "embedding")]
+METHODS = ("hnsw", "ivfflat")
+# 인덱스 종류 - 이진 양자화 인덱스는 bq_ 접두사 (company_news_embedding_bq_hnsw_idx)
+KINDS = METHODS + tuple(f"bq_{method}" for method in METHODS)
+# binary_quantize·bit_hamming_ops 가 생긴 버전
+BINARY_MIN_PGVECTOR = (0, 7, 0)
+
+
+def connect_to_db():
+    """데이터베이스에 연결"""
+    try:
+        conn = psycopg2.connect(
+            host=DB_CONFIG["host"],
+            port=DB_CONFIG["port"],
+            user=DB_CONFIG["user"],
+            password=DB_CONFIG["password"],
+            database=DB_CONFIG["database"],
+        )
+        # CREATE INDEX CONCURRENTLY 는 트랜잭션 밖에서만 실행 가능
+        conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+        logger.info(f"성공적으로 {DB_CONFIG['database']} 데이터베이스에 연결했습니다.")
+        return conn
+    except psycopg2.Error as e:
+        logger.error(f"데이터베이스 연결 오류: {e}")
+        raise
+
+
+def pgvector_version(conn) -> tuple[int, ...]:
+    """설치된 pgvector 확장 버전 (없으면 (0,))"""
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT extversion FROM pg_extension WHERE extname = 'vector'")
+        row = cursor.fetchone()
+    return tuple(int(x) for x in row[0].split(".")) if row else (0,)
+
+
+def index_name(table: str, column: str, method: str) -> str:
+    return f"{table}_{column}_{method}_idx"
+
+
+def default_ivfflat_lists(row_count: int) -> int:
+    """pgvector 권장값: 100만 행 이하는 rows/1000, 초과는 sqrt(rows)"""
+    if row_count <= 1_000_000:
+        return max(1, row_count // 1000)
+    return int(math.sqrt(row_count))
+
+
+def column_type(cursor, table: str, column: str) -> tuple[str, int]:
+    """'halfvec(1536)' → ('halfvec', 1536)"""
+    cursor.execute(
+        "SELECT format_type(atttypid, atttypmod) FROM pg_attribute WHERE attrelid = to_regclass(%s) AND attname = %s",
+        (table, column),
+    )
+    type_name, _, dim = cursor.fetchone()[0].partition("(")
+    return type_name, int(dim.rstrip(")"))
+
+
+def partitions(cursor, table: str) -> list[str] | None:
+    """파티션 테이블이면 파티션 이름 목록, 아니면 None"""
+    cursor.execute("SELECT relkind FROM pg_class WHERE oid = to_regclass(%s)", (table,))
+    row = cursor.fetchone()
+    if row is None or row[0] != "p":
+        return None
+    cursor.execute(
+        """
+        SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = to_regclass(%s) ORDER BY c.relname
+        """,
+        (table,),
+    )
+    return [r[0] for r in cursor.fetchall()]
+
+
+def drop_vector_indexes(conn, table: str, column: str, kinds=KINDS):
+    """관리 인덱스 제거 - 파티션 테이블의 부모 인덱스는 CONCURRENTLY 불가 (파티션 인덱스도 함께 제거)"""
+    with conn.cursor() as cursor:
+        drop = sql.SQL("DROP INDEX IF EXISTS {}" if partitions(cursor, table) is not None
+                       else "DROP INDEX CONCURRENTLY IF EXISTS {}")
+        for kind in kinds:
+            cursor.execute(drop.format(sql.Identifier(index_name(table, column, kind))))
+
+
+def _build_partitioned(cursor, table: str, column: str, kind: str, parts: list[str], index_sql):
+    """
+    부모에 ON ONLY 인덱스(invalid)를 만들고 파티션별로 CONCURRENTLY 빌드 후 ATTACH
+    → 모든 파티션이 붙으면 부모 인덱스가 valid 가 됨
+    """
+    tmp_name = f"{index_name(table, column, kind)}_new"
+    cursor.execute(sql.SQL("DROP INDEX IF EXISTS {}").format(sql.Identifier(tmp_name)))
+    cursor.execute(index_sql(sql.SQL(""), tmp_name, sql.SQL("ONLY {}").format(sql.Identifier(table))))
+    for part in parts:
+        part_tmp = f"{index_name(part, column, kind)}_new"
+        cursor.execute(sql.SQL("DROP INDEX CONCURRENTLY IF EXISTS {}").format(sql.Identifier(part_tmp)))
+        cursor.execute(index_sql(sql.SQL("CONCURRENTLY"), part_tmp, sql.Identifier(part)))
+        cursor.execute(
+            sql.SQL("ALTER INDEX {} ATTACH PARTITION {}").format(sql.Identifier(tmp_name), sql.Identifier(part_tmp))
+        )
+        logger.info(f"{part} 인덱스 생성 완료")
+
+
+def create_vector_index(conn, table: str, column: str, method: str,
+                        m: int, ef_construction: int, lists: int | None,
+                        maintenance_work_mem: str | None = None, binary: bool = False):
+    """
+    코사인 거리(vector_cosine_ops / halfvec_cosine_ops) ANN 인덱스 생성.
+    binary 면 이진 양자화 식에 해밍 거리(bit_hamming_ops) 인덱스를 만듭니다.
+    파라미터가 바뀐 경우에도 반영되도록 매번 새로 빌드해 같은 종류의 기존 관리 인덱스와 교체합니다.
+    """
+    kind = f"bq_{method}" if binary else method
+    name = index_name(table, column, kind)
+    with conn.cursor() as cursor:
+        type_name, dim = column_type(cursor, table, column)
+        if binary:
+            key = sql.SQL("((binary_quantize({})::bit({})) bit_hamming_ops)").format(
+                sql.Identifier(column), sql.Literal(dim)
+            )
+        else:
+            key = sql.SQL("({} {})").format(sql.Identifier(column), sql.SQL(f"{type_name}_cosine_ops"))
+        cursor.execute(
+            sql.SQL("SELECT count(*) FROM {} WHERE {} IS NOT NULL").format(
+                sql.Identifier(table), sql.Identifier(column)
+            )
+        )
+        row_count = cursor.fetchone()[0]
+
+        if method == "hnsw":
+            with_clause = sql.SQL("WITH (m = {}, ef_construction = {})").format(
+                sql.Literal(m), sql.Literal(ef_construction)
+            )
+            desc = f"m={m}, ef_construction={ef_construction}"
+        else:
+            if row_count == 0:
+                logger.warning(f"{table}.{column} 에 데이터가 없어 IVFFlat 인덱스를 건너뜁니다.")
+                return
+            lists = lists or default_ivfflat_lists(row_count)
+            with_clause = sql.SQL("WITH (lists = {})").format(sql.Literal(lists))
+            desc = f"lists={lists}"
+
+        if maintenance_work_mem:
+            cursor.execute("SELECT set_config('maintenance_work_mem', %s, false)", (maintenance_work_mem,))
+
+        def index_sql(concurrently, index, target):
+            return sql.SQL("CREATE INDEX {} {} ON {} USING {} {} {}").format(
+                concurrently, sql.Identifier(index), target, sql.SQL(method), key, with_clause,
+            )
+
+        # 새 인덱스를 임시 이름으로 만든 뒤 교체 → 빌드 중에도 기존 인덱스로 조회 가능
+        tmp_name = f"{name}_new"
+        logger.info(f"{name} 생성 중 ({type_name}, {desc}, rows={row_count})")
+        parts = partitions(cursor, table)
+        if parts is None:
+            cursor.execute(
+                sql.SQL("DROP INDEX CONCURRENTLY IF EXISTS {}").format(sql.Identifier(tmp_name))
+            )
+            cursor.execute(index_sql(sql.SQL("CONCURRENTLY"), tmp_name, sql.Identifier(table)))
+        else:
+            if method == "ivfflat":
+                logger.warning("IVFFlat: 이후 새로 생기는 파티션은 빈 상태로 인덱스가 만들어집니다. 적재 후 다시 실행하세요.")
+            _build_partitioned(cursor, table, column, kind, parts, index_sql)
+        drop_vector_indexes(conn, table, column, [k for k in KINDS if k.startswith("bq_") == binary])
+        cursor.execute(
+            sql.SQL("ALTER INDEX {} RENAME TO {}").format(sql.Identifier(tmp_name), sql.Identifier(name))
+        )
+        for part in parts or ():
+            part_name = index_name(part, column, kind)
+            cursor.execute(
+                sql.SQL("ALTER INDEX {} RENAME TO {}").format(sql.Identifier(f"{part_name}_new"),
+                                                                sql.Identifier(part_name))
+            )
+        cursor.execute(sql.SQL("ANALYZE {}").format(sql.Identifier(table)))
+        logger.info(f"{name} 생성 완료")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="pgvector ANN 인덱스 관리")
+    parser.add_argument("--method", choices=METHODS, default=os.getenv("VECTOR_INDEX_METHOD", "hnsw"))
+    parser.add_argument("--m", type=int, default=int(os.getenv("HNSW_M", 16)))
+    parser.add_argument("--ef-construction", type=int, default=int(os.getenv("HNSW_EF_CONSTRUCTION", 64)))
+    parser.add_argument("--lists", type=int, default=int(os.getenv("IVFFLAT_LISTS", 0)) or None,
+                        help="미지정 시 행 수 기반 권장값")
+    parser.add_argument("--maintenance-work-mem", default=os.getenv("INDEX_MAINTENANCE_WORK_MEM"),
+                        help="예: 1GB (HNSW 빌드가 메모리에 들어가야 빠름)")
+    parser.add_argument("--binary", action="store_true",
+                        default=os.getenv("VECTOR_INDEX_BINARY", "").lower() in ("1", "true", "yes"),
+                        help="company_news 이진 양자화(해밍 거리) 인덱스도 생성")
+    parser.add_argument("--drop", action="store_true", help="관리 인덱스를 모두 제거")
+    return parser.parse_args()
+
+
+def main():
+    """메인 함수"""
+    args = parse_args()
+    try:
+        conn = connect_to_db()
+        if args.binary and pgvector_version(conn) < BINARY_MIN_PGVECTOR:
+            logger.error("--binary 는 pgvector 0.7 이상이 필요합니다. (docker-compose 이미지·ALTER EXTENSION vector UPDATE 확인)")
+            return
+        for table, column in VECTOR_COLUMNS:
+            if args.drop:
+                drop_vector_indexes(conn, table, column)
+                logger.info(f"{table}.{column} 관리 인덱스를 제거했습니다.")
+                continue
+            create_vector_index(
+                conn, table, column, args.method,
+                m=args.m,
+                ef_construction=args.ef_construction,
+                lists=args.lists,
+                maintenance_work_mem=args.maintenance_work_mem,
+            )
+            if args.binary and (table, column) in BINARY_COLUMNS:
+                create_vector_index(
+                    conn, table, column, args.method,
+                    m=args.m,
+                    ef_construction=args.ef_construction,
+                    lists=args.lists,
+                    maintenance_work_mem=args.maintenance_work_mem,
+                    binary=True,
+                )
+    except Exception as e:
+        logger.error(f"예상치 못한 오류가 발생했습니다: {e}")
+    finally:
+        if "conn" in locals() and conn:
+            conn.close()
+            logger.info("데이터베이스 연결이 닫혔습니다.")
+
+
+if __name__ == "__main__":
+    main()